@@ -7,9 +7,14 @@ import os
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
-from flasgger import Swagger
 from app.common.logging_config import configure_logging
 from app.common.errors import register_error_handlers
+from app.common.versioning import table_versions
+from app.common.cache import query_cache
+from app.common.compression import compression
+from app.common import apidocs, formats, instrumentation
+from app.common.metrics import metrics
+from app.common.sqlite import configure_sqlite, install_pragmas
 
 # Public symbols exposed by this module
 __all__ = ["create_app", "db", "ma"]
@@ -42,10 +47,21 @@ def create_app() -> Flask:
     # Set up application logging
     configure_logging(app)
 
-    # Initialize Flask extensions
+    # Initialize Flask extensions (the SQLite profile must precede the engine)
+    configure_sqlite(app)
     db.init_app(app)
+    with app.app_context():
+        install_pragmas(
+            db.engine, app.config["SQLITE_PRAGMAS"], app.config["SQLITE_READ_ONLY"]
+        )
     ma.init_app(app)
-    Swagger(app)
+    table_versions.init_app(app)
+    query_cache.init_app(app)
+    compression.init_app(app)
+    formats.init_app(app)
+    instrumentation.init_app(app)
+    metrics.init_app(app)
+    apidocs.init_app(app)
 
     # Register error handlers
     register_error_handlers(app)
@@ -55,6 +71,16 @@ def create_app() -> Flask:
 
     register_blueprints(app)
 
+    # Register CLI commands
+    from app.commands import register_commands
+
+    register_commands(app)
+
+    # Preload the in-memory catalog index when enabled
+    from app.services.catalog import catalog_index
+
+    catalog_index.init_app(app)
+
     # Log successful startup
     app.logger.info("Application created and configured using: %s", config_path)
 
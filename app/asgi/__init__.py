@@ -0,0 +1,294 @@
+# app/asgi/__init__.py
+"""
+ASGI variant of the artists and albums read endpoints.
+
+Handlers are coroutines running on SQLAlchemy's asyncio extension (``aiosqlite``
+for SQLite), so a waiting database call does not hold a thread and one process can
+keep thousands of slow clients connected. Configuration, models, schemas and JSON
+encoding are shared with the Flask app; responses are byte-identical to it for the
+supported endpoints and query arguments.
+
+Serve it with any ASGI server, for example::
+
+    uvicorn --factory app.asgi:create_asgi_app --workers 4
+
+The optional dependencies are listed in ``requirements-async.txt``.
+"""
+
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from flask import Flask
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import HTTPException, MethodNotAllowed, NotFound
+
+from app import create_app, db
+from app.asgi import services
+from app.common.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    get_page_args,
+)
+from app.common.sqlite import install_pragmas
+from app.schemas.albums_schema import AlbumSchema
+from app.schemas.albums_summary_schema import AlbumSummarySchema
+from app.schemas.artists_schema import ArtistWithAlbumsSchema
+from app.schemas.serializers import compile_serializer, serializer_for
+from app.schemas.track_schema import TrackSchema
+
+__all__ = ["AsyncChinookApp", "create_asgi_app"]
+
+# Handler signature: (session, query arguments, **path parameters) -> payload
+Handler = Callable[..., Awaitable[Any]]
+
+dump_artists = serializer_for(ArtistWithAlbumsSchema, ("ArtistId", "Name"))
+dump_albums = serializer_for(AlbumSchema, ("AlbumId", "Title"))
+dump_albums_with_tracks = serializer_for(AlbumSchema, ("AlbumId", "Title", "tracks"))
+dump_tracks = compile_serializer(TrackSchema(many=True))
+dump_album_summaries = compile_serializer(AlbumSummarySchema(many=True))
+
+
+async def list_artists(session, args: MultiDict) -> Dict[str, Any]:
+    """
+    ``GET /artists`` with offset or keyset pagination.
+    """
+    if "after" in args or "limit" in args:
+        limit = _get_limit(args)
+        artists, next_key = await services.get_artists_after(
+            session, decode_cursor(args.get("after")), limit
+        )
+        return {
+            "limit": limit,
+            "next_cursor": encode_cursor(next_key),
+            "artists": dump_artists(artists),
+        }
+
+    page, per_page = get_page_args(args)
+    artists, total = await services.get_all_artists(session, page, per_page)
+    return {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "artists": dump_artists(artists),
+    }
+
+
+async def list_artist_albums(session, args: MultiDict, artist_id: int) -> list:
+    """
+    ``GET /artists/<artist_id>/albums``.
+    """
+    return dump_albums(await services.get_albums_by_artist(session, artist_id))
+
+
+async def list_albums(session, args: MultiDict) -> Dict[str, Any]:
+    """
+    ``GET /albums`` with nested tracks and offset or keyset pagination.
+    """
+    if "after" in args or "limit" in args:
+        limit = _get_limit(args)
+        albums, next_key = await services.get_albums_with_tracks_after(
+            session, decode_cursor(args.get("after")), limit
+        )
+        return {
+            "limit": limit,
+            "next_cursor": encode_cursor(next_key),
+            "albums": dump_albums_with_tracks(albums),
+        }
+
+    page, per_page = get_page_args(args)
+    albums, total = await services.get_all_albums_with_tracks(session, page, per_page)
+    return {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "albums": dump_albums_with_tracks(albums),
+    }
+
+
+async def list_album_tracks(session, args: MultiDict, album_id: int) -> dict:
+    """
+    ``GET /albums/<album_id>/tracks``.
+    """
+    tracks = await services.get_tracks_by_album(session, album_id)
+    return {"album_id": album_id, "tracks": dump_tracks(tracks)}
+
+
+async def list_album_summaries(session, args: MultiDict) -> list:
+    """
+    ``GET /albums/summary``.
+    """
+    return dump_album_summaries(await services.get_album_summaries(session))
+
+
+# (path pattern, handler); integer path parameters are converted like <int:...>
+ROUTES: List[Tuple["re.Pattern[str]", Handler]] = [
+    (re.compile(r"^/artists$"), list_artists),
+    (re.compile(r"^/artists/(?P<artist_id>\d+)/albums$"), list_artist_albums),
+    (re.compile(r"^/albums$"), list_albums),
+    (re.compile(r"^/albums/summary$"), list_album_summaries),
+    (re.compile(r"^/albums/(?P<album_id>\d+)/tracks$"), list_album_tracks),
+]
+
+
+class AsyncChinookApp:
+    """
+    Minimal ASGI application dispatching to the async handlers.
+    """
+
+    def __init__(self, app: Flask, engine: AsyncEngine) -> None:
+        """
+        Args:
+            app (Flask): Flask app providing the configuration, logger and JSON
+                provider.
+            engine (AsyncEngine): Engine the request sessions are bound to.
+        """
+        self.app = app
+        self.engine = engine
+        self.sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        status, payload = await self._dispatch(scope)
+        response = self.app.json.response(payload)
+        body = response.get_data()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", response.content_type.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if scope["method"] == "HEAD" else body,
+            }
+        )
+
+    async def _dispatch(self, scope: dict) -> Tuple[int, Any]:
+        """
+        Route a request and turn exceptions into the Flask app's error payloads.
+        """
+        try:
+            handler, params = _match(scope["path"])
+            if scope["method"] not in ("GET", "HEAD"):
+                raise MethodNotAllowed(valid_methods=["GET", "HEAD"])
+
+            args = MultiDict(
+                parse_qsl(scope["query_string"].decode(), keep_blank_values=True)
+            )
+            async with self.sessions() as session:
+                return 200, await handler(session, args, **params)
+        except NotFound as error:
+            return 404, {"error": "Not Found", "message": str(error)}
+        except HTTPException as error:
+            return error.code, {"error": error.name, "message": error.description}
+        except Exception as error:
+            self.app.logger.exception("Unhandled exception occurred: %s", error)
+            return 500, {
+                "error": "Internal Server Error",
+                "message": "An unexpected error occurred.",
+            }
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        """
+        Dispose of the engine's connections when the server shuts down.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_app(app: Optional[Flask] = None) -> AsyncChinookApp:
+    """
+    ASGI application factory.
+
+    Reuses the Flask app's configuration: the database URL (including the
+    read-only mode) is switched to the ``aiosqlite`` driver unless
+    ``ASYNC_SQLALCHEMY_DATABASE_URI`` is set, and ``SQLITE_PRAGMAS`` are applied to
+    every new connection.
+
+    Args:
+        app (Optional[Flask]): Flask app to take the configuration from; one is
+            created with :func:`app.create_app` when omitted.
+
+    Returns:
+        AsyncChinookApp: The ASGI application.
+    """
+    app = app or create_app()
+
+    url = app.config.get("ASYNC_SQLALCHEMY_DATABASE_URI")
+    if url is None:
+        with app.app_context():
+            url = db.engine.url
+        if url.get_backend_name() == "sqlite":
+            url = url.set(drivername="sqlite+aiosqlite")
+    url = make_url(url)
+
+    if url.drivername == "sqlite+aiosqlite":
+        try:
+            import aiosqlite  # noqa: F401
+        except ImportError as error:
+            raise RuntimeError(
+                "The ASGI app needs aiosqlite: pip install -r requirements-async.txt"
+            ) from error
+
+    engine = create_async_engine(url, **_engine_options(app, url))
+    install_pragmas(
+        engine.sync_engine,
+        app.config.get("SQLITE_PRAGMAS", {}),
+        app.config.get("SQLITE_READ_ONLY", False),
+    )
+    return AsyncChinookApp(app, engine)
+
+
+def _engine_options(app: Flask, url) -> Dict[str, Any]:
+    """
+    Return the pool settings of the sync engine that apply to the async one.
+    """
+    options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        key: options[key] for key in ("pool_size", "max_overflow") if key in options
+    }
+
+
+def _match(path: str) -> Tuple[Handler, Dict[str, int]]:
+    """
+    Find the handler of a path and convert its parameters.
+
+    Raises:
+        NotFound: If no route matches.
+    """
+    for pattern, handler in ROUTES:
+        match = pattern.match(path)
+        if match:
+            return handler, {k: int(v) for k, v in match.groupdict().items()}
+    raise NotFound()
+
+
+def _get_limit(args: MultiDict) -> int:
+    """
+    Read the ``limit`` query argument, clamped to ``[1, MAX_PAGE_SIZE]``.
+    """
+    limit = args.get("limit", default=DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE))
@@ -0,0 +1,163 @@
+# app/asgi/services.py
+"""
+Async counterparts of the read services, built on SQLAlchemy's asyncio extension.
+
+The statements mirror :mod:`app.services.services` and return the same row types,
+so the compiled serializers and the JSON output are shared with the WSGI app. Each
+function takes the request's :class:`AsyncSession`; awaiting the database frees the
+event loop to serve other clients.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from werkzeug.exceptions import NotFound
+
+from app.common.pagination import keyset_page, page_bounds
+from app.models.models import Artist, Album, Track
+from app.services.rows import AlbumRow, ArtistRow, TrackRow
+
+
+async def get_all_artists(
+    session: AsyncSession, page: int, per_page: int
+) -> Tuple[List[ArtistRow], int]:
+    """
+    Retrieve a page of artists and the total number of artists.
+    """
+    offset, limit = page_bounds(page, per_page)
+    rows = await session.execute(
+        select(Artist.ArtistId, Artist.Name)
+        .order_by(Artist.ArtistId)
+        .offset(offset)
+        .limit(limit)
+    )
+    total = await session.scalar(select(func.count()).select_from(Artist))
+    return [ArtistRow(*row) for row in rows], total
+
+
+async def get_artists_after(
+    session: AsyncSession, after: Optional[int], limit: int
+) -> Tuple[List[ArtistRow], Optional[int]]:
+    """
+    Retrieve a page of artists using keyset pagination on ArtistId.
+    """
+    query = select(Artist.ArtistId, Artist.Name).order_by(Artist.ArtistId)
+    if after is not None:
+        query = query.where(Artist.ArtistId > after)
+
+    rows = await session.execute(query.limit(limit + 1))
+    return keyset_page([ArtistRow(*row) for row in rows], limit, "ArtistId")
+
+
+async def get_all_albums_with_tracks(
+    session: AsyncSession, page: int, per_page: int
+) -> Tuple[List[AlbumRow], int]:
+    """
+    Retrieve a page of albums with their tracks and the total number of albums.
+    """
+    offset, limit = page_bounds(page, per_page)
+    query = (
+        select(Album.AlbumId, Album.Title)
+        .order_by(Album.AlbumId)
+        .offset(offset)
+        .limit(limit)
+    )
+    albums = await _load_albums(session, query)
+    total = await session.scalar(select(func.count()).select_from(Album))
+    return albums, total
+
+
+async def get_albums_with_tracks_after(
+    session: AsyncSession, after: Optional[int], limit: int
+) -> Tuple[List[AlbumRow], Optional[int]]:
+    """
+    Retrieve a page of albums with their tracks using keyset pagination on AlbumId.
+    """
+    query = select(Album.AlbumId, Album.Title).order_by(Album.AlbumId)
+    if after is not None:
+        query = query.where(Album.AlbumId > after)
+
+    albums = await _load_albums(session, query.limit(limit + 1))
+    return keyset_page(albums, limit, "AlbumId")
+
+
+async def get_albums_by_artist(session: AsyncSession, artist_id: int) -> List[AlbumRow]:
+    """
+    Retrieve all albums for a given artist.
+
+    Raises:
+        NotFound: If the artist does not exist.
+    """
+    rows = (
+        await session.execute(
+            select(Album.AlbumId, Album.Title)
+            .select_from(Artist)
+            .outerjoin(Album, Album.ArtistId == Artist.ArtistId)
+            .where(Artist.ArtistId == artist_id)
+            .order_by(Album.AlbumId)
+        )
+    ).all()
+    if not rows:
+        raise NotFound(f"Artist with ID {artist_id} not found.")
+
+    return [AlbumRow(*row) for row in rows if row[0] is not None]
+
+
+async def get_tracks_by_album(session: AsyncSession, album_id: int) -> List[TrackRow]:
+    """
+    Retrieve all tracks for a given album.
+
+    Raises:
+        NotFound: If the album does not exist.
+    """
+    rows = (
+        await session.execute(
+            select(Track.TrackId, Track.Name)
+            .select_from(Album)
+            .outerjoin(Track, Track.AlbumId == Album.AlbumId)
+            .where(Album.AlbumId == album_id)
+            .order_by(Track.TrackId)
+        )
+    ).all()
+    if not rows:
+        raise NotFound(f"Album with ID {album_id} not found.")
+
+    return [TrackRow(*row) for row in rows if row[0] is not None]
+
+
+async def get_album_summaries(session: AsyncSession) -> list:
+    """
+    Retrieve every album with its artist name and number of tracks.
+    """
+    rows = await session.execute(
+        select(
+            Album.AlbumId,
+            Album.Title.label("AlbumTitle"),
+            Artist.Name.label("ArtistName"),
+            func.count(Track.TrackId).label("TrackCount"),
+        )
+        .join(Artist, Album.ArtistId == Artist.ArtistId)
+        .join(Track, Track.AlbumId == Album.AlbumId)
+        .group_by(Album.AlbumId, Album.Title, Artist.Name)
+        .order_by(Album.AlbumId)
+    )
+    return rows.all()
+
+
+async def _load_albums(session: AsyncSession, query: Select) -> List[AlbumRow]:
+    """
+    Run an album query and attach the tracks fetched with one ``IN`` query.
+    """
+    albums = (await session.execute(query)).all()
+    tracks: Dict[int, List[TrackRow]] = {album_id: [] for album_id, _ in albums}
+    if tracks:
+        rows = await session.execute(
+            select(Track.AlbumId, Track.TrackId, Track.Name)
+            .where(Track.AlbumId.in_(list(tracks)))
+            .order_by(Track.AlbumId, Track.TrackId)
+        )
+        for album_id, track_id, name in rows:
+            tracks[album_id].append(TrackRow(track_id, name))
+
+    return [AlbumRow(album_id, title, tracks[album_id]) for album_id, title in albums]
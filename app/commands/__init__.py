@@ -0,0 +1,27 @@
+# app/commands/__init__.py
+"""
+Registers the ``flask`` CLI command groups of the application.
+"""
+
+from flask import Flask
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Register all CLI command groups on the given application instance.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    # Import command groups locally to avoid circular dependencies
+    from app.commands.analytics import analytics_cli
+    from app.commands.apidocs import apidocs_cli
+    from app.commands.search import search_cli
+    from app.commands.summaries import summaries_cli
+    from app.commands.versions import versions_cli
+
+    app.cli.add_command(summaries_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(analytics_cli)
+    app.cli.add_command(apidocs_cli)
+    app.cli.add_command(versions_cli)
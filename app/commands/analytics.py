@@ -0,0 +1,20 @@
+# app/commands/analytics.py
+"""
+CLI commands for the precomputed sales rollups.
+"""
+
+import click
+from flask.cli import AppGroup
+
+from app.services.analytics import rebuild_sales_rollups
+
+analytics_cli = AppGroup("analytics", help="Manage the precomputed sales rollups.")
+
+
+@analytics_cli.command("rebuild")
+def rebuild() -> None:
+    """
+    Rebuild the sales rollup table and its triggers from the invoice lines.
+    """
+    rows = rebuild_sales_rollups()
+    click.echo(f"Rebuilt {rows} sales rollups.")
@@ -0,0 +1,21 @@
+# app/commands/search.py
+"""
+CLI commands for the full-text search index.
+"""
+
+import click
+from flask.cli import AppGroup
+
+from app.services.search import rebuild_search_index
+
+search_cli = AppGroup("search", help="Manage the full-text search index.")
+
+
+@search_cli.command("rebuild")
+def rebuild() -> None:
+    """
+    Build the search index and its triggers, reindexing every artist, album and
+    track.
+    """
+    rows = rebuild_search_index()
+    click.echo(f"Indexed {rows} rows.")
@@ -0,0 +1,20 @@
+# app/commands/summaries.py
+"""
+CLI commands for the materialized album summary table.
+"""
+
+import click
+from flask.cli import AppGroup
+
+from app.services.summaries import rebuild_album_summaries
+
+summaries_cli = AppGroup("summaries", help="Manage the materialized album summaries.")
+
+
+@summaries_cli.command("rebuild")
+def rebuild() -> None:
+    """
+    Rebuild the album summary table and its triggers from scratch.
+    """
+    rows = rebuild_album_summaries()
+    click.echo(f"Rebuilt {rows} album summaries.")
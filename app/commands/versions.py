@@ -0,0 +1,20 @@
+# app/commands/versions.py
+"""
+CLI commands for the data version table shared by all server processes.
+"""
+
+import click
+from flask.cli import AppGroup
+
+from app.services.versions import install_data_versions
+
+versions_cli = AppGroup("versions", help="Manage the shared data versions.")
+
+
+@versions_cli.command("install")
+def install() -> None:
+    """
+    Create the data version table and the triggers that keep it current.
+    """
+    tables = install_data_versions()
+    click.echo(f"Tracking versions of {tables} tables.")
@@ -0,0 +1,150 @@
+# app/common/apidocs.py
+"""
+Swagger UI and OpenAPI spec served without loading flasgger at startup.
+
+Importing flasgger pulls in jsonschema, PyYAML and mistune, and the spec is built
+by parsing the YAML of every route docstring. Only the routes are registered when
+the app is created, under the blueprint and URLs flasgger uses by default
+(``/apidocs/``, ``/apispec_1.json``, ``/flasgger_static/...``); flasgger is
+imported and configured on the first request to one of them.
+
+With ``SWAGGER_SPEC_FILE`` set, ``/apispec_1.json`` serves the spec written to that
+file by ``flask apidocs generate`` instead, so the docstrings are never parsed at
+run time.
+"""
+
+import importlib.util
+import os
+import threading
+
+from flask import Blueprint, Flask, Response, current_app, jsonify, redirect, url_for
+
+# Routes and endpoint names of flasgger's default configuration
+DOCS_ROUTE = "/apidocs/"
+SPEC_ENDPOINT = "apispec_1"
+SPEC_ROUTE = f"/{SPEC_ENDPOINT}.json"
+STATIC_URL_PATH = "/flasgger_static"
+
+# Key of the per-app state in app.extensions
+_EXTENSION = "apidocs"
+
+_lock = threading.Lock()
+
+
+def init_app(app: Flask) -> None:
+    """
+    Register the documentation routes without importing flasgger.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if not app.config.get("SWAGGER_ENABLED", True):
+        return
+
+    package = importlib.util.find_spec("flasgger")
+    if package is None:
+        app.logger.warning("flasgger is not installed; /apidocs is disabled.")
+        return
+
+    spec_file = app.config.get("SWAGGER_SPEC_FILE")
+    if spec_file and not os.path.exists(spec_file):
+        app.logger.warning(
+            "SWAGGER_SPEC_FILE %s does not exist; the spec will be built on first "
+            "request. Run 'flask apidocs generate' to create it.",
+            spec_file,
+        )
+
+    uiversion = app.config.get("SWAGGER", {}).get("uiversion", 3)
+    ui = os.path.join(package.submodule_search_locations[0], f"ui{uiversion}")
+    blueprint = Blueprint(
+        "flasgger",
+        __name__,
+        template_folder=os.path.join(ui, "templates"),
+        static_folder=os.path.join(ui, "static"),
+        static_url_path=STATIC_URL_PATH,
+    )
+    blueprint.add_url_rule(DOCS_ROUTE, "apidocs", _apidocs)
+    blueprint.add_url_rule("/apidocs/index.html", "index", _index)
+    blueprint.add_url_rule("/oauth2-redirect.html", "oauth_redirect", _oauth_redirect)
+    blueprint.add_url_rule(SPEC_ROUTE, SPEC_ENDPOINT, _apispec)
+    app.register_blueprint(blueprint)
+    app.extensions[_EXTENSION] = {}
+
+
+def build_spec() -> dict:
+    """
+    Build the OpenAPI spec of the current app from its route docstrings.
+
+    Returns:
+        dict: The spec served at ``/apispec_1.json``.
+    """
+    return _swagger().get_apispecs(SPEC_ENDPOINT)
+
+
+def _swagger():
+    """
+    Return the flasgger ``Swagger`` object of the current app, creating it once.
+
+    It is configured like ``Swagger(app)`` but not registered, as the routes are.
+    """
+    state = current_app.extensions[_EXTENSION]
+    with _lock:
+        if "swagger" not in state:
+            from flasgger import Swagger
+
+            swagger = Swagger()
+            swagger.app = current_app._get_current_object()
+            swagger.load_config(current_app)
+            state["swagger"] = swagger
+    return state["swagger"]
+
+
+def _view(name: str, factory):
+    """
+    Return a flasgger view function of the current app, creating it once.
+    """
+    state = current_app.extensions[_EXTENSION]
+    with _lock:
+        if name not in state:
+            state[name] = factory()
+    return state[name]
+
+
+def _apidocs() -> Response:
+    """
+    Render the Swagger UI.
+    """
+    from flasgger.base import APIDocsView
+
+    config = _swagger().config
+    view = _view(
+        "apidocs", lambda: APIDocsView.as_view("apidocs", view_args={"config": config})
+    )
+    return view()
+
+
+def _index() -> Response:
+    """
+    Redirect the legacy ``/apidocs/index.html`` URL to the Swagger UI.
+    """
+    return redirect(url_for("flasgger.apidocs"))
+
+
+def _oauth_redirect() -> Response:
+    """
+    Serve the OAuth2 redirect page of the Swagger UI.
+    """
+    from flasgger.base import OAuthRedirect
+
+    return _view("oauth_redirect", lambda: OAuthRedirect.as_view("oauth_redirect"))()
+
+
+def _apispec() -> Response:
+    """
+    Serve the pregenerated spec file when there is one, else the built spec.
+    """
+    spec_file = current_app.config.get("SWAGGER_SPEC_FILE")
+    if spec_file and os.path.exists(spec_file):
+        with open(spec_file, "rb") as handle:
+            return Response(handle.read(), mimetype="application/json")
+    return jsonify(build_spec())
@@ -0,0 +1,38 @@
+# app/common/batch.py
+"""
+Parsing of the ``ids`` argument of batch lookup endpoints.
+"""
+
+from typing import Tuple
+
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+# Upper bound for the number of ids resolved by one batch request
+MAX_BATCH_IDS: int = 100
+
+
+def get_ids() -> Tuple[int, ...]:
+    """
+    Read the comma-separated ``ids`` query argument.
+
+    Returns:
+        Tuple[int, ...]: The distinct ids, in the order they were requested.
+
+    Raises:
+        BadRequest: If the argument is missing, empty, holds a value that is not an
+            integer, or names more than ``MAX_BATCH_IDS`` ids.
+    """
+    raw = request.args.get("ids", "")
+    values = [value.strip() for value in raw.split(",") if value.strip()]
+    if not values:
+        raise BadRequest("ids must list at least one id, e.g. ids=1,2,3.")
+
+    try:
+        ids = tuple(dict.fromkeys(int(value) for value in values))
+    except ValueError:
+        raise BadRequest("ids must be a comma-separated list of integers.")
+
+    if len(ids) > MAX_BATCH_IDS:
+        raise BadRequest(f"At most {MAX_BATCH_IDS} ids can be requested at once.")
+    return ids
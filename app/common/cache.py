@@ -0,0 +1,192 @@
+# app/common/cache.py
+"""
+Bounded LRU + TTL memoization for service-layer queries.
+
+Each cached result records the tables it was read from. Committed writes to any of
+those tables (reported by :data:`app.common.versioning.table_versions`) drop the
+affected entries only; writes from other processes clear the whole cache.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, NamedTuple, Tuple
+
+from flask import Flask
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import InstanceState
+
+from app.common.versioning import table_names, table_versions
+
+
+class _Entry(NamedTuple):
+    """
+    A cached value with its dependencies and expiry time.
+    """
+
+    value: Any
+    tables: FrozenSet[str]
+    expires: float
+
+
+class QueryCache:
+    """
+    Thread-safe memoization cache keyed on function and arguments.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0) -> None:
+        self.enabled = True
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._reset()
+        table_versions.add_listener(self._on_change)
+
+        # Each forked worker starts with an empty cache and counters of its own
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        """
+        Start over with no entries, zeroed counters and a new lock.
+
+        A lock held by another thread at fork time would never be released in
+        the child, so the inherited one is replaced rather than reused.
+        """
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "invalidations"), 0
+        )
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Configure the cache from the application settings.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+        self.enabled = app.config.get("QUERY_CACHE_ENABLED", True)
+        self.maxsize = app.config.get("QUERY_CACHE_MAXSIZE", self.maxsize)
+        self.ttl = app.config.get("QUERY_CACHE_TTL", self.ttl)
+
+    def memoize(self, *models) -> Callable:
+        """
+        Decorate a service function so its results are cached.
+
+        Args:
+            *models: SQLAlchemy models (or table names) the function reads. A
+                committed write to any of them invalidates the cached results.
+
+        Returns:
+            Callable: The decorator.
+        """
+        ordered_tables = table_names(*models)
+        tables = frozenset(ordered_tables)
+
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+                token = table_versions.current(*ordered_tables)
+                found, value = self._get(key)
+                if found:
+                    return value
+
+                value = func(*args, **kwargs)
+                _detach(value)
+
+                # Skip storing results that raced with a write to their tables
+                if table_versions.token(*ordered_tables) == token:
+                    self._set(key, value, tables)
+                return value
+
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss/eviction counters along with the current size.
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self) -> None:
+        """
+        Drop every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key, counting hits, misses and TTL expirations.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            if entry.expires <= time.monotonic():
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, entry.value
+
+    def _set(self, key: Hashable, value: Any, tables: FrozenSet[str]) -> None:
+        """
+        Store a value, evicting the least recently used entries beyond maxsize.
+        """
+        with self._lock:
+            self._entries[key] = _Entry(value, tables, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _on_change(self, tables: FrozenSet[str], external: bool) -> None:
+        """
+        Drop the entries that depend on changed tables.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if external or not entry.tables.isdisjoint(tables)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += len(stale)
+
+
+def _detach(value: Any) -> None:
+    """
+    Expunge ORM instances, and their loaded relationships, from their session.
+
+    Cached instances outlive the request that loaded them; detaching them keeps a
+    later commit in that session from expiring their attributes.
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            _detach(item)
+        return
+
+    state = sa_inspect(value, raiseerr=False)
+    if not isinstance(state, InstanceState) or state.session is None:
+        return
+
+    state.session.expunge(value)
+    for key in state.mapper.relationships.keys():
+        if key in state.dict:
+            _detach(state.dict[key])
+
+
+# Shared cache used by the service layer
+query_cache = QueryCache()
@@ -0,0 +1,202 @@
+# app/common/compression.py
+"""
+Negotiated response compression with a cache of compressed responses.
+
+Bodies of at least ``COMPRESSION_MIN_SIZE`` bytes are compressed with the best
+encoding the client accepts among brotli (``br``), zstd and gzip, at the levels in
+``COMPRESSION_LEVELS``. Brotli and zstd are only offered when the ``brotli`` and
+``zstandard`` packages are installed (see ``requirements-formats.txt``).
+
+Compression is applied by :func:`app.common.http_cache.conditional`, whose ETags
+identify a representation down to its encoding. Compressed responses are kept in a
+per-process LRU cache keyed by ETag and bounded by ``COMPRESSION_CACHE_SIZE`` bytes,
+so a repeated request is answered without running the view or compressing again.
+"""
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Response headers stored with a compressed body; the rest are set per request
+_STORED_HEADERS = ("Content-Type", "Content-Encoding", "Content-Length")
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # A fixed mtime keeps the output identical for identical bodies
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+# Available encodings, most preferred first when the client accepts several equally
+CODECS: Dict[str, Callable[[bytes, int], bytes]] = {}
+if brotli is not None:
+    CODECS["br"] = _brotli
+if zstandard is not None:
+    CODECS["zstd"] = _zstd
+CODECS["gzip"] = _gzip
+
+
+class _Entry(NamedTuple):
+    """
+    A compressed body with the headers that describe it.
+    """
+
+    body: bytes
+    headers: List[Tuple[str, str]]
+
+
+class ResponseCompression:
+    """
+    Thread-safe compressor and LRU cache of compressed responses.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.enabled = True
+        self.min_size = 1024
+        self.levels: Dict[str, int] = {"br": 4, "zstd": 3, "gzip": 6}
+        self.mimetypes: Tuple[str, ...] = ("application/json", "text/csv")
+        self.max_bytes = max_bytes
+        self._reset()
+
+        # Forked workers must not report the master's entries and counters
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        """
+        Empty the cache and zero its counters, with a lock of its own (the
+        inherited lock may have been taken by a thread the child does not have).
+        """
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size = 0
+        self._stats: Dict[str, int] = dict.fromkeys(("hits", "misses", "evictions"), 0)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Configure compression from the application settings.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+        self.enabled = app.config.get("COMPRESSION_ENABLED", True)
+        self.min_size = app.config.get("COMPRESSION_MIN_SIZE", self.min_size)
+        self.levels = dict(self.levels, **app.config.get("COMPRESSION_LEVELS", {}))
+        self.mimetypes = tuple(app.config.get("COMPRESSION_MIMETYPES", self.mimetypes))
+        self.max_bytes = app.config.get("COMPRESSION_CACHE_SIZE", self.max_bytes)
+
+    def negotiate(self) -> Optional[str]:
+        """
+        Return the encoding to use for the current request, if any.
+        """
+        if not self.enabled:
+            return None
+        return request.accept_encodings.best_match(CODECS)
+
+    def cached(self, etag: str) -> Optional[Response]:
+        """
+        Return a new response from the cached compressed body of ``etag``, if any.
+        """
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(etag)
+            self._stats["hits"] += 1
+        return Response(entry.body, headers=entry.headers)
+
+    def compress(
+        self, response: Response, encoding: Optional[str], etag: Optional[str] = None
+    ) -> Response:
+        """
+        Compress a response in place when it is large enough and compressible.
+
+        Args:
+            response (Response): A complete (not streamed) 200 response.
+            encoding (Optional[str]): Result of :meth:`negotiate`.
+            etag (Optional[str]): Cache the compressed response under this ETag.
+
+        Returns:
+            Response: The same response object.
+        """
+        if (
+            encoding is None
+            or response.is_streamed
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in self.mimetypes
+        ):
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        response.set_data(CODECS[encoding](data, self.levels[encoding]))
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            self._store(etag, response)
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss/eviction counters along with the cached size in bytes.
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._size)
+
+    def clear(self) -> None:
+        """
+        Drop every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _store(self, etag: str, response: Response) -> None:
+        """
+        Cache a compressed response, evicting the least recently used beyond
+        ``max_bytes``.
+        """
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name in _STORED_HEADERS or name.startswith("X-")
+        ]
+        entry = _Entry(response.get_data(), headers)
+        if len(entry.body) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(etag, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[etag] = entry
+            self._size += len(entry.body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+                self._stats["evictions"] += 1
+
+
+compression = ResponseCompression()
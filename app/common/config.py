@@ -18,7 +18,99 @@ class Config:
     # Disable Flask-SQLAlchemy event system to reduce overhead
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
 
-    # Enable or disable Swagger UI
+    # Pragmas run on every new SQLite connection (see app/common/sqlite.py)
+    SQLITE_PRAGMAS: dict = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,  # 256 MiB
+        "cache_size": -65536,  # 64 MiB (negative values are KiB)
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # milliseconds
+    }
+
+    # Open the database file as mode=ro&immutable=1 (no locking, no writes)
+    SQLITE_READ_ONLY: bool = os.getenv("SQLITE_READ_ONLY", "0") == "1"
+
+    # Connection pool for file databases; size it to the number of server threads
+    SQLITE_POOL_SIZE: int = int(os.getenv("SQLITE_POOL_SIZE", "10"))
+    SQLITE_MAX_OVERFLOW: int = int(os.getenv("SQLITE_MAX_OVERFLOW", "10"))
+
+    # Seconds between PRAGMA data_version probes for writes from other processes
+    DATA_VERSION_CHECK_INTERVAL: float = float(
+        os.getenv("DATA_VERSION_CHECK_INTERVAL", "1.0")
+    )
+
+    # Service-layer query result cache (bounded LRU with TTL in seconds)
+    QUERY_CACHE_ENABLED: bool = os.getenv("QUERY_CACHE_ENABLED", "1") == "1"
+    QUERY_CACHE_MAXSIZE: int = int(os.getenv("QUERY_CACHE_MAXSIZE", "1024"))
+    QUERY_CACHE_TTL: float = float(os.getenv("QUERY_CACHE_TTL", "300"))
+
+    # Cache-Control sent with conditional GET responses, per blueprint name
+    CACHE_CONTROL: dict = {}
+    CACHE_CONTROL_DEFAULT: str = "no-cache"
+
+    # Compression of conditional GET bodies of at least COMPRESSION_MIN_SIZE bytes,
+    # per encoding level, and the per-process cache of compressed responses (bytes)
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "1") == "1"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_LEVELS: dict = {
+        "br": int(os.getenv("COMPRESSION_BR_LEVEL", "4")),
+        "zstd": int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+        "gzip": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+    }
+    COMPRESSION_MIMETYPES: tuple = ("application/json", "text/csv")
+    COMPRESSION_CACHE_SIZE: int = int(
+        os.getenv("COMPRESSION_CACHE_SIZE", str(32 * 1024 * 1024))
+    )
+
+    # Loader for nested tracks: "selectin" (second IN query) or "joined" (outer join)
+    EAGER_LOADING_STRATEGY: str = os.getenv("EAGER_LOADING_STRATEGY", "selectin")
+
+    # Serve artist/album/track reads from an in-process index (app/services/catalog.py)
+    CATALOG_INDEX_ENABLED: bool = os.getenv("CATALOG_INDEX_ENABLED", "0") == "1"
+
+    # Logging: "text" or "json" lines, written by a background thread when queued
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    LOG_QUEUE_ENABLED: bool = os.getenv("LOG_QUEUE_ENABLED", "1") == "1"
+
+    # Share of requests whose info/debug records are kept (warnings always are),
+    # overridden per route rule, e.g. {"/albums/summary": 0.01}
+    LOG_SAMPLE_RATE: float = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+    LOG_SAMPLE_RATES: dict = {}
+
+    # Header carrying the request id in and out (generated when missing)
+    REQUEST_ID_HEADER: str = "X-Request-ID"
+
+    # Per-request query count and DB/serialization time in a Server-Timing header
+    SERVER_TIMING_ENABLED: bool = os.getenv("SERVER_TIMING_ENABLED", "1") == "1"
+
+    # Log a probable N+1 when one request runs the same statement this many times
+    SQL_REPEAT_WARNING_THRESHOLD: int = int(
+        os.getenv("SQL_REPEAT_WARNING_THRESHOLD", "10")
+    )
+
+    # Prometheus /metrics endpoint; METRICS_DIR is shared by the gunicorn workers
+    # (a temporary directory per server start when unset)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "1") == "1"
+    METRICS_DIR: str = os.getenv("METRICS_DIR", "")
+
+    # Rows fetched per round trip when streaming large collections
+    STREAM_BATCH_SIZE: int = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+
+    # Production server (gunicorn -c python:app.gunicorn_conf): bind address, worker
+    # processes and threads per worker
+    SERVER_HOST: str = os.getenv("HOST", "127.0.0.1")
+    SERVER_PORT: int = int(os.getenv("PORT", "5000"))
+    SERVER_WORKERS: int = int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1)))
+    SERVER_THREADS: int = int(os.getenv("SERVER_THREADS", "8"))
+
+    # Swagger UI at /apidocs/ (flasgger is only imported on first access), and an
+    # optional spec file written by 'flask apidocs generate' to serve instead of
+    # parsing the route docstrings
+    SWAGGER_ENABLED: bool = os.getenv("SWAGGER_ENABLED", "1") == "1"
+    SWAGGER_SPEC_FILE: str = os.getenv("SWAGGER_SPEC_FILE", "")
+
+    # Swagger UI and spec settings passed to flasgger
     SWAGGER: dict = {
         "title": "Chinook API",
         "uiversion": 3,
@@ -56,3 +148,15 @@ class ProductionConfig(Config):
 
     DEBUG: bool = False
     TESTING: bool = False
+
+    # Serve the shipped catalog read-only unless explicitly disabled
+    SQLITE_READ_ONLY: bool = os.getenv("SQLITE_READ_ONLY", "1") == "1"
+
+    # Answer catalog reads from memory unless explicitly disabled
+    CATALOG_INDEX_ENABLED: bool = os.getenv("CATALOG_INDEX_ENABLED", "1") == "1"
+
+    # Let clients and the CDN reuse catalog responses for a minute
+    CACHE_CONTROL: dict = {
+        "artists": "public, max-age=60",
+        "albums": "public, max-age=60",
+    }
@@ -0,0 +1,79 @@
+# app/common/fieldsets.py
+"""
+Parsing of sparse fieldset (``?fields=``) and inclusion (``?include=``) arguments.
+"""
+
+from typing import Tuple
+
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+
+def get_fields(allowed: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Read the comma-separated ``fields`` query argument.
+
+    Args:
+        allowed (Tuple[str, ...]): Selectable fields, in serialization order.
+
+    Returns:
+        Tuple[str, ...]: The requested fields in canonical order, or every allowed
+        field when the argument is absent.
+
+    Raises:
+        BadRequest: If a field is unknown or none is requested.
+    """
+    raw = request.args.get("fields")
+    if raw is None:
+        return allowed
+
+    requested = _split(raw)
+    _check(requested, allowed, "field")
+    if not requested:
+        raise BadRequest(f"fields must name at least one of: {', '.join(allowed)}.")
+    return tuple(name for name in allowed if name in requested)
+
+
+def get_include(
+    allowed: Tuple[str, ...], default: Tuple[str, ...] = ()
+) -> Tuple[str, ...]:
+    """
+    Read the comma-separated ``include`` query argument.
+
+    Args:
+        allowed (Tuple[str, ...]): Related resources that can be included.
+        default (Tuple[str, ...]): Inclusions used when the argument is absent.
+            An empty ``include=`` disables them.
+
+    Returns:
+        Tuple[str, ...]: The requested inclusions in canonical order.
+
+    Raises:
+        BadRequest: If an inclusion is unknown.
+    """
+    raw = request.args.get("include")
+    if raw is None:
+        return default
+
+    requested = _split(raw)
+    _check(requested, allowed, "include")
+    return tuple(name for name in allowed if name in requested)
+
+
+def _split(raw: str) -> set:
+    """
+    Split a comma-separated argument into a set of non-empty names.
+    """
+    return {name.strip() for name in raw.split(",") if name.strip()}
+
+
+def _check(requested: set, allowed: Tuple[str, ...], kind: str) -> None:
+    """
+    Reject names outside of ``allowed``.
+    """
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise BadRequest(
+            f"Unknown {kind} value(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(allowed)}."
+        )
@@ -0,0 +1,205 @@
+# app/common/formats.py
+"""
+Response encoding: a fast JSON provider and ``Accept`` negotiation of JSON,
+MessagePack and CSV.
+
+:class:`FastJSONProvider` encodes with orjson when it is installed (see
+``requirements-formats.txt``) and with the standard library otherwise. Either way
+``Decimal`` values are written as JSON numbers, not as the strings Flask's default
+provider produces, and named tuples as arrays.
+
+:func:`render` is the one exit of the list and summary routes: the serialized
+payload is encoded as JSON, MessagePack (when msgpack is installed) or CSV,
+whichever the ``Accept`` header prefers, and JSON when it names none of them.
+"""
+
+import csv
+import io
+import json
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+from app.common.instrumentation import TimedJSONProvider, record_serialization
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+CSV_MIMETYPE = "text/csv"
+
+# Negotiated media type -> format name
+_FORMATS = {JSON_MIMETYPE: "json", MSGPACK_MIMETYPE: "msgpack", CSV_MIMETYPE: "csv"}
+
+
+def init_app(app: Flask) -> None:
+    """
+    Install :class:`FastJSONProvider` as the app's JSON provider.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
+
+
+def _default(value: Any) -> Any:
+    """
+    Convert the values neither encoder handles natively.
+
+    ``Numeric(10, 2)`` columns hold at most 10 significant digits, which a float
+    reproduces exactly, so their ``Decimal`` values become numbers.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, tuple):
+        return list(value)
+    return DefaultJSONProvider.default(value)
+
+
+class FastJSONProvider(TimedJSONProvider):
+    """
+    JSON provider backed by orjson, with the options of Flask's default provider.
+
+    Keys are sorted and output is indented in debug mode, as with the default
+    provider; non-ASCII characters are written as UTF-8 instead of escaped. Calls
+    with extra ``json.dumps`` arguments fall back to the standard library.
+    """
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumpb(obj).decode()
+
+    def dumpb(self, obj: Any) -> bytes:
+        """
+        Encode ``obj`` as UTF-8 JSON bytes.
+        """
+        if orjson is None:
+            return super().dumps(obj).encode()
+
+        started = time.perf_counter()
+        try:
+            return orjson.dumps(obj, default=_default, option=self._options())
+        finally:
+            record_serialization(time.perf_counter() - started)
+
+    def loads(self, s, **kwargs) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj), mimetype=self.mimetype)
+
+    def _options(self) -> int:
+        """
+        Return the orjson options matching the provider's settings.
+        """
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            options |= orjson.OPT_INDENT_2
+        return options
+
+
+def get_format() -> str:
+    """
+    Pick the encoding of the current response from the ``Accept`` header.
+
+    Returns:
+        str: ``"json"``, ``"msgpack"`` or ``"csv"``.
+    """
+    offers = [JSON_MIMETYPE, CSV_MIMETYPE]
+    if msgpack is not None:
+        offers.append(MSGPACK_MIMETYPE)
+    best = request.accept_mimetypes.best_match(offers, default=JSON_MIMETYPE)
+    return _FORMATS[best]
+
+
+def render(payload: Any, rows: Optional[str] = None) -> Response:
+    """
+    Encode a serialized payload in the format the client prefers.
+
+    CSV holds one line per row: the payload itself when it is a list, else the list
+    under ``rows``. The payload's other scalar fields (``total``, ``next_cursor``...)
+    are sent as ``X-`` headers, and nested lists as JSON text.
+
+    Args:
+        payload (Any): Serialized response body (dicts, lists and scalars).
+        rows (Optional[str]): Key of the row list when the payload is a dict.
+
+    Returns:
+        Response: The encoded response.
+    """
+    response_format = get_format()
+    if response_format == "json":
+        return current_app.json.response(payload)
+
+    started = time.perf_counter()
+    try:
+        if response_format == "msgpack":
+            return Response(
+                msgpack.packb(payload, default=_default), mimetype=MSGPACK_MIMETYPE
+            )
+        return _csv_response(payload, rows)
+    finally:
+        record_serialization(time.perf_counter() - started)
+
+
+def _csv_response(payload: Any, rows: Optional[str]) -> Response:
+    """
+    Write the rows of a payload as CSV, with its other fields as headers.
+    """
+    headers = {}
+    if rows is not None:
+        for key, value in payload.items():
+            if key != rows and value is not None:
+                headers["X-" + key.replace("_", "-").title()] = str(value)
+        payload = payload[rows]
+
+    buffer = io.StringIO()
+    columns = _columns(payload)
+    if columns:
+        writer = csv.DictWriter(buffer, columns, restval="", lineterminator="\n")
+        writer.writeheader()
+        for row in payload:
+            writer.writerow(
+                {
+                    key: _json_text(value) if isinstance(value, (list, dict)) else value
+                    for key, value in row.items()
+                }
+            )
+    return Response(buffer.getvalue(), mimetype=CSV_MIMETYPE, headers=headers)
+
+
+def _json_text(value: Any) -> str:
+    """
+    Encode a nested value of a CSV cell as compact JSON.
+    """
+    return json.dumps(value, default=_default, separators=(",", ":"))
+
+
+def _columns(rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Return the keys of all rows, in order of first appearance.
+    """
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
@@ -0,0 +1,104 @@
+# app/common/http_cache.py
+"""
+Conditional GET support: ETag, Last-Modified, Cache-Control and 304 responses.
+
+Validators are derived from the per-table versions shared by all processes (see
+:meth:`app.common.versioning.TableVersions.validator`), so every worker sends the
+same ETag for the same data, and a matching ``If-None-Match`` or
+``If-Modified-Since`` is answered before the view runs any query or serializes
+anything. Large bodies are compressed in the encoding the client
+accepts, and a response already compressed under the same ETag is served from
+:data:`app.common.compression.compression` without running the view.
+"""
+
+import functools
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Optional, Sequence
+
+from flask import Response, current_app, request
+
+from app.common.compression import compression
+from app.common.versioning import table_names, table_versions
+
+
+def conditional(*models, depends: Optional[Callable[[], Sequence]] = None) -> Callable:
+    """
+    Decorate a read-only view with validators computed from data versions.
+
+    Args:
+        *models: SQLAlchemy models (or table names) the view's response depends on.
+        depends (Optional[Callable[[], Sequence]]): Returns the models of the
+            current request instead, for views whose dependencies vary with their
+            query arguments.
+
+    Returns:
+        Callable: The decorator.
+    """
+    static_tables = table_names(*models)
+
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            tables = static_tables if depends is None else table_names(*depends())
+            token = table_versions.current(*tables)
+            stamp, modified = table_versions.validator(*tables)
+            encoding = compression.negotiate()
+            etag = _make_etag(stamp, encoding)
+            last_modified = datetime.fromtimestamp(int(modified), tz=timezone.utc)
+
+            if _is_not_modified(etag, last_modified):
+                response = Response(status=304)
+            else:
+                response = compression.cached(etag) if encoding else None
+                if response is None:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    # Skip caching bodies that raced with a write to their tables
+                    fresh = table_versions.token(*tables) == token
+                    compression.compress(response, encoding, etag if fresh else None)
+
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers["Cache-Control"] = _cache_control()
+            response.vary.add("Accept")
+            if compression.enabled:
+                response.vary.add("Accept-Encoding")
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _make_etag(stamp: tuple, encoding: Optional[str] = None) -> str:
+    """
+    Hash the shared data version with everything that shapes the representation.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(request.full_path.encode())
+    digest.update(request.headers.get("Accept", "").encode())
+    digest.update((encoding or "").encode())
+    digest.update(repr(stamp).encode())
+    return digest.hexdigest()
+
+
+def _is_not_modified(etag: str, last_modified: datetime) -> bool:
+    """
+    Evaluate the request's preconditions (If-None-Match takes precedence).
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def _cache_control() -> str:
+    """
+    Return the Cache-Control value configured for the current blueprint.
+    """
+    per_blueprint = current_app.config.get("CACHE_CONTROL", {})
+    default = current_app.config.get("CACHE_CONTROL_DEFAULT", "no-cache")
+    return per_blueprint.get(request.blueprint, default)
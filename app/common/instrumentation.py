@@ -0,0 +1,227 @@
+# app/common/instrumentation.py
+"""
+Per-request SQL and serialization timing, reported in a ``Server-Timing`` header.
+
+Cursor events on every engine count the statements a request issues and the time
+spent in the database; compiled serializers and the JSON provider add the time
+spent turning results into the response body. The totals are sent as::
+
+    Server-Timing: db;dur=1.80;desc="queries=3", serialize;dur=0.40, app;dur=3.10
+
+A statement executed ``SQL_REPEAT_WARNING_THRESHOLD`` times or more by one request
+is logged as a probable N+1 pattern. :func:`capture_queries` records statements
+outside of requests too; the ``query_budget`` test fixture is built on it.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from flask import Flask, Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Key under which the start time of a statement is stored on its execution context
+_STARTED_KEY = "_chinook_query_started"
+
+
+class RequestStats:
+    """
+    Counters of one request (or one :func:`capture_queries` block).
+    """
+
+    __slots__ = ("started", "queries", "db_time", "serialize_time", "statements")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.statements: Counter = Counter()
+
+    def server_timing(self) -> str:
+        """
+        Format the counters as a ``Server-Timing`` header value.
+        """
+        total = time.perf_counter() - self.started
+        return (
+            f'db;dur={self.db_time * 1e3:.2f};desc="queries={self.queries}", '
+            f"serialize;dur={self.serialize_time * 1e3:.2f}, "
+            f"app;dur={total * 1e3:.2f}"
+        )
+
+
+# Stats of the request being handled in the current context
+_current: ContextVar[Optional[RequestStats]] = ContextVar(
+    "chinook_request_stats", default=None
+)
+
+# Stats of the active capture_queries() blocks, innermost last
+_captures: ContextVar[tuple] = ContextVar("chinook_query_captures", default=())
+
+_install_lock = threading.Lock()
+_installed = False
+
+
+def init_app(app: Flask) -> None:
+    """
+    Install the cursor listeners and the request hooks.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+    if not app.config.get("SERVER_TIMING_ENABLED", True):
+        return
+
+    _install_listeners()
+    if not isinstance(app.json, TimedJSONProvider):
+        app.json_provider_class = TimedJSONProvider
+        app.json = TimedJSONProvider(app)
+    app.before_request(_start_request)
+    app.after_request(_add_header)
+    app.teardown_request(_end_request)
+
+
+def current_stats() -> Optional[RequestStats]:
+    """
+    Return the counters of the current request, if it is instrumented.
+    """
+    return _current.get()
+
+
+def record_serialization(seconds: float) -> None:
+    """
+    Add serialization time to the current request and captures.
+    """
+    stats = _current.get()
+    if stats is not None:
+        stats.serialize_time += seconds
+    for capture in _captures.get():
+        capture.serialize_time += seconds
+
+
+def timed_serializer(serialize: Callable) -> Callable:
+    """
+    Wrap a serializer so its run time counts as serialization time.
+    """
+
+    def serializer(obj):
+        started = time.perf_counter()
+        try:
+            return serialize(obj)
+        finally:
+            record_serialization(time.perf_counter() - started)
+
+    return serializer
+
+
+@contextmanager
+def capture_queries() -> Iterator[RequestStats]:
+    """
+    Record every statement executed in the current context within the block.
+
+    Works with or without a request, and with instrumentation disabled.
+
+    Yields:
+        RequestStats: Counters filled in as statements run.
+    """
+    _install_listeners()
+    stats = RequestStats()
+    token = _captures.set(_captures.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _captures.reset(token)
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider whose encoding time counts as serialization time.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            record_serialization(time.perf_counter() - started)
+
+
+def _install_listeners() -> None:
+    """
+    Listen to the cursor events of every engine, once per process.
+    """
+    global _installed
+
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = True
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    """
+    Remember when a statement started.
+    """
+    if context is not None:
+        setattr(context, _STARTED_KEY, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    """
+    Add a finished statement to the current request and captures.
+    """
+    stats = _current.get()
+    targets = _captures.get() if stats is None else (stats,) + _captures.get()
+    if not targets:
+        return
+
+    started = getattr(context, _STARTED_KEY, None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    for target in targets:
+        target.queries += 1
+        target.db_time += elapsed
+        target.statements[statement] += 1
+
+
+def _start_request() -> None:
+    """
+    ``before_request`` hook: start counting for this request.
+    """
+    _current.set(RequestStats())
+
+
+def _add_header(response: Response) -> Response:
+    """
+    ``after_request`` hook: report the counters in a Server-Timing header.
+    """
+    stats = _current.get()
+    if stats is not None:
+        response.headers["Server-Timing"] = stats.server_timing()
+    return response
+
+
+def _end_request(error: Optional[BaseException] = None) -> None:
+    """
+    ``teardown_request`` hook: warn about repeated statements and stop counting.
+    """
+    stats = _current.get()
+    if stats is None:
+        return
+    _current.set(None)
+
+    threshold = current_app.config.get("SQL_REPEAT_WARNING_THRESHOLD", 10)
+    for statement, count in stats.statements.items():
+        if count < threshold:
+            continue
+        current_app.logger.warning(
+            "Possible N+1 query on %s: statement ran %d times: %s",
+            request.path,
+            count,
+            " ".join(statement.split())[:200],
+        )
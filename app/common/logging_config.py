@@ -1,10 +1,157 @@
 # app/common/logging_config.py
 """
 Centralized logging configuration for the Flask application.
+
+Records are handed to a background thread through a queue (``LOG_QUEUE_ENABLED``),
+which formats them and writes them to the stream, so request threads neither format
+messages nor wait on stdout/stderr. Output is either the classic text format or one
+JSON object per line (``LOG_FORMAT``).
+
+Records logged while handling a request carry its id, taken from the
+``REQUEST_ID_HEADER`` request header or generated, and echoed in the response, and
+its route. Requests are sampled per route (``LOG_SAMPLE_RATES``, falling back to
+``LOG_SAMPLE_RATE``): the debug and info records of a request left out of the
+sample are dropped, while warnings and errors are always kept.
 """
 
+import atexit
+import json
 import logging
-from flask import Flask
+import os
+import queue
+import random
+import re
+import threading
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from flask import Flask, Response, current_app, request
+
+# Request environ keys of the request id and of the sampling decision
+_REQUEST_ID_KEY = "chinook.request_id"
+_SAMPLED_KEY = "chinook.log_sampled"
+
+# Incoming request ids are reused only if they look like one
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._:-]{1,128}")
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - [%(request_id)s] %(message)s"
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Add the request id and route to records, and drop the low-severity records of
+    requests left out of the log sample.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        try:
+            current = request._get_current_object()
+        except RuntimeError:
+            # Outside of a request
+            record.request_id = "-"
+            record.route = None
+            return True
+
+        environ = current.environ
+        record.request_id = environ.get(_REQUEST_ID_KEY, "-")
+        record.route = current.url_rule.rule if current.url_rule else None
+        return record.levelno >= logging.WARNING or environ.get(_SAMPLED_KEY, True)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format records as single-line JSON objects.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        route = getattr(record, "route", None)
+        if route is not None:
+            entry["route"] = route
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves message formatting to the listener thread.
+
+    The standard handler formats each record before queueing it; here the record is
+    queued as is, so log arguments must not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueueLogging:
+    """
+    The process-wide queue and the listener thread that drains it into the
+    handler of the most recently configured app.
+
+    Threads do not survive ``fork()``, so each forked worker gets a new queue and
+    listener of its own.
+    """
+
+    def __init__(self) -> None:
+        self.queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+        self.handler: Optional[logging.Handler] = None
+        self.listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+        os.register_at_fork(after_in_child=self._restart)
+
+    def set_handler(self, handler: logging.Handler) -> None:
+        """
+        Write queued records to ``handler`` from now on, starting the listener
+        thread if it is not running.
+        """
+        with self._lock:
+            self.handler = handler
+            if self.listener is None:
+                self._start()
+            else:
+                self.listener.handlers = (handler,)
+
+    def stop(self) -> None:
+        """
+        Write every queued record and stop the background thread.
+        """
+        with self._lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+
+    def _start(self) -> None:
+        """
+        Start draining the queue in a background thread.
+        """
+        self.listener = QueueListener(
+            self.queue_handler.queue, self.handler, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def _restart(self) -> None:
+        """
+        Replace the queue and listener inherited from the parent process.
+        """
+        self._lock = threading.Lock()
+        self.queue_handler.queue = queue.SimpleQueue()
+        running, self.listener = self.listener, None
+        if running is not None:
+            self._start()
+
+
+# Queue shared by every app of the process, and the filter of its handlers
+_queue = QueueLogging()
+_context_filter = RequestContextFilter()
 
 
 def configure_logging(app: Flask, level: int = logging.INFO) -> None:
@@ -19,12 +166,20 @@ def configure_logging(app: Flask, level: int = logging.INFO) -> None:
     handler = logging.StreamHandler()
     handler.setLevel(level)
 
-    # Define standard log format
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
+    # Define the log format: JSON lines or the standard text format
+    if app.config.get("LOG_FORMAT", "text") == "json":
+        formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
     handler.setFormatter(formatter)
 
+    # Hand records to the background writer unless disabled
+    if app.config.get("LOG_QUEUE_ENABLED", True):
+        _queue.set_handler(handler)
+        handler = _queue.queue_handler
+        handler.setLevel(level)
+    handler.addFilter(_context_filter)
+
     # Avoid duplicate handlers in reloader or debug mode
     if app.logger.hasHandlers():
         app.logger.handlers.clear()
@@ -36,4 +191,47 @@ def configure_logging(app: Flask, level: int = logging.INFO) -> None:
     # Suppress overly verbose logs from Werkzeug
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
 
+    app.before_request(_start_request)
+    app.after_request(_add_request_id)
+
     app.logger.info("Logging is configured with level: %s", logging.getLevelName(level))
+
+
+def flush_logging() -> None:
+    """
+    Write out the queued records; call before the process exits without running
+    ``atexit`` hooks (e.g. ``os._exit`` in forked workers).
+    """
+    _queue.stop()
+
+
+def _start_request() -> None:
+    """
+    ``before_request`` hook: assign the request id and make the sampling decision.
+    """
+    config = current_app.config
+    header = request.headers.get(config.get("REQUEST_ID_HEADER", "X-Request-ID"))
+    if header is None or not _REQUEST_ID_PATTERN.fullmatch(header):
+        header = uuid.uuid4().hex
+    request.environ[_REQUEST_ID_KEY] = header
+
+    route = request.url_rule.rule if request.url_rule else None
+    rate = config.get("LOG_SAMPLE_RATES", {}).get(
+        route, config.get("LOG_SAMPLE_RATE", 1.0)
+    )
+    if rate < 1.0:
+        request.environ[_SAMPLED_KEY] = random.random() < rate
+
+
+def _add_request_id(response: Response) -> Response:
+    """
+    ``after_request`` hook: echo the request id to the client.
+    """
+    request_id = request.environ.get(_REQUEST_ID_KEY)
+    if request_id is not None:
+        header = current_app.config.get("REQUEST_ID_HEADER", "X-Request-ID")
+        response.headers[header] = request_id
+    return response
+
+
+atexit.register(flush_logging)
@@ -0,0 +1,436 @@
+# app/common/metrics.py
+"""
+Prometheus metrics aggregated across worker processes through mmap'd files.
+
+Every process writes its samples to its own file, ``metrics_<pid>.db`` in
+``METRICS_DIR``, so recording a request needs no cross-process lock: a few
+``struct.pack_into`` calls under a per-process thread lock. ``/metrics`` reads the
+files of every process and sums them. Counters and histograms of exited workers
+keep counting towards the totals; gauges only count for live processes.
+
+The directory must be shared by the workers: it is created (or taken from
+``METRICS_DIR``) when the app is created, before gunicorn forks its workers, and
+each worker opens its own file on first use.
+"""
+
+import atexit
+import glob
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import Flask, Response, request
+
+from app.common import instrumentation
+from app.common.cache import query_cache
+from app.common.compression import compression
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# Upper bounds of the response size buckets, in bytes
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Initial size of a process file; it doubles when full
+_INITIAL_SIZE = 64 * 1024
+
+# Header of a process file: number of bytes used, including the header
+_HEADER = struct.Struct("<Q")
+
+
+class MmapValues:
+    """
+    Append-only ``key -> float`` map stored in a memory-mapped file.
+
+    Entries are ``<key length><key, padded to 8 bytes><double>``. The used size in
+    the header is written after an entry is complete, so readers in other
+    processes never see a partial entry. Only the owning process writes.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size < _INITIAL_SIZE:
+            self._file.truncate(_INITIAL_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._used = _HEADER.unpack_from(self._map, 0)[0] or _HEADER.size
+        self._positions: Dict[str, int] = {
+            key: position for key, _, position in _read(self._map, self._used)
+        }
+
+    def add(self, key: str, amount: float) -> None:
+        """
+        Add ``amount`` to a value, creating it at zero first.
+        """
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        value = struct.unpack_from("<d", self._map, position)[0]
+        struct.pack_into("<d", self._map, position, value + amount)
+
+    def set(self, key: str, value: float) -> None:
+        """
+        Overwrite a value.
+        """
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        struct.pack_into("<d", self._map, position, value)
+
+    def _append(self, key: str) -> int:
+        """
+        Add a zero-valued entry and return the offset of its value.
+        """
+        encoded = key.encode()
+        padded = len(encoded) + (-(4 + len(encoded)) % 8)
+        size = 4 + padded + 8
+        while self._used + size > len(self._map):
+            self._map.resize(len(self._map) * 2)
+
+        struct.pack_into(
+            f"<I{padded}sd", self._map, self._used, len(encoded), encoded, 0.0
+        )
+        position = self._used + 4 + padded
+        self._used += size
+        _HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = position
+        return position
+
+
+def _read(data, used: int) -> Iterable[Tuple[str, float, int]]:
+    """
+    Yield ``(key, value, value offset)`` for every complete entry of a file.
+    """
+    position = _HEADER.size
+    while position + 4 <= used:
+        length = struct.unpack_from("<I", data, position)[0]
+        padded = length + (-(4 + length) % 8)
+        key = bytes(data[position + 4 : position + 4 + length]).decode()
+        value_position = position + 4 + padded
+        yield key, struct.unpack_from("<d", data, value_position)[0], value_position
+        position = value_position + 8
+
+
+def read_file(path: str) -> Iterable[Tuple[str, float]]:
+    """
+    Yield the ``(key, value)`` entries of a process file.
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < _HEADER.size:
+        return
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    for key, value, _ in _read(data, used):
+        yield key, value
+
+
+class Metrics:
+    """
+    Request metrics recorded by Flask hooks and rendered for Prometheus.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.directory: Optional[str] = None
+        self._values: Optional[MmapValues] = None
+        self._lock = threading.Lock()
+
+        # Each forked worker must write to its own file
+        os.register_at_fork(after_in_child=self._forget_file)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Choose the metrics directory and install the request hooks.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+        self.enabled = app.config.get("METRICS_ENABLED", True)
+        if not self.enabled:
+            return
+
+        directory = app.config.get("METRICS_DIR")
+        if not directory:
+            directory = tempfile.mkdtemp(prefix="chinook-metrics-")
+            atexit.register(_remove_directory, directory, os.getpid())
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._forget_file()
+
+        app.before_request(self._start_request)
+        app.after_request(self._record_response)
+        app.teardown_request(self._end_request)
+
+    def render(self) -> str:
+        """
+        Aggregate the files of every process into the Prometheus text format.
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        for path in glob.glob(os.path.join(self.directory or "", "metrics_*.db")):
+            pid = int(os.path.basename(path)[len("metrics_") : -len(".db")])
+            alive = _is_alive(pid)
+            for key, value in read_file(path):
+                if alive or not key.startswith(_GAUGE_PREFIX):
+                    totals[key] += value
+
+        lines: List[str] = []
+        for name, kind, help_text in _FAMILIES:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            prefix = _key_prefix(kind, name)
+            samples = {
+                key[len(prefix) :]: value
+                for key, value in totals.items()
+                if key.startswith(prefix)
+            }
+            if kind == "histogram":
+                lines.extend(_histogram_lines(name, samples))
+            else:
+                lines.extend(
+                    f"{name}{labels} {_format(value)}"
+                    for labels, value in sorted(samples.items())
+                )
+        return "\n".join(lines) + "\n"
+
+    def _start_request(self) -> None:
+        """
+        ``before_request`` hook: count the request as in flight.
+        """
+        request.environ["chinook.metrics_started"] = time.perf_counter()
+        self._write(lambda values: values.add(_IN_FLIGHT_KEY, 1))
+
+    def _record_response(self, response: Response) -> Response:
+        """
+        ``after_request`` hook: record latency, status, size and DB time.
+        """
+        started = request.environ.get("chinook.metrics_started")
+        if started is None:
+            return response
+
+        elapsed = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule else "<unmatched>"
+        labels = (
+            f'blueprint="{request.blueprint or ""}",route="{_escape(route)}",'
+            f'method="{request.method}"'
+        )
+        size = None if response.is_streamed else response.calculate_content_length()
+        stats = instrumentation.current_stats()
+        cache = query_cache.stats()
+        compressed = compression.stats()
+
+        def record(values: MmapValues) -> None:
+            _observe(values, "http_request_duration_seconds", labels, elapsed)
+            values.add(
+                f"counter:http_requests_total{{{labels},"
+                f'status="{response.status_code}"}}',
+                1,
+            )
+            if size is not None:
+                _observe(values, "http_response_size_bytes", labels, size)
+            if stats is not None:
+                values.add(f"counter:db_queries_total{{{labels}}}", stats.queries)
+                values.add(
+                    f"counter:db_duration_seconds_total{{{labels}}}", stats.db_time
+                )
+            # Cache counters are cumulative per process; mirror the latest values
+            for event in ("hits", "misses"):
+                values.set(
+                    f'counter:query_cache_requests_total{{result="{event}"}}',
+                    cache[event],
+                )
+            values.set("counter:query_cache_evictions_total", cache["evictions"])
+            values.set("counter:query_cache_expirations_total", cache["expirations"])
+            for event in ("hits", "misses"):
+                values.set(
+                    f'counter:compressed_cache_requests_total{{result="{event}"}}',
+                    compressed[event],
+                )
+            values.set(
+                "counter:compressed_cache_evictions_total", compressed["evictions"]
+            )
+
+        self._write(record)
+        return response
+
+    def _end_request(self, error: Optional[BaseException] = None) -> None:
+        """
+        ``teardown_request`` hook: the request is no longer in flight.
+        """
+        if request.environ.pop("chinook.metrics_started", None) is not None:
+            self._write(lambda values: values.add(_IN_FLIGHT_KEY, -1))
+
+    def _write(self, update) -> None:
+        """
+        Apply an update to this process's file under the thread lock.
+        """
+        with self._lock:
+            if self._values is None:
+                path = os.path.join(self.directory, f"metrics_{os.getpid()}.db")
+                self._values = MmapValues(path)
+            update(self._values)
+
+    def _forget_file(self) -> None:
+        """
+        Drop the file handle inherited from the parent process.
+        """
+        self._values = None
+        self._lock = threading.Lock()
+
+
+# (name, type, help) of every exported family, in output order
+_FAMILIES: List[Tuple[str, str, str]] = [
+    (
+        "chinook_http_request_duration_seconds",
+        "histogram",
+        "Request latency by blueprint, route and method.",
+    ),
+    (
+        "chinook_http_requests_total",
+        "counter",
+        "Requests by blueprint, route, method and status.",
+    ),
+    ("chinook_http_requests_in_flight", "gauge", "Requests being handled."),
+    (
+        "chinook_http_response_size_bytes",
+        "histogram",
+        "Response body size of non-streamed responses.",
+    ),
+    ("chinook_db_queries_total", "counter", "SQL statements run by requests."),
+    (
+        "chinook_db_duration_seconds_total",
+        "counter",
+        "Time requests spent running SQL statements.",
+    ),
+    (
+        "chinook_query_cache_requests_total",
+        "counter",
+        "Service-layer query cache lookups by result.",
+    ),
+    (
+        "chinook_query_cache_evictions_total",
+        "counter",
+        "Query cache entries evicted to stay within the size limit.",
+    ),
+    (
+        "chinook_query_cache_expirations_total",
+        "counter",
+        "Query cache entries dropped when their TTL expired.",
+    ),
+    (
+        "chinook_compressed_cache_requests_total",
+        "counter",
+        "Compressed response cache lookups by result.",
+    ),
+    (
+        "chinook_compressed_cache_evictions_total",
+        "counter",
+        "Compressed responses evicted to stay within the size limit.",
+    ),
+]
+
+# Stored keys are "<type>:<name without the chinook_ prefix><labels>"
+_GAUGE_PREFIX = "gauge:"
+_IN_FLIGHT_KEY = "gauge:http_requests_in_flight"
+
+
+def _key_prefix(kind: str, name: str) -> str:
+    """
+    Return the stored key prefix of a metric family.
+    """
+    return f"{kind}:{name[len('chinook_'):]}"
+
+
+def _observe(values: MmapValues, name: str, labels: str, value: float) -> None:
+    """
+    Record one histogram observation: its bucket, the sum and the count.
+
+    Buckets are stored non-cumulatively and summed up when rendered.
+    """
+    buckets = SIZE_BUCKETS if name.endswith("_bytes") else LATENCY_BUCKETS
+    index = bisect_left(buckets, value)
+    bound = _format(buckets[index]) if index < len(buckets) else "+Inf"
+    values.add(f'histogram:{name}_bucket{{{labels},le="{bound}"}}', 1)
+    values.add(f"histogram:{name}_sum{{{labels}}}", value)
+    values.add(f"histogram:{name}_count{{{labels}}}", 1)
+
+
+def _histogram_lines(name: str, samples: Dict[str, float]) -> List[str]:
+    """
+    Render the aggregated samples of a histogram with cumulative buckets.
+    """
+    buckets = SIZE_BUCKETS if name.endswith("_bytes") else LATENCY_BUCKETS
+    bounds = [_format(bound) for bound in buckets] + ["+Inf"]
+    series = sorted(key[len("_count") :] for key in samples if key.startswith("_count"))
+
+    lines = []
+    for labels in series:
+        inner = labels[1:-1]
+        cumulative = 0.0
+        for bound in bounds:
+            cumulative += samples.get(f'_bucket{{{inner},le="{bound}"}}', 0.0)
+            lines.append(f'{name}_bucket{{{inner},le="{bound}"}} {_format(cumulative)}')
+        lines.append(f"{name}_sum{labels} {_format(samples[f'_sum{labels}'])}")
+        lines.append(f"{name}_count{labels} {_format(samples[f'_count{labels}'])}")
+    return lines
+
+
+def _format(value: float) -> str:
+    """
+    Format a sample value, dropping the fraction of whole numbers.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a label value for the text format.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _is_alive(pid: int) -> bool:
+    """
+    Tell whether a process still exists.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _remove_directory(directory: str, owner: int) -> None:
+    """
+    ``atexit`` hook: remove a temporary metrics directory in the process that
+    created it.
+    """
+    if os.getpid() == owner:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# Shared metrics recorder
+metrics = Metrics()
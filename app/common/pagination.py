@@ -0,0 +1,162 @@
+# app/common/pagination.py
+"""
+Helpers for keyset (cursor) pagination shared by the list endpoints.
+"""
+
+import base64
+import binascii
+from typing import Optional, Sequence, Tuple, TypeVar
+
+from flask import request
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import BadRequest
+
+# Upper bound for page sizes (Flask-SQLAlchemy's paginate() has no cap by default)
+MAX_PAGE_SIZE: int = 100
+
+# Page size used when the client does not send one
+DEFAULT_PAGE_SIZE: int = 20
+
+# Supported values for the ``count`` query argument
+COUNT_MODES: Tuple[str, ...] = ("exact", "estimate", "none")
+
+T = TypeVar("T")
+
+
+def encode_cursor(key: Optional[int]) -> Optional[str]:
+    """
+    Encode the last primary key of a page as an opaque cursor.
+
+    Args:
+        key (Optional[int]): Primary key of the last returned row, or None.
+
+    Returns:
+        Optional[str]: URL-safe cursor, or None when there is no next page.
+    """
+    if key is None:
+        return None
+    return base64.urlsafe_b64encode(str(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (Optional[str]): Cursor received from the client.
+
+    Returns:
+        Optional[int]: Primary key to seek after, or None for the first page.
+
+    Raises:
+        BadRequest: If the cursor is malformed.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequest("Invalid pagination cursor.")
+
+
+def is_cursor_request() -> bool:
+    """
+    Tell whether the current request asks for cursor pagination.
+    """
+    return "after" in request.args or "limit" in request.args
+
+
+def get_limit() -> int:
+    """
+    Read the ``limit`` query argument, clamped to ``[1, MAX_PAGE_SIZE]``.
+    """
+    limit = request.args.get("limit", default=DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def get_count_mode() -> str:
+    """
+    Read the ``count`` query argument (``exact``, ``estimate`` or ``none``).
+
+    Raises:
+        BadRequest: If the value is not a supported count mode.
+    """
+    mode = request.args.get("count", default="exact")
+    if mode not in COUNT_MODES:
+        raise BadRequest("Invalid count mode. Use one of: exact, estimate, none.")
+    return mode
+
+
+def get_page_args(args: Optional[MultiDict] = None) -> Tuple[int, int]:
+    """
+    Read the ``page`` and ``per_page`` query arguments as the effective values.
+
+    Routes echo these values, so clients see the page size actually served.
+
+    Args:
+        args (Optional[MultiDict]): Query arguments; defaults to the request's.
+
+    Returns:
+        Tuple[int, int]: Page number and page size, normalized by
+        :func:`normalize_page`.
+    """
+    args = request.args if args is None else args
+    return normalize_page(
+        args.get("page", default=1, type=int),
+        args.get("per_page", default=DEFAULT_PAGE_SIZE, type=int),
+    )
+
+
+def normalize_page(page: int, per_page: int) -> Tuple[int, int]:
+    """
+    Clamp page arguments to the values served.
+
+    Args:
+        page (int): 1-indexed page number; values below 1 select the first page.
+        per_page (int): Page size; values below 1 fall back to the default and
+            larger ones are capped at ``MAX_PAGE_SIZE``.
+
+    Returns:
+        Tuple[int, int]: Page number and page size.
+    """
+    page = page if page > 0 else 1
+    per_page = min(per_page if per_page > 0 else DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    return page, per_page
+
+
+def page_bounds(page: int, per_page: int) -> Tuple[int, int]:
+    """
+    Turn page arguments into (offset, limit), normalized by :func:`normalize_page`.
+
+    Args:
+        page (int): 1-indexed page number.
+        per_page (int): Page size.
+
+    Returns:
+        Tuple[int, int]: Row offset and limit.
+    """
+    page, per_page = normalize_page(page, per_page)
+    return (page - 1) * per_page, per_page
+
+
+def keyset_page(
+    items: Sequence[T], limit: int, key: str
+) -> Tuple[Sequence[T], Optional[int]]:
+    """
+    Trim a ``limit + 1`` result to ``limit`` rows and return the next seek key.
+
+    Args:
+        items (Sequence[T]): Rows fetched with ``limit + 1``.
+        limit (int): Requested page size.
+        key (str): Attribute holding the seek key of a row.
+
+    Returns:
+        Tuple[Sequence[T], Optional[int]]: The page and the key of its last row,
+        or None when there is no next page.
+    """
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    return items, getattr(items[-1], key)
@@ -0,0 +1,83 @@
+# app/common/sqlite.py
+"""
+SQLite engine tuning profile: connection pragmas, pool sizing and read-only mode.
+
+:func:`configure_sqlite` must run before ``db.init_app`` because it rewrites the
+database URI and engine options the engine is created from; :func:`install_pragmas`
+then applies ``SQLITE_PRAGMAS`` to every new DBAPI connection of that engine.
+
+With ``SQLITE_READ_ONLY`` the file is opened as ``mode=ro&immutable=1``: SQLite
+skips locking and change detection entirely, which is only safe while nothing
+writes to the file (such as the shipped ``instance/chinook.db``).
+"""
+
+from typing import Any, Dict
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+# Pragmas that require write access and are skipped on read-only connections
+_WRITE_PRAGMAS = frozenset({"journal_mode", "synchronous"})
+
+
+def configure_sqlite(app: Flask) -> None:
+    """
+    Apply the read-only URI mode and pool settings to a SQLite configuration.
+
+    Does nothing for other database backends. In-memory databases keep the
+    ``StaticPool`` Flask-SQLAlchemy gives them.
+
+    Args:
+        app (Flask): The Flask application instance, before ``db.init_app``.
+    """
+    url = make_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+        return
+
+    if app.config.get("SQLITE_READ_ONLY"):
+        database = url.database
+        if not database.startswith("file:"):
+            database = f"file:{database}"
+        url = url.set(database=database).update_query_dict(
+            {"mode": "ro", "immutable": "1", "uri": "true"}
+        )
+        app.config["SQLALCHEMY_DATABASE_URI"] = url.render_as_string(
+            hide_password=False
+        )
+
+    options = app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {})
+    options.setdefault("pool_size", app.config.get("SQLITE_POOL_SIZE", 5))
+    options.setdefault("max_overflow", app.config.get("SQLITE_MAX_OVERFLOW", 10))
+
+
+def install_pragmas(
+    engine: Engine, pragmas: Dict[str, Any], read_only: bool = False
+) -> None:
+    """
+    Run ``PRAGMA name=value`` for each entry on every new connection of an engine.
+
+    Args:
+        engine (Engine): A SQLite engine.
+        pragmas (Dict[str, Any]): Pragma names and values, applied in order.
+        read_only (bool): Skip the pragmas that need write access.
+    """
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    statements = []
+    for name, value in pragmas.items():
+        if not name.isidentifier():
+            raise ValueError(f"Invalid SQLite pragma name: {name!r}")
+        if read_only and name in _WRITE_PRAGMAS:
+            continue
+        statements.append(f"PRAGMA {name}={value}")
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
@@ -0,0 +1,76 @@
+# app/common/streaming.py
+"""
+Helpers for streaming large collections as NDJSON or chunked JSON arrays.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+JSON_MIMETYPE = "application/json"
+
+# Values of the ``stream`` query argument that select a chunked JSON array
+_JSON_ARRAY_VALUES = {"1", "true", "json"}
+
+
+def get_stream_format() -> Optional[str]:
+    """
+    Decide whether, and how, the current request wants a streamed response.
+
+    ``?stream=ndjson`` or an ``Accept`` header preferring ``application/x-ndjson``
+    selects NDJSON; ``?stream=1`` selects a chunked JSON array.
+
+    Returns:
+        Optional[str]: ``"ndjson"``, ``"json"`` or None for a regular response.
+    """
+    stream = request.args.get("stream", "").lower()
+    if stream == "ndjson":
+        return "ndjson"
+    if stream in _JSON_ARRAY_VALUES:
+        return "json"
+
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE])
+    return "ndjson" if best == NDJSON_MIMETYPE else None
+
+
+def stream_response(items: Iterable[dict], stream_format: str) -> Response:
+    """
+    Build a response that encodes and writes items one at a time.
+
+    Args:
+        items (Iterable[dict]): Serialized items, typically produced lazily from a
+            ``yield_per`` query so memory stays constant.
+        stream_format (str): ``"ndjson"`` for one JSON document per line, ``"json"``
+            for a single JSON array written in chunks.
+
+    Returns:
+        Response: A streamed response that keeps the request context alive.
+    """
+    if stream_format == "ndjson":
+        body, mimetype = _ndjson_chunks(items), NDJSON_MIMETYPE
+    else:
+        body, mimetype = _json_array_chunks(items), JSON_MIMETYPE
+
+    return Response(stream_with_context(body), mimetype=mimetype)
+
+
+def _ndjson_chunks(items: Iterable[dict]) -> Iterator[str]:
+    """
+    Yield one JSON document per line.
+    """
+    dumps = current_app.json.dumps
+    for item in items:
+        yield dumps(item) + "\n"
+
+
+def _json_array_chunks(items: Iterable[dict]) -> Iterator[str]:
+    """
+    Yield a JSON array one element at a time.
+    """
+    dumps = current_app.json.dumps
+    separator = "["
+    for item in items:
+        yield separator + dumps(item)
+        separator = ","
+    yield "[]" if separator == "[" else "]"
@@ -0,0 +1,285 @@
+# app/common/versioning.py
+"""
+Per-table data versions used to invalidate caches and derived data.
+
+Every committed INSERT/UPDATE/DELETE (ORM flushes, bulk operations and Core
+statements alike) and every CREATE/DROP TABLE bumps the counter of the table it
+touched. Raw ``text()`` statements are not inspected; code issuing them must call
+:meth:`TableVersions.bump` itself. Writes made by other processes are detected through SQLite's
+``PRAGMA data_version`` and bump a global generation shared by all tables.
+
+These counters only mean something inside one process. Validators sent to clients
+come from :meth:`TableVersions.validator`, which reads the ``data_versions`` table
+maintained by SQLite triggers (see :mod:`app.models.versions`) and is therefore the
+same in every worker.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from flask import Flask, current_app
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable, DropTable
+
+from app.models import versions as data_versions
+
+# Key under which written table names are staged on a connection until commit
+_PENDING_KEY = "chinook_pending_tables"
+
+# Key under which the last PRAGMA data_version seen by a connection is stored
+_DATA_VERSION_KEY = "chinook_data_version"
+
+# Listener signature: (changed tables, True if the change came from outside)
+ChangeListener = Callable[[FrozenSet[str], bool], None]
+
+
+class TableVersions:
+    """
+    Process-wide registry of monotonically increasing per-table counters.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._modified: Dict[str, float] = {}
+        self._generation = 0
+        self._external_modified = time.time()
+        self._last_check = 0.0
+        self._listeners: List[ChangeListener] = []
+        self._installed = False
+        # Rows of the data_versions table, reloaded after any change
+        self._shared: Optional[Dict[str, Tuple[int, float]]] = None
+        self._changes = 0
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Install the engine listeners that feed the counters.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+        with self._lock:
+            if self._installed:
+                return
+            event.listen(Engine, "after_execute", _record_write)
+            event.listen(Engine, "commit", _flush_pending)
+            event.listen(Engine, "rollback", _discard_pending)
+            self._installed = True
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        """
+        Register a callback invoked after every version bump.
+
+        Args:
+            listener (ChangeListener): Called with the changed table names and
+                whether the change came from outside this process.
+        """
+        self._listeners.append(listener)
+
+    def bump(self, tables: Iterable[str], external: bool = False) -> None:
+        """
+        Increment the counters of the given tables.
+
+        Args:
+            tables (Iterable[str]): Names of the tables that changed.
+            external (bool): True when the change came from another connection,
+                in which case every table is considered changed.
+        """
+        now = time.time()
+        changed = frozenset(tables)
+        with self._lock:
+            if external:
+                self._generation += 1
+                self._external_modified = now
+            for table in changed:
+                self._counters[table] = self._counters.get(table, 0) + 1
+                self._modified[table] = now
+            self._changes += 1
+            self._shared = None
+
+        for listener in self._listeners:
+            listener(changed, external)
+
+    def token(self, *tables: str) -> Tuple[int, ...]:
+        """
+        Return a hashable snapshot of the versions of the given tables.
+
+        The token changes whenever any of the tables is written, or when a write
+        from outside this process is detected.
+        """
+        counters = self._counters
+        return (self._generation,) + tuple(counters.get(t, 0) for t in tables)
+
+    def current(self, *tables: str) -> Tuple[int, ...]:
+        """
+        Like :meth:`token`, after checking for writes from other connections.
+        """
+        self.check_external()
+        return self.token(*tables)
+
+    def validator(self, *tables: str) -> Tuple[tuple, float]:
+        """
+        Return a version stamp of the given tables that all processes agree on.
+
+        Tables with a model are read from the ``data_versions`` table; tables
+        without one (such as the search index) are derived from model tables and
+        left out. When a table is not tracked there, the stamp falls back to the
+        size and mtime of the database file and its WAL, which every commit
+        changes, and to the process-local token for in-memory databases, which no
+        other process can open.
+
+        Returns:
+            Tuple[tuple, float]: The stamp and the UNIX timestamp of the most
+            recent change to any of the tables.
+        """
+        from app import db
+
+        tracked = [t for t in tables if t in db.metadata.tables]
+        shared = self._shared_versions()
+        if tracked and all(t in shared for t in tracked):
+            rows = [shared[t] for t in tracked]
+            return tuple(rows), max([modified for _, modified in rows], default=0.0)
+
+        files = _database_files(db.engine.url.database)
+        if files:
+            stats = [os.stat(path) for path in files]
+            return (
+                tuple((st.st_size, st.st_mtime_ns) for st in stats),
+                max(st.st_mtime for st in stats),
+            )
+
+        modified = self._modified
+        return self.token(*tables), max(
+            [self._external_modified] + [modified.get(t, 0.0) for t in tables]
+        )
+
+    def _shared_versions(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Return the rows of the ``data_versions`` table, cached until a bump.
+        """
+        shared = self._shared
+        if shared is not None:
+            return shared
+
+        from app import db
+
+        changes = self._changes
+        shared = data_versions.read(db.session.connection())
+        if not shared and not current_app.config.get("SQLITE_READ_ONLY"):
+            current_app.logger.warning(
+                "Table %s is missing; run 'flask versions install' to create it.",
+                data_versions.TABLE_NAME,
+            )
+        with self._lock:
+            # Keep a snapshot only if no change landed while it was being read
+            if self._changes == changes:
+                self._shared = shared
+        return shared
+
+    def check_external(self, connection: Optional[Connection] = None) -> None:
+        """
+        Compare ``PRAGMA data_version`` with the value last seen on the connection.
+
+        Checks are throttled by the ``DATA_VERSION_CHECK_INTERVAL`` setting
+        (seconds). A connection seen for the first time counts as a change, since
+        nothing is known about what happened before it was opened. Databases opened
+        with ``SQLITE_READ_ONLY`` are immutable and never checked, which also keeps
+        freshly forked workers from discarding what the parent preloaded.
+
+        Args:
+            connection (Optional[Connection]): Connection to probe. Defaults to the
+                connection of the current ``db.session``.
+        """
+        if current_app.config.get("SQLITE_READ_ONLY"):
+            return
+
+        interval = current_app.config.get("DATA_VERSION_CHECK_INTERVAL", 1.0)
+        now = time.monotonic()
+        if interval and now - self._last_check < interval:
+            return
+        self._last_check = now
+
+        if connection is None:
+            from app import db
+
+            connection = db.session.connection()
+
+        if connection.dialect.name != "sqlite":
+            return
+
+        version = connection.execute(text("PRAGMA data_version")).scalar()
+        if connection.info.get(_DATA_VERSION_KEY) != version:
+            connection.info[_DATA_VERSION_KEY] = version
+            self.bump((), external=True)
+
+
+def table_names(*models) -> Tuple[str, ...]:
+    """
+    Return the sorted table names of SQLAlchemy models.
+
+    Tables without a model (such as virtual tables) can be given by name.
+    """
+    return tuple(
+        sorted(
+            model if isinstance(model, str) else model.__tablename__ for model in models
+        )
+    )
+
+
+def _database_files(database: Optional[str]) -> List[str]:
+    """
+    Return the paths of a SQLite database file and its WAL, if they exist.
+    """
+    if not database or database == ":memory:":
+        return []
+    if database.startswith("file:"):
+        database = database[len("file:") :]
+    return [path for path in (database, database + "-wal") if os.path.exists(path)]
+
+
+def _written_tables(statement) -> Set[str]:
+    """
+    Return the names of the tables written by a statement, if any.
+    """
+    if getattr(statement, "is_dml", False):
+        name = getattr(getattr(statement, "table", None), "name", None)
+        return {name} if name else set()
+    if isinstance(statement, (CreateTable, DropTable)):
+        return {statement.element.name}
+    return set()
+
+
+def _record_write(conn, clauseelement, multiparams, params, options, result) -> None:
+    """
+    Stage the tables written by a statement until its transaction ends.
+    """
+    tables = _written_tables(clauseelement)
+    if not tables:
+        return
+    if conn.in_transaction():
+        conn.info.setdefault(_PENDING_KEY, set()).update(tables)
+    else:
+        table_versions.bump(tables)
+
+
+def _flush_pending(conn) -> None:
+    """
+    Publish the staged tables once their transaction commits.
+    """
+    pending = conn.info.pop(_PENDING_KEY, None)
+    if pending:
+        table_versions.bump(pending)
+
+
+def _discard_pending(conn) -> None:
+    """
+    Drop the staged tables when their transaction rolls back.
+    """
+    conn.info.pop(_PENDING_KEY, None)
+
+
+# Shared registry used by the services and HTTP caching layers
+table_versions = TableVersions()
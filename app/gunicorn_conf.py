@@ -0,0 +1,63 @@
+# app/gunicorn_conf.py
+"""
+Gunicorn settings for production serving::
+
+    gunicorn -c python:app.gunicorn_conf
+
+The application, and with it the catalog index, is created once in the master
+(``preload_app``); the ``SERVER_WORKERS`` workers forked from it share that memory
+copy-on-write and serve requests on ``SERVER_THREADS`` threads each. Settings come
+from the configuration class named by ``FLASK_CONFIG``; command line options such as
+``--bind`` or ``--workers`` override them.
+
+Each worker reopens its own database connections in :func:`post_fork`. The other
+per-process state (metrics file, log queue listener, query and response caches)
+is reset by the ``os.register_at_fork`` hooks of the modules that own it.
+"""
+
+import gc
+import os
+
+from werkzeug.utils import import_string
+
+from app.common.logging_config import flush_logging
+
+_config = import_string(
+    os.getenv("FLASK_CONFIG", "app.common.config.DevelopmentConfig")
+)
+
+wsgi_app = "app:create_app()"
+preload_app = True
+bind = f"{_config.SERVER_HOST}:{_config.SERVER_PORT}"
+workers = _config.SERVER_WORKERS
+threads = _config.SERVER_THREADS
+worker_class = "gthread"
+backlog = 2048
+
+
+def when_ready(server) -> None:
+    """
+    Freeze the preloaded objects before the first worker is forked.
+
+    Keeping them out of the collector stops it from dirtying their pages, which
+    would otherwise be copied into every worker.
+    """
+    gc.freeze()
+
+
+def post_fork(server, worker) -> None:
+    """
+    Drop the database connections inherited from the master.
+    """
+    from app import db
+
+    # Pooled connections were opened by the master and must not be shared
+    with worker.app.wsgi().app_context():
+        db.engine.dispose(close=False)
+
+
+def worker_exit(server, worker) -> None:
+    """
+    Write out the worker's queued log records before it exits.
+    """
+    flush_logging()
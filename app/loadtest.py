@@ -0,0 +1,356 @@
+# app/loadtest.py
+"""
+Load generator for sizing worker and thread counts.
+
+Starts the API with gunicorn (``app.gunicorn_conf``) on a free local
+port, or targets a running server with ``--target``, then drives a weighted mix of
+routes and prints throughput and latency percentiles per route as JSON.
+
+Two load models are available:
+
+* closed loop (``--clients N``): N clients each send their next request as soon as
+  the previous one is answered, so the offered load adapts to the server.
+* open loop (``--rps R``): requests start on a fixed schedule, whether or not the
+  earlier ones were answered. Latency is measured from the scheduled start, so
+  queueing behind a saturated server is counted instead of hidden.
+
+Every request deliberately opens its own connection (``Connection: close``), so
+each one pays the connect and accept of a new client and the schedule of one
+request never depends on another's connection. gunicorn's gthread workers do keep
+connections alive, so latencies are an upper bound for clients that reuse them.
+Requests finishing during the ``--warmup`` period are left out of the report.
+
+Usage:
+    python -m app.loadtest [--rps 200 | --clients 50] [--duration 10]
+        [--workers 4] [--threads 8] [--mix artists=4 albums=3 summary=1 tracks=2]
+        [--target http://127.0.0.1:5000] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Route name -> builder of a request path; ids and pages are drawn at random
+ROUTES: Dict[str, Callable[[random.Random], str]] = {
+    "artists": lambda rng: f"/artists?page={rng.randint(1, 10)}",
+    "albums": lambda rng: f"/albums?page={rng.randint(1, 10)}",
+    "summary": lambda rng: "/albums/summary",
+    "tracks": lambda rng: f"/albums/{rng.randint(1, 347)}/tracks",
+}
+
+# Default route weights
+DEFAULT_MIX: Tuple[str, ...] = ("artists=4", "albums=3", "summary=1", "tracks=2")
+
+# Seconds a single request may take before it counts as an error
+REQUEST_TIMEOUT = 30.0
+
+
+class Results:
+    """
+    Latencies and error counts collected per route.
+    """
+
+    def __init__(self, measure_from: float) -> None:
+        self.measure_from = measure_from
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def add(self, route: str, started: float, ok: bool) -> None:
+        """
+        Record a finished request unless it finished during the warm-up.
+        """
+        finished = time.perf_counter()
+        if finished < self.measure_from:
+            return
+        if ok:
+            self.latencies[route].append(finished - started)
+        else:
+            self.errors[route] += 1
+
+    def report(self, duration: float) -> dict:
+        """
+        Summarize the collected requests per route and overall.
+
+        Args:
+            duration (float): Seconds over which the requests were measured.
+        """
+        routes = sorted(self.latencies.keys() | self.errors.keys())
+        everything = [value for route in routes for value in self.latencies[route]]
+        return {
+            "overall": _summary(everything, sum(self.errors.values()), duration),
+            "routes": {
+                route: _summary(self.latencies[route], self.errors[route], duration)
+                for route in routes
+            },
+        }
+
+
+def parse_mix(items: Sequence[str]) -> Tuple[List[str], List[float]]:
+    """
+    Parse ``route=weight`` items into route names and weights.
+
+    Raises:
+        ValueError: If a route is unknown or a weight is not a positive number.
+    """
+    names, weights = [], []
+    for item in items:
+        name, _, weight = item.partition("=")
+        if name not in ROUTES:
+            raise ValueError(f"Unknown route '{name}'. Available: {', '.join(ROUTES)}.")
+        value = float(weight or 1)
+        if value <= 0:
+            raise ValueError(f"Weight of '{name}' must be positive.")
+        names.append(name)
+        weights.append(value)
+    return names, weights
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of sorted values (0.0 when empty).
+    """
+    if not values:
+        return 0.0
+    rank = min(max(math.ceil(fraction * len(values)), 1), len(values))
+    return values[rank - 1]
+
+
+async def fetch(host: str, port: int, path: str) -> bool:
+    """
+    Send one GET request on a new connection and read the whole response.
+
+    Returns:
+        bool: True if the server answered 200 OK.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode()
+        )
+        status = await reader.readline()
+        while await reader.read(65536):
+            pass
+    finally:
+        writer.close()
+    return status.split(b" ", 2)[1:2] == [b"200"]
+
+
+async def run_load(
+    host: str,
+    port: int,
+    mix: Tuple[List[str], List[float]],
+    duration: float,
+    warmup: float,
+    rps: Optional[float] = None,
+    clients: int = 1,
+    seed: int = 0,
+) -> dict:
+    """
+    Drive the server for ``warmup + duration`` seconds and summarize the results.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+        mix (Tuple[List[str], List[float]]): Route names and weights.
+        duration (float): Measured seconds.
+        warmup (float): Seconds of load before measuring.
+        rps (Optional[float]): Open-loop arrival rate; closed loop when None.
+        clients (int): Number of closed-loop clients.
+        seed (int): Seed of the route and parameter choices.
+
+    Returns:
+        dict: The report of :meth:`Results.report`.
+    """
+    rng = random.Random(seed)
+    names, weights = mix
+    started = time.perf_counter()
+    deadline = started + warmup + duration
+    results = Results(started + warmup)
+
+    async def one(route: str, path: str, scheduled: float) -> None:
+        try:
+            ok = await asyncio.wait_for(fetch(host, port, path), REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            ok = False
+        results.add(route, scheduled, ok)
+
+    def pick() -> Tuple[str, str]:
+        route = rng.choices(names, weights)[0]
+        return route, ROUTES[route](rng)
+
+    if rps is None:
+
+        async def client() -> None:
+            while time.perf_counter() < deadline:
+                await one(*pick(), time.perf_counter())
+
+        await asyncio.gather(*(client() for _ in range(clients)))
+    else:
+        pending = set()
+        interval = 1.0 / rps
+        scheduled = started
+        while scheduled < deadline:
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.ensure_future(one(*pick(), scheduled))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            scheduled += interval
+        await asyncio.gather(*pending)
+
+    return results.report(duration)
+
+
+def start_server(workers: int, threads: int) -> Tuple[subprocess.Popen, int]:
+    """
+    Start gunicorn on a free local port and wait until it accepts.
+
+    ``FLASK_CONFIG`` defaults to the production settings, as the development
+    settings log every statement.
+    """
+    port = _free_port()
+    env = dict(os.environ)
+    env.setdefault("FLASK_CONFIG", "app.common.config.ProductionConfig")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config=python:app.gunicorn_conf",
+            f"--bind=127.0.0.1:{port}",
+            f"--workers={workers}",
+            f"--threads={threads}",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("The server exited during startup")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise SystemExit("The server did not start within 30 seconds")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Parse the command line, run the load and print the JSON report.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Load test the Chinook API.")
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--rps", type=float, help="Open-loop target requests/second")
+    load.add_argument(
+        "--clients", type=int, default=10, help="Closed-loop concurrent clients"
+    )
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="Unmeasured seconds")
+    parser.add_argument(
+        "--mix", nargs="+", default=list(DEFAULT_MIX), help="route=weight items"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Server processes")
+    parser.add_argument("--threads", type=int, default=8, help="Threads per process")
+    parser.add_argument("--target", help="URL of a running server to load instead")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the route mix")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    process = None
+    if args.target:
+        target = urlsplit(args.target)
+        host, port = target.hostname or "127.0.0.1", target.port or 80
+    else:
+        process, port = start_server(args.workers, args.threads)
+        host = "127.0.0.1"
+
+    try:
+        report = asyncio.run(
+            run_load(
+                host,
+                port,
+                mix,
+                args.duration,
+                args.warmup,
+                rps=args.rps,
+                clients=args.clients,
+                seed=args.seed,
+            )
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    report["config"] = {
+        "model": "open" if args.rps else "closed",
+        "rps": args.rps,
+        "clients": None if args.rps else args.clients,
+        "duration": args.duration,
+        "warmup": args.warmup,
+        "mix": dict(zip(*mix)),
+        "target": args.target,
+        "workers": None if args.target else args.workers,
+        "threads": None if args.target else args.threads,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+
+
+def _summary(latencies: List[float], errors: int, duration: float) -> dict:
+    """
+    Summarize the latencies (seconds) of one route as milliseconds.
+    """
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / duration, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1e3, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1e3, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1e3, 3),
+        "max_ms": round(latencies[-1] * 1e3, 3) if latencies else 0.0,
+    }
+
+
+def _free_port() -> int:
+    """
+    Ask the OS for an unused TCP port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    main()
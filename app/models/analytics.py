@@ -0,0 +1,202 @@
+# app/models/analytics.py
+"""
+SQL for the ``sales_rollups`` table and the triggers that keep it current.
+
+The table holds one row per (dimension, key): revenue and units sold by track,
+genre, artist, billing country and invoice month. Revenue is stored in integer
+cents so that incremental updates never accumulate rounding errors.
+
+Triggers on ``invoice_items`` apply each new, changed or deleted invoice line to
+the five rows it contributes to, so reads never aggregate the invoice tables.
+Changes that re-attribute existing sales are handled too: an invoice's country or
+date, a track's genre or album, and an album's artist move the affected totals
+between keys. Keys that cannot be resolved (such as a track without a genre) are
+stored as an empty string.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Name of the rollup table, shared with the SalesRollup model
+TABLE_NAME = "sales_rollups"
+
+# Line revenue in cents; prices are NUMERIC(10,2) so rounding to cents is exact
+_LINE_CENTS = "CAST(ROUND({row}.UnitPrice * 100) AS INTEGER) * {row}.Quantity"
+
+# Key of every dimension for an invoice line ``{row}``
+_LINE_KEYS: Dict[str, str] = {
+    "track": "{row}.TrackId",
+    "genre": "(SELECT GenreId FROM tracks WHERE TrackId = {row}.TrackId)",
+    "artist": """(
+        SELECT al.ArtistId FROM tracks t JOIN albums al ON al.AlbumId = t.AlbumId
+        WHERE t.TrackId = {row}.TrackId
+    )""",
+    "country": "(SELECT BillingCountry FROM invoices WHERE InvoiceId = {row}.InvoiceId)",
+    "month": """(
+        SELECT strftime('%Y-%m', InvoiceDate) FROM invoices
+        WHERE InvoiceId = {row}.InvoiceId
+    )""",
+}
+
+# Dimensions that can be read back, in the order they are maintained
+DIMENSIONS = tuple(_LINE_KEYS)
+
+
+def _key(expression: str) -> str:
+    """
+    Normalize a key expression to the stored TEXT form.
+    """
+    return f"COALESCE(CAST({expression} AS TEXT), '')"
+
+
+def _add(dimension: str, key: str, cents: str, quantity: str) -> str:
+    """
+    Return the statement adding ``cents`` and ``quantity`` to one rollup row.
+    """
+    return f"""
+        INSERT INTO {TABLE_NAME} (Dimension, Key, RevenueCents, Quantity)
+        VALUES ('{dimension}', {_key(key)}, {cents}, {quantity})
+        ON CONFLICT (Dimension, Key) DO UPDATE SET
+            RevenueCents = RevenueCents + excluded.RevenueCents,
+            Quantity = Quantity + excluded.Quantity;
+    """
+
+
+def _apply_line(row: str, sign: str) -> str:
+    """
+    Return the statements adding (``+``) or removing (``-``) an invoice line.
+    """
+    cents = f"{sign}{_LINE_CENTS.format(row=row)}"
+    quantity = f"{sign}{row}.Quantity"
+    return "".join(
+        _add(dimension, key.format(row=row), cents, quantity)
+        for dimension, key in _LINE_KEYS.items()
+    )
+
+
+def _move(dimension: str, old_key: str, new_key: str, totals: str) -> str:
+    """
+    Return the statements moving existing sales from one key to another.
+
+    ``totals`` is a SELECT of (cents, quantity) for the sales being moved.
+    """
+    cents = f"COALESCE((SELECT cents FROM ({totals})), 0)"
+    quantity = f"COALESCE((SELECT quantity FROM ({totals})), 0)"
+    return _add(dimension, old_key, f"-{cents}", f"-{quantity}") + _add(
+        dimension, new_key, cents, quantity
+    )
+
+
+# Sales of one invoice, of one track and of the tracks of one album
+_INVOICE_TOTALS = f"""
+    SELECT COALESCE(SUM({_LINE_CENTS.format(row="ii")}), 0) AS cents,
+           COALESCE(SUM(ii.Quantity), 0) AS quantity
+    FROM invoice_items ii WHERE ii.InvoiceId = NEW.InvoiceId
+"""
+_TRACK_TOTALS = f"""
+    SELECT RevenueCents AS cents, Quantity AS quantity FROM {TABLE_NAME}
+    WHERE Dimension = 'track' AND Key = CAST(NEW.TrackId AS TEXT)
+"""
+_ALBUM_TOTALS = f"""
+    SELECT COALESCE(SUM(r.RevenueCents), 0) AS cents,
+           COALESCE(SUM(r.Quantity), 0) AS quantity
+    FROM tracks t JOIN {TABLE_NAME} r
+        ON r.Dimension = 'track' AND r.Key = CAST(t.TrackId AS TEXT)
+    WHERE t.AlbumId = NEW.AlbumId
+"""
+_ARTIST_OF_ALBUM = "(SELECT ArtistId FROM albums WHERE AlbumId = {album})"
+
+
+def _trigger(name: str, event: str, body: str, when: str = "") -> str:
+    """
+    Return the CREATE TRIGGER statement of one maintenance trigger.
+    """
+    condition = f"WHEN {when}" if when else ""
+    return f"""
+    CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_{name}
+    AFTER {event} {condition}
+    BEGIN
+        {body}
+    END
+    """
+
+
+TRIGGERS: List[str] = [
+    _trigger("line_insert", "INSERT ON invoice_items", _apply_line("NEW", "+")),
+    _trigger("line_delete", "DELETE ON invoice_items", _apply_line("OLD", "-")),
+    _trigger(
+        "line_update",
+        "UPDATE OF InvoiceId, TrackId, UnitPrice, Quantity ON invoice_items",
+        _apply_line("OLD", "-") + _apply_line("NEW", "+"),
+    ),
+    _trigger(
+        "invoice_update",
+        "UPDATE OF BillingCountry, InvoiceDate ON invoices",
+        _move("country", "OLD.BillingCountry", "NEW.BillingCountry", _INVOICE_TOTALS)
+        + _move(
+            "month",
+            "strftime('%Y-%m', OLD.InvoiceDate)",
+            "strftime('%Y-%m', NEW.InvoiceDate)",
+            _INVOICE_TOTALS,
+        ),
+    ),
+    _trigger(
+        "track_genre_update",
+        "UPDATE OF GenreId ON tracks",
+        _move("genre", "OLD.GenreId", "NEW.GenreId", _TRACK_TOTALS),
+        when="OLD.GenreId IS NOT NEW.GenreId",
+    ),
+    _trigger(
+        "track_album_update",
+        "UPDATE OF AlbumId ON tracks",
+        _move(
+            "artist",
+            _ARTIST_OF_ALBUM.format(album="OLD.AlbumId"),
+            _ARTIST_OF_ALBUM.format(album="NEW.AlbumId"),
+            _TRACK_TOTALS,
+        ),
+        when="OLD.AlbumId IS NOT NEW.AlbumId",
+    ),
+    _trigger(
+        "album_artist_update",
+        "UPDATE OF ArtistId ON albums",
+        _move("artist", "OLD.ArtistId", "NEW.ArtistId", _ALBUM_TOTALS),
+        when="OLD.ArtistId IS NOT NEW.ArtistId",
+    ),
+]
+
+# Full refresh of the table from the invoice lines
+REBUILD: List[str] = [f"DELETE FROM {TABLE_NAME}"] + [
+    f"""
+    INSERT INTO {TABLE_NAME} (Dimension, Key, RevenueCents, Quantity)
+    SELECT '{dimension}', {_key(key.format(row="ii"))} AS k,
+           SUM({_LINE_CENTS.format(row="ii")}), SUM(ii.Quantity)
+    FROM invoice_items ii
+    GROUP BY k
+    """
+    for dimension, key in _LINE_KEYS.items()
+]
+
+
+def install(connection: Connection, rebuild: bool = True) -> None:
+    """
+    Create the maintenance triggers and optionally repopulate the table.
+
+    Args:
+        connection (Connection): Connection on which the table already exists.
+        rebuild (bool): Whether to recompute every row from the invoice lines.
+    """
+    for statement in TRIGGERS + (REBUILD if rebuild else []):
+        connection.execute(text(statement))
+
+
+def on_metadata_create(metadata, connection: Connection, tables=(), **kw) -> None:
+    """
+    ``after_create`` hook: install the triggers when create_all() made the table.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    if any(table.name == TABLE_NAME for table in tables):
+        install(connection)
@@ -3,7 +3,10 @@
 Database models for the Chinook API application.
 """
 
+from sqlalchemy import event
+
 from app import db
+from app.models import analytics, search, summaries, versions
 
 
 class Artist(db.Model):
@@ -73,3 +76,164 @@ class Track(db.Model):
 
     def __str__(self) -> str:
         return self.Name
+
+
+class AlbumSummary(db.Model):
+    """
+    Materialized album summary (title, artist name and track count).
+
+    Rows are kept up to date incrementally by SQLite triggers on the albums, artists
+    and tracks tables (see :mod:`app.models.summaries`).
+    """
+
+    __tablename__ = "album_summaries"
+
+    AlbumId = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    AlbumTitle = db.Column(db.String(160), nullable=False)
+    ArtistId = db.Column(db.Integer, nullable=False, index=True)
+    ArtistName = db.Column(db.String(120))
+    TrackCount = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<AlbumSummary {self.AlbumId}: {self.TrackCount} tracks>"
+
+    def __str__(self) -> str:
+        return self.AlbumTitle
+
+
+class Playlist(db.Model):
+    """
+    SQLAlchemy model representing a playlist in the Chinook database.
+    """
+
+    __tablename__ = "playlists"
+
+    PlaylistId = db.Column(db.Integer, primary_key=True)
+    Name = db.Column(db.String(120))
+
+    def __repr__(self) -> str:
+        return f"<Playlist {self.PlaylistId}: {self.Name}>"
+
+    def __str__(self) -> str:
+        return self.Name or ""
+
+
+class PlaylistTrack(db.Model):
+    """
+    Membership of a track in a playlist.
+
+    The composite primary key (PlaylistId, TrackId) is the index that pages and
+    streams a playlist's tracks in TrackId order.
+    """
+
+    __tablename__ = "playlist_track"
+
+    PlaylistId = db.Column(
+        db.Integer, db.ForeignKey("playlists.PlaylistId"), primary_key=True
+    )
+    TrackId = db.Column(
+        db.Integer, db.ForeignKey("tracks.TrackId"), primary_key=True, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<PlaylistTrack {self.PlaylistId}: track {self.TrackId}>"
+
+
+class Genre(db.Model):
+    """
+    SQLAlchemy model representing a music genre in the Chinook database.
+    """
+
+    __tablename__ = "genres"
+
+    GenreId = db.Column(db.Integer, primary_key=True)
+    Name = db.Column(db.String(120))
+
+    def __repr__(self) -> str:
+        return f"<Genre {self.GenreId}: {self.Name}>"
+
+    def __str__(self) -> str:
+        return self.Name or ""
+
+
+class Invoice(db.Model):
+    """
+    SQLAlchemy model representing a customer invoice in the Chinook database.
+    """
+
+    __tablename__ = "invoices"
+
+    InvoiceId = db.Column(db.Integer, primary_key=True)
+    CustomerId = db.Column(db.Integer, nullable=False, index=True)
+    InvoiceDate = db.Column(db.DateTime, nullable=False)
+    BillingAddress = db.Column(db.String(70))
+    BillingCity = db.Column(db.String(40))
+    BillingState = db.Column(db.String(40))
+    BillingCountry = db.Column(db.String(40))
+    BillingPostalCode = db.Column(db.String(10))
+    Total = db.Column(db.Numeric(10, 2), nullable=False)
+
+    # One-to-many: an invoice is made of several lines
+    items = db.relationship("InvoiceItem", backref="invoice", lazy=True)
+
+    def __repr__(self) -> str:
+        return f"<Invoice {self.InvoiceId}: {self.Total}>"
+
+
+class InvoiceItem(db.Model):
+    """
+    SQLAlchemy model representing one line of an invoice: a track sold.
+    """
+
+    __tablename__ = "invoice_items"
+
+    InvoiceLineId = db.Column(db.Integer, primary_key=True)
+    InvoiceId = db.Column(
+        db.Integer, db.ForeignKey("invoices.InvoiceId"), nullable=False, index=True
+    )
+    TrackId = db.Column(
+        db.Integer, db.ForeignKey("tracks.TrackId"), nullable=False, index=True
+    )
+    UnitPrice = db.Column(db.Numeric(10, 2), nullable=False)
+    Quantity = db.Column(db.Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<InvoiceItem {self.InvoiceLineId}: track {self.TrackId}>"
+
+
+class SalesRollup(db.Model):
+    """
+    Precomputed sales totals (revenue in cents and units) per dimension and key.
+
+    Dimensions are track, genre, artist, country and month. Rows are kept up to
+    date incrementally by SQLite triggers on the invoice, track and album tables
+    (see :mod:`app.models.analytics`).
+    """
+
+    __tablename__ = "sales_rollups"
+    __table_args__ = (
+        db.Index("ix_sales_rollups_revenue", "Dimension", "RevenueCents"),
+        db.Index("ix_sales_rollups_quantity", "Dimension", "Quantity"),
+    )
+
+    Dimension = db.Column(db.String(16), primary_key=True)
+    Key = db.Column(db.String(40), primary_key=True)
+    RevenueCents = db.Column(db.Integer, nullable=False, default=0)
+    Quantity = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<SalesRollup {self.Dimension}={self.Key}: {self.RevenueCents}>"
+
+
+# Track the version of every table create_all() creates
+event.listen(db.metadata, "after_create", versions.on_metadata_create)
+
+# Install the summary triggers whenever create_all() creates the summary table
+event.listen(db.metadata, "after_create", summaries.on_metadata_create)
+
+# Install the sales rollup triggers whenever create_all() creates the rollup table
+event.listen(db.metadata, "after_create", analytics.on_metadata_create)
+
+# Keep the full-text search index alongside the catalog tables it mirrors
+event.listen(db.metadata, "after_create", search.on_metadata_create)
+event.listen(db.metadata, "after_drop", search.on_metadata_drop)
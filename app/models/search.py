@@ -0,0 +1,145 @@
+# app/models/search.py
+"""
+SQL for the ``search_index`` FTS5 table and its maintenance triggers.
+
+One index row exists per artist, album and track. Its rowid encodes the kind and
+id of the source row (``id * 4 + kind``), so triggers can update or remove the
+entry of a changed row without a lookup, and results can be filtered by kind with
+``rowid % 4``. ``name`` holds the artist name, album title or track name;
+``composer`` is only set for tracks.
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Name of the FTS5 virtual table
+TABLE_NAME = "search_index"
+
+# Kind of an indexed row, stored in the low bits of its rowid
+KINDS: Dict[str, int] = {"artist": 1, "album": 2, "track": 3}
+
+# Multiplier applied to source ids so the kind fits in the remainder
+ROWID_STRIDE = 4
+
+# Prefix indexes on 2 and 3 characters keep short type-ahead queries cheap
+CREATE = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE_NAME} USING fts5(
+        name,
+        composer,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+"""
+
+DROP = f"DROP TABLE IF EXISTS {TABLE_NAME}"
+
+# (kind, source table, id column, name column, composer expression)
+_SOURCES = [
+    ("artist", "artists", "ArtistId", "Name", "NULL"),
+    ("album", "albums", "AlbumId", "Title", "NULL"),
+    ("track", "tracks", "TrackId", "Name", "{row}.Composer"),
+]
+
+
+def _rowid(kind: str, row: str, id_column: str) -> str:
+    """
+    Return the SQL expression of the index rowid of a source row.
+    """
+    return f"{row}.{id_column} * {ROWID_STRIDE} + {KINDS[kind]}"
+
+
+def _insert(kind: str, id_column: str, name: str, composer: str, row: str) -> str:
+    """
+    Return the statement indexing the source row ``row`` (NEW in triggers).
+    """
+    return (
+        f"INSERT INTO {TABLE_NAME} (rowid, name, composer) VALUES "
+        f"({_rowid(kind, row, id_column)}, {row}.{name}, "
+        f"{composer.format(row=row)});"
+    )
+
+
+def _delete(kind: str, id_column: str, row: str) -> str:
+    """
+    Return the statement removing the index entry of the source row ``row``.
+    """
+    return f"DELETE FROM {TABLE_NAME} WHERE rowid = {_rowid(kind, row, id_column)};"
+
+
+def _triggers() -> List[str]:
+    """
+    Build the insert, update and delete triggers of every source table.
+    """
+    triggers = []
+    for kind, table, id_column, name, composer in _SOURCES:
+        columns = ", ".join(
+            [id_column, name] + (["Composer"] if kind == "track" else [])
+        )
+        triggers += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_{table}_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                {_insert(kind, id_column, name, composer, "NEW")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_{table}_update
+            AFTER UPDATE OF {columns} ON {table}
+            BEGIN
+                {_delete(kind, id_column, "OLD")}
+                {_insert(kind, id_column, name, composer, "NEW")}
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_{table}_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                {_delete(kind, id_column, "OLD")}
+            END
+            """,
+        ]
+    return triggers
+
+
+TRIGGERS: List[str] = _triggers()
+
+# Full refresh of the index from the source tables
+REBUILD: List[str] = [f"DELETE FROM {TABLE_NAME}"] + [
+    f"INSERT INTO {TABLE_NAME} (rowid, name, composer) "
+    f"SELECT {_rowid(kind, table, id_column)}, {table}.{name}, "
+    f"{composer.format(row=table)} FROM {table}"
+    for kind, table, id_column, name, composer in _SOURCES
+]
+
+
+def install(connection: Connection, rebuild: bool = True) -> None:
+    """
+    Create the index and its triggers if needed and optionally repopulate it.
+
+    Args:
+        connection (Connection): Connection to a database with the source tables.
+        rebuild (bool): Whether to reindex every row of the source tables.
+    """
+    for statement in [CREATE] + TRIGGERS + (REBUILD if rebuild else []):
+        connection.execute(text(statement))
+
+
+def on_metadata_create(metadata, connection: Connection, tables=(), **kw) -> None:
+    """
+    ``after_create`` hook: index the catalog when create_all() made its tables.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    if any(table.name == "tracks" for table in tables):
+        install(connection)
+
+
+def on_metadata_drop(metadata, connection: Connection, **kw) -> None:
+    """
+    ``after_drop`` hook: drop the index along with the tables it mirrors.
+    """
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(DROP))
@@ -0,0 +1,133 @@
+# app/models/summaries.py
+"""
+SQL for the materialized ``album_summaries`` table and its maintenance triggers.
+
+The triggers apply every insert, update and delete on albums, artists and tracks to
+the affected summary rows only, so the table never needs a full GROUP BY after it
+has been built. A row exists for every album whose artist exists; albums without
+tracks keep a ``TrackCount`` of 0.
+"""
+
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# Name of the materialized table, shared with the AlbumSummary model
+TABLE_NAME = "album_summaries"
+
+# Recompute the summary rows of the albums selected by a WHERE clause
+_UPSERT_ALBUMS = """
+    INSERT OR REPLACE INTO album_summaries
+        (AlbumId, AlbumTitle, ArtistId, ArtistName, TrackCount)
+    SELECT al.AlbumId, al.Title, ar.ArtistId, ar.Name,
+           (SELECT COUNT(*) FROM tracks t WHERE t.AlbumId = al.AlbumId)
+    FROM albums al
+    JOIN artists ar ON ar.ArtistId = al.ArtistId
+    WHERE {where};
+"""
+
+TRIGGERS: List[str] = [
+    """
+    CREATE TRIGGER IF NOT EXISTS album_summaries_track_insert
+    AFTER INSERT ON tracks
+    BEGIN
+        UPDATE album_summaries SET TrackCount = TrackCount + 1
+        WHERE AlbumId = NEW.AlbumId;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS album_summaries_track_delete
+    AFTER DELETE ON tracks
+    BEGIN
+        UPDATE album_summaries SET TrackCount = TrackCount - 1
+        WHERE AlbumId = OLD.AlbumId;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS album_summaries_track_move
+    AFTER UPDATE OF AlbumId ON tracks
+    WHEN OLD.AlbumId IS NOT NEW.AlbumId
+    BEGIN
+        UPDATE album_summaries SET TrackCount = TrackCount - 1
+        WHERE AlbumId = OLD.AlbumId;
+        UPDATE album_summaries SET TrackCount = TrackCount + 1
+        WHERE AlbumId = NEW.AlbumId;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS album_summaries_album_insert
+    AFTER INSERT ON albums
+    BEGIN
+        {_UPSERT_ALBUMS.format(where="al.AlbumId = NEW.AlbumId")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS album_summaries_album_update
+    AFTER UPDATE OF AlbumId, Title, ArtistId ON albums
+    BEGIN
+        DELETE FROM album_summaries WHERE AlbumId = OLD.AlbumId;
+        {_UPSERT_ALBUMS.format(where="al.AlbumId = NEW.AlbumId")}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS album_summaries_album_delete
+    AFTER DELETE ON albums
+    BEGIN
+        DELETE FROM album_summaries WHERE AlbumId = OLD.AlbumId;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS album_summaries_artist_insert
+    AFTER INSERT ON artists
+    BEGIN
+        {_UPSERT_ALBUMS.format(where="al.ArtistId = NEW.ArtistId")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS album_summaries_artist_update
+    AFTER UPDATE OF ArtistId, Name ON artists
+    BEGIN
+        DELETE FROM album_summaries WHERE ArtistId = OLD.ArtistId;
+        {_UPSERT_ALBUMS.format(where="al.ArtistId = NEW.ArtistId")}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS album_summaries_artist_delete
+    AFTER DELETE ON artists
+    BEGIN
+        DELETE FROM album_summaries WHERE ArtistId = OLD.ArtistId;
+    END
+    """,
+]
+
+# Full refresh of the table from the source tables
+REBUILD: List[str] = [
+    "DELETE FROM album_summaries",
+    _UPSERT_ALBUMS.format(where="1 = 1"),
+]
+
+
+def install(connection: Connection, rebuild: bool = True) -> None:
+    """
+    Create the maintenance triggers and optionally repopulate the table.
+
+    Args:
+        connection (Connection): Connection on which the table already exists.
+        rebuild (bool): Whether to recompute every row from the source tables.
+    """
+    for statement in TRIGGERS + (REBUILD if rebuild else []):
+        connection.execute(text(statement))
+
+
+def on_metadata_create(metadata, connection: Connection, tables=(), **kw) -> None:
+    """
+    ``after_create`` hook: install the triggers when create_all() made the table.
+
+    The table is populated right away so that creating it against an existing
+    database does not leave it empty.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    if any(table.name == TABLE_NAME for table in tables):
+        install(connection)
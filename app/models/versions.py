@@ -0,0 +1,91 @@
+# app/models/versions.py
+"""
+SQL for the ``data_versions`` table and the triggers that keep it current.
+
+The table holds one row per tracked table: a counter and the UNIX time of its last
+change. Triggers on each tracked table bump its row inside the writing transaction,
+so every process sharing the database file reads the same versions, whichever
+connection made the change.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+# Name of the version table
+TABLE_NAME = "data_versions"
+
+# Current UNIX time in SQL, with millisecond precision
+_NOW = "(julianday('now') - 2440587.5) * 86400.0"
+
+_CREATE_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+        Name TEXT PRIMARY KEY,
+        Version INTEGER NOT NULL,
+        Modified REAL NOT NULL
+    )
+"""
+
+# Creating (or re-creating) a table counts as a change to it
+_TOUCH = f"""
+    INSERT INTO {TABLE_NAME} (Name, Version, Modified) VALUES (:name, 1, {_NOW})
+    ON CONFLICT (Name) DO UPDATE
+    SET Version = Version + 1, Modified = excluded.Modified
+"""
+
+_TRIGGER = """
+    CREATE TRIGGER IF NOT EXISTS {table_name}_{table}_{event}
+    AFTER {event} ON "{table}"
+    BEGIN
+        UPDATE {table_name} SET Version = Version + 1, Modified = {now}
+        WHERE Name = '{table}';
+    END
+"""
+
+
+def install(connection: Connection, tables: Iterable[str]) -> None:
+    """
+    Create the version table if needed and start tracking the given tables.
+
+    Args:
+        connection (Connection): Connection on which the tables already exist.
+        tables (Iterable[str]): Names of regular (not virtual) tables to track.
+    """
+    connection.execute(text(_CREATE_TABLE))
+    for table in tables:
+        connection.execute(text(_TOUCH), {"name": table})
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            connection.execute(
+                text(
+                    _TRIGGER.format(
+                        table_name=TABLE_NAME, table=table, event=event, now=_NOW
+                    )
+                )
+            )
+
+
+def read(connection: Connection) -> Dict[str, Tuple[int, float]]:
+    """
+    Return ``{table: (version, modified)}`` for every tracked table.
+
+    Returns:
+        Dict[str, Tuple[int, float]]: Empty when the version table does not exist.
+    """
+    try:
+        rows = connection.execute(
+            text(f"SELECT Name, Version, Modified FROM {TABLE_NAME}")
+        )
+    except OperationalError:
+        return {}
+    return {name: (version, modified) for name, version, modified in rows}
+
+
+def on_metadata_create(metadata, connection: Connection, tables=(), **kw) -> None:
+    """
+    ``after_create`` hook: track every table create_all() made.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    install(connection, [table.name for table in tables])
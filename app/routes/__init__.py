@@ -18,14 +18,22 @@ def register_blueprints(app: Flask) -> None:
     # Import blueprints locally to avoid circular dependencies
     from app.routes.artists import artists_bp
     from app.routes.albums import albums_bp
+    from app.routes.playlists import playlists_bp
+    from app.routes.search import search_bp
+    from app.routes.analytics import analytics_bp
+    from app.routes.metrics import metrics_bp
 
     # Define list of (blueprint, URL prefix) tuples
     blueprints: List[Tuple[Blueprint, str]] = [
         (artists_bp, "/artists"),
         (albums_bp, "/albums"),
+        (playlists_bp, "/playlists"),
+        (search_bp, "/search"),
+        (analytics_bp, "/analytics"),
+        (metrics_bp, "/metrics"),
     ]
 
     # Register each blueprint with the app and its corresponding URL prefix
     for blueprint, prefix in blueprints:
         app.register_blueprint(blueprint, url_prefix=prefix)
-        app.logger.debug(f"Registered blueprint: {prefix}")
+        app.logger.debug("Registered blueprint: %s", prefix)
@@ -3,33 +3,78 @@
 Albums API routes for listing albums and their associated tracks or summary data.
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from werkzeug.exceptions import NotFound
 
+from app.common.batch import get_ids
+from app.common.fieldsets import get_fields, get_include
+from app.common.formats import render
+from app.common.http_cache import conditional
+from app.common.pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_count_mode,
+    get_limit,
+    get_page_args,
+    is_cursor_request,
+)
+from app.common.streaming import get_stream_format, stream_response
+from app.models.models import Artist, Album, Track, AlbumSummary
 from app.services.services import (
+    ALBUM_FIELDS,
+    album_models,
     get_all_albums_with_tracks,
+    get_albums_with_tracks_after,
     get_tracks_by_album,
+    get_tracks_by_albums,
     get_album_summaries,
+    iter_album_summaries,
+    iter_albums_with_tracks,
 )
 from app.schemas.albums_schema import AlbumSchema
 from app.schemas.track_schema import TrackSchema
 from app.schemas.albums_summary_schema import AlbumSummarySchema
+from app.schemas.serializers import compile_serializer, serializer_for
 
 albums_bp = Blueprint("albums", __name__)
-album_schema = AlbumSchema(many=True)
-track_schema = TrackSchema(many=True)
-album_summary_schema = AlbumSummarySchema(many=True)
+dump_tracks = compile_serializer(TrackSchema(many=True))
+dump_album_summaries = compile_serializer(AlbumSummarySchema(many=True))
+dump_album = compile_serializer(AlbumSchema())
+dump_album_summary = compile_serializer(AlbumSummarySchema())
 
 
 @albums_bp.route("", methods=["GET"])
+@conditional(depends=lambda: album_models(_include_tracks()))
 def get_albums() -> tuple:
     """
     Retrieve a paginated list of albums with their associated tracks.
 
+    Supports offset pagination (``page``/``per_page``) and keyset pagination
+    (``after``/``limit``). Sending either ``after`` or ``limit`` switches to
+    keyset mode, which returns an opaque ``next_cursor`` instead of ``total``.
+
+    ``fields`` limits the selected and returned album columns. Tracks are included
+    by default; ``include=`` (empty) skips the track query altogether.
+
     ---
     tags:
       - Albums
+    produces:
+      - application/json
+      - application/msgpack
+      - text/csv
     parameters:
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated album fields to return (AlbumId, Title)
+      - name: include
+        in: query
+        type: string
+        required: false
+        default: tracks
+        description: Related resources to nest; send it empty to omit tracks
       - name: page
         in: query
         type: integer
@@ -41,7 +86,25 @@ def get_albums() -> tuple:
         type: integer
         required: false
         default: 20
-        description: Number of results per page
+        description: Number of results per page (max 100)
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        enum: [exact, estimate, none]
+        description: How to compute total (cached exact count, estimate, or skip)
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor returned as next_cursor by the previous keyset page
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        default: 20
+        description: Number of results per keyset page (max 100)
     responses:
       200:
         description: Paginated list of albums with their tracks
@@ -54,6 +117,10 @@ def get_albums() -> tuple:
               type: integer
             per_page:
               type: integer
+            limit:
+              type: integer
+            next_cursor:
+              type: string
             albums:
               type: array
               items:
@@ -78,25 +145,51 @@ def get_albums() -> tuple:
           Name:
             type: string
     """
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    fields = get_fields(ALBUM_FIELDS)
+    include_tracks = _include_tracks()
+    dump_albums = serializer_for(
+        AlbumSchema, fields + ("tracks",) if include_tracks else fields
+    )
+
+    if is_cursor_request():
+        limit = get_limit()
+        albums, next_key = get_albums_with_tracks_after(
+            decode_cursor(request.args.get("after")), limit, fields, include_tracks
+        )
+        return (
+            render(
+                {
+                    "limit": limit,
+                    "next_cursor": encode_cursor(next_key),
+                    "albums": dump_albums(albums),
+                },
+                "albums",
+            ),
+            200,
+        )
 
-    albums, total = get_all_albums_with_tracks(page, per_page)
+    page, per_page = get_page_args()
+
+    albums, total = get_all_albums_with_tracks(
+        page, per_page, get_count_mode(), fields, include_tracks
+    )
 
     return (
-        jsonify(
+        render(
             {
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "albums": album_schema.dump(albums),
-            }
+                "albums": dump_albums(albums),
+            },
+            "albums",
         ),
         200,
     )
 
 
 @albums_bp.route("/<int:album_id>/tracks", methods=["GET"])
+@conditional(Album, Track)
 def get_album_tracks(album_id: int) -> tuple:
     """
     Retrieve a list of tracks for a given album.
@@ -126,17 +219,104 @@ def get_album_tracks(album_id: int) -> tuple:
         description: Album not found
     """
     tracks = get_tracks_by_album(album_id)
-    return jsonify({"album_id": album_id, "tracks": track_schema.dump(tracks)}), 200
+    return jsonify({"album_id": album_id, "tracks": dump_tracks(tracks)}), 200
+
+
+@albums_bp.route("/tracks", methods=["GET"])
+@conditional(Album, Track)
+def get_albums_tracks() -> tuple:
+    """
+    Retrieve the tracks of several albums in one request.
+
+    All albums are resolved with a single query. Results follow the order of
+    ``ids``; albums that do not exist are reported with a per-item 404 while the
+    others are still returned.
+
+    ---
+    tags:
+      - Albums
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: true
+        description: Comma-separated album IDs (at most 100)
+    responses:
+      200:
+        description: Tracks of every requested album, or a per-album error
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  album_id:
+                    type: integer
+                  status:
+                    type: integer
+                  tracks:
+                    type: array
+                    items:
+                      $ref: '#/definitions/Track'
+                  error:
+                    type: string
+                  message:
+                    type: string
+      400:
+        description: Missing, malformed or too many ids
+    """
+    ids = get_ids()
+    tracks = get_tracks_by_albums(tuple(sorted(ids)))
+
+    results = []
+    for album_id in ids:
+        if album_id in tracks:
+            results.append(
+                {
+                    "album_id": album_id,
+                    "status": 200,
+                    "tracks": dump_tracks(tracks[album_id]),
+                }
+            )
+        else:
+            results.append(
+                {
+                    "album_id": album_id,
+                    "status": 404,
+                    "error": "Not Found",
+                    "message": f"Album with ID {album_id} not found.",
+                }
+            )
+    return jsonify({"results": results}), 200
 
 
 @albums_bp.route("/summary", methods=["GET"])
+@conditional(Album, Artist, Track, AlbumSummary)
 def get_album_summary() -> tuple:
     """
     Retrieve a summary of all albums with artist name and track count.
 
+    With ``?stream=1`` (chunked JSON array), ``?stream=ndjson`` or
+    ``Accept: application/x-ndjson`` the rows are fetched in batches and written
+    as they are serialized, so memory does not grow with the catalog.
+
     ---
     tags:
       - Albums
+    produces:
+      - application/json
+      - application/x-ndjson
+      - application/msgpack
+      - text/csv
+    parameters:
+      - name: stream
+        in: query
+        type: string
+        required: false
+        enum: ["1", ndjson]
+        description: Stream the response as a chunked JSON array or as NDJSON
     responses:
       200:
         description: List of album summaries
@@ -157,5 +337,54 @@ def get_album_summary() -> tuple:
           TrackCount:
             type: integer
     """
+    stream_format = get_stream_format()
+    if stream_format:
+        rows = iter_album_summaries(current_app.config["STREAM_BATCH_SIZE"])
+        return (
+            stream_response(map(dump_album_summary, rows), stream_format),
+            200,
+        )
+
     summaries = get_album_summaries()
-    return jsonify(album_summary_schema.dump(summaries)), 200
+    return render(dump_album_summaries(summaries)), 200
+
+
+@albums_bp.route("/export", methods=["GET"])
+@conditional(Album, Track)
+def export_albums() -> tuple:
+    """
+    Stream every album with its tracks.
+
+    Writes NDJSON (one album per line) by default, or a chunked JSON array with
+    ``?stream=1``. Memory use is constant regardless of the catalog size.
+
+    ---
+    tags:
+      - Albums
+    produces:
+      - application/x-ndjson
+      - application/json
+    parameters:
+      - name: stream
+        in: query
+        type: string
+        required: false
+        default: ndjson
+        enum: ["1", ndjson]
+        description: Output as NDJSON or as a chunked JSON array
+    responses:
+      200:
+        description: Every album with its tracks
+        schema:
+          $ref: '#/definitions/Album'
+    """
+    stream_format = get_stream_format() or "ndjson"
+    albums = iter_albums_with_tracks(current_app.config["STREAM_BATCH_SIZE"])
+    return stream_response(map(dump_album, albums), stream_format), 200
+
+
+def _include_tracks() -> bool:
+    """
+    Tell whether the album list should nest tracks (the default).
+    """
+    return "tracks" in get_include(("tracks",), default=("tracks",))
@@ -0,0 +1,170 @@
+# app/routes/analytics.py
+"""
+Analytics API routes for sales reports computed from invoices.
+"""
+
+from typing import Optional
+
+from flask import Blueprint, request
+from werkzeug.exceptions import BadRequest, NotFound
+
+from app.common.formats import render
+from app.common.http_cache import conditional
+from app.common.pagination import MAX_PAGE_SIZE
+from app.models.models import (
+    Album,
+    Artist,
+    Genre,
+    Invoice,
+    InvoiceItem,
+    SalesRollup,
+    Track,
+)
+from app.schemas.sales_schema import SalesSchema
+from app.schemas.serializers import compile_serializer
+from app.services.analytics import TOP_TRACKS_ORDERS, get_sales
+
+analytics_bp = Blueprint("analytics", __name__)
+dump_sales = compile_serializer(SalesSchema(many=True))
+
+# URL segment -> rollup dimension of the revenue reports
+REVENUE_DIMENSIONS = {
+    "genres": "genre",
+    "artists": "artist",
+    "countries": "country",
+    "months": "month",
+}
+
+# Number of tracks returned by the top tracks report by default
+DEFAULT_TOP_TRACKS: int = 10
+
+SALES_MODELS = (SalesRollup, Invoice, InvoiceItem, Track, Album, Artist, Genre)
+
+
+@analytics_bp.route("/revenue/<string:dimension>", methods=["GET"])
+@conditional(*SALES_MODELS)
+def get_revenue(dimension: str) -> tuple:
+    """
+    Retrieve revenue and units sold per genre, artist, billing country or month.
+
+    Served from precomputed rollups that are updated as invoices are written.
+    Months are returned in chronological order, the other reports best-selling
+    first.
+
+    ---
+    tags:
+      - Analytics
+    produces:
+      - application/json
+      - application/msgpack
+      - text/csv
+    parameters:
+      - name: dimension
+        in: path
+        type: string
+        required: true
+        enum: [genres, artists, countries, months]
+        description: What to group revenue by
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Maximum number of rows to return (all by default)
+    responses:
+      200:
+        description: Revenue per key
+        schema:
+          type: array
+          items:
+            $ref: '#/definitions/Sales'
+      404:
+        description: Unknown dimension
+      503:
+        description: The sales rollups have not been built
+    definitions:
+      Sales:
+        type: object
+        properties:
+          Key:
+            description: Genre or artist ID, country, or month (YYYY-MM)
+          Name:
+            type: string
+          Revenue:
+            type: number
+          Quantity:
+            type: integer
+    """
+    if dimension not in REVENUE_DIMENSIONS:
+        raise NotFound(
+            f"Unknown revenue dimension '{dimension}'. "
+            f"Available: {', '.join(REVENUE_DIMENSIONS)}."
+        )
+
+    rollup = REVENUE_DIMENSIONS[dimension]
+    order = "key" if rollup == "month" else "revenue"
+    sales = get_sales(rollup, _get_optional_limit(), order)
+    return render(dump_sales(sales)), 200
+
+
+@analytics_bp.route("/tracks/top", methods=["GET"])
+@conditional(*SALES_MODELS)
+def get_top_tracks() -> tuple:
+    """
+    Retrieve the best-selling tracks by revenue or by units sold.
+
+    ---
+    tags:
+      - Analytics
+    produces:
+      - application/json
+      - application/msgpack
+      - text/csv
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        default: 10
+        description: Number of tracks to return (max 100)
+      - name: by
+        in: query
+        type: string
+        required: false
+        default: revenue
+        enum: [revenue, quantity]
+        description: Ranking criterion
+    responses:
+      200:
+        description: Top tracks, best first; Key is the TrackId
+        schema:
+          type: array
+          items:
+            $ref: '#/definitions/Sales'
+      400:
+        description: Unknown ranking criterion
+      503:
+        description: The sales rollups have not been built
+    """
+    order = request.args.get("by", "revenue")
+    if order not in TOP_TRACKS_ORDERS:
+        raise BadRequest(f"by must be one of: {', '.join(TOP_TRACKS_ORDERS)}.")
+
+    limit = request.args.get("limit", default=DEFAULT_TOP_TRACKS, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    return render(dump_sales(get_sales("track", limit, order))), 200
+
+
+def _get_optional_limit() -> Optional[int]:
+    """
+    Read the optional ``limit`` query argument.
+
+    Raises:
+        BadRequest: If the limit is not a positive integer.
+    """
+    if "limit" not in request.args:
+        return None
+
+    limit = request.args.get("limit", type=int)
+    if limit is None or limit < 1:
+        raise BadRequest("limit must be a positive integer.")
+    return limit
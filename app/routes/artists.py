@@ -5,24 +5,70 @@ Artists API routes for listing and managing artist resources.
 
 from flask import Blueprint, jsonify, request
 
-from app.services.services import get_all_artists, get_albums_by_artist
-from app.schemas.artists_schema import ArtistSchema
+from app.common.batch import get_ids
+from app.common.fieldsets import get_fields, get_include
+from app.common.formats import render
+from app.common.http_cache import conditional
+from app.common.pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_count_mode,
+    get_limit,
+    get_page_args,
+    is_cursor_request,
+)
+from app.models.models import Artist, Album, Track
+from app.services.services import (
+    ALBUM_FIELDS,
+    ARTIST_FIELDS,
+    artist_models,
+    get_all_artists,
+    get_artists_after,
+    get_albums_by_artist,
+    get_albums_by_artists,
+)
+from app.schemas.artists_schema import ArtistWithAlbumsSchema
 from app.schemas.albums_schema import AlbumSchema
+from app.schemas.serializers import serializer_for
 
 artists_bp = Blueprint("artists", __name__)
-artist_schema = ArtistSchema(many=True)
-album_schema = AlbumSchema(many=True, only=("AlbumId", "Title"))
+
+# Related resources that can be nested under an artist
+ARTIST_INCLUDES = ("albums", "albums.tracks")
 
 
 @artists_bp.route("", methods=["GET"])
+@conditional(depends=lambda: artist_models(get_include(ARTIST_INCLUDES)))
 def get_artists() -> tuple:
     """
     Retrieve and return a paginated list of all artists.
 
+    Supports offset pagination (``page``/``per_page``) and keyset pagination
+    (``after``/``limit``). Sending either ``after`` or ``limit`` switches to
+    keyset mode, which returns an opaque ``next_cursor`` instead of ``total``.
+
+    ``fields`` limits the selected and returned artist columns, and
+    ``include=albums`` or ``include=albums.tracks`` nests related resources.
+
     ---
     tags:
       - Artists
+    produces:
+      - application/json
+      - application/msgpack
+      - text/csv
     parameters:
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated artist fields to return (ArtistId, Name)
+      - name: include
+        in: query
+        type: string
+        required: false
+        enum: [albums, albums.tracks]
+        description: Nest the artist's albums, optionally with their tracks
       - name: page
         in: query
         type: integer
@@ -35,6 +81,24 @@ def get_artists() -> tuple:
         required: false
         default: 20
         description: Number of items per page
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        enum: [exact, estimate, none]
+        description: How to compute total (cached exact count, estimate, or skip)
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor returned as next_cursor by the previous keyset page
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        default: 20
+        description: Number of items per keyset page (max 100)
     responses:
       200:
         description: Paginated list of artists.
@@ -50,6 +114,12 @@ def get_artists() -> tuple:
             per_page:
               type: integer
               description: Number of items per page.
+            limit:
+              type: integer
+              description: Number of items per keyset page.
+            next_cursor:
+              type: string
+              description: Cursor for the next keyset page, null on the last page.
             artists:
               type: array
               items:
@@ -62,30 +132,59 @@ def get_artists() -> tuple:
             type: integer
           Name:
             type: string
+          albums:
+            type: array
+            items:
+              $ref: '#/definitions/Album'
     """
-    page = request.args.get("page", default=1, type=int)
-    per_page = request.args.get("per_page", default=20, type=int)
+    fields = get_fields(ARTIST_FIELDS)
+    include = get_include(ARTIST_INCLUDES)
+    dump_artists = _artist_serializer(fields, include)
+
+    if is_cursor_request():
+        limit = get_limit()
+        artists, next_key = get_artists_after(
+            decode_cursor(request.args.get("after")), limit, fields, include
+        )
+        return (
+            render(
+                {
+                    "limit": limit,
+                    "next_cursor": encode_cursor(next_key),
+                    "artists": dump_artists(artists),
+                },
+                "artists",
+            ),
+            200,
+        )
+
+    page, per_page = get_page_args()
 
-    artists, total = get_all_artists(page, per_page)
+    artists, total = get_all_artists(page, per_page, get_count_mode(), fields, include)
 
     return (
-        jsonify(
+        render(
             {
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "artists": artist_schema.dump(artists),
-            }
+                "artists": dump_artists(artists),
+            },
+            "artists",
         ),
         200,
     )
 
 
 @artists_bp.route("/<int:artist_id>/albums", methods=["GET"])
+@conditional(Artist, Album, Track)
 def get_artist_albums(artist_id: int) -> tuple:
     """
     Retrieve all albums for a specific artist.
 
+    ``fields`` limits the returned album columns and ``include=tracks`` nests
+    each album's tracks.
+
     ---
     tags:
       - Artists
@@ -95,6 +194,17 @@ def get_artist_albums(artist_id: int) -> tuple:
         required: true
         type: integer
         description: The ID of the artist
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated album fields to return (AlbumId, Title)
+      - name: include
+        in: query
+        type: string
+        required: false
+        enum: [tracks]
+        description: Nest each album's tracks
     responses:
       200:
         description: List of albums for the artist
@@ -113,5 +223,112 @@ def get_artist_albums(artist_id: int) -> tuple:
           Title:
             type: string
     """
-    albums = get_albums_by_artist(artist_id)
-    return jsonify(album_schema.dump(albums)), 200
+    fields = get_fields(ALBUM_FIELDS)
+    include_tracks = "tracks" in get_include(("tracks",))
+
+    albums = get_albums_by_artist(artist_id, fields, include_tracks)
+    dump_albums = serializer_for(
+        AlbumSchema, fields + ("tracks",) if include_tracks else fields
+    )
+    return jsonify(dump_albums(albums)), 200
+
+
+@artists_bp.route("/albums", methods=["GET"])
+@conditional(Artist, Album, Track)
+def get_artists_albums() -> tuple:
+    """
+    Retrieve the albums of several artists in one request.
+
+    All artists are resolved with a single query. Results follow the order of
+    ``ids``; artists that do not exist are reported with a per-item 404 while the
+    others are still returned. ``fields`` and ``include=tracks`` work as on
+    ``/artists/<artist_id>/albums``.
+
+    ---
+    tags:
+      - Artists
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: true
+        description: Comma-separated artist IDs (at most 100)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated album fields to return (AlbumId, Title)
+      - name: include
+        in: query
+        type: string
+        required: false
+        enum: [tracks]
+        description: Nest each album's tracks
+    responses:
+      200:
+        description: Albums of every requested artist, or a per-artist error
+        schema:
+          type: object
+          properties:
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  artist_id:
+                    type: integer
+                  status:
+                    type: integer
+                  albums:
+                    type: array
+                    items:
+                      $ref: '#/definitions/Album'
+                  error:
+                    type: string
+                  message:
+                    type: string
+      400:
+        description: Missing, malformed or too many ids
+    """
+    ids = get_ids()
+    fields = get_fields(ALBUM_FIELDS)
+    include_tracks = "tracks" in get_include(("tracks",))
+
+    albums = get_albums_by_artists(tuple(sorted(ids)), fields, include_tracks)
+    dump_albums = serializer_for(
+        AlbumSchema, fields + ("tracks",) if include_tracks else fields
+    )
+
+    results = []
+    for artist_id in ids:
+        if artist_id in albums:
+            results.append(
+                {
+                    "artist_id": artist_id,
+                    "status": 200,
+                    "albums": dump_albums(albums[artist_id]),
+                }
+            )
+        else:
+            results.append(
+                {
+                    "artist_id": artist_id,
+                    "status": 404,
+                    "error": "Not Found",
+                    "message": f"Artist with ID {artist_id} not found.",
+                }
+            )
+    return jsonify({"results": results}), 200
+
+
+def _artist_serializer(fields: tuple, include: tuple):
+    """
+    Return the compiled serializer for a fieldset and set of inclusions.
+    """
+    if not include:
+        return serializer_for(ArtistWithAlbumsSchema, fields)
+
+    nested = ("albums.AlbumId", "albums.Title")
+    if "albums.tracks" in include:
+        nested += ("albums.tracks",)
+    return serializer_for(ArtistWithAlbumsSchema, fields + nested)
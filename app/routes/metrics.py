@@ -0,0 +1,36 @@
+# app/routes/metrics.py
+"""
+Metrics route exposing request, database and cache metrics to Prometheus.
+"""
+
+from flask import Blueprint, Response
+from werkzeug.exceptions import NotFound
+
+from app.common.metrics import CONTENT_TYPE, metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("", methods=["GET"])
+def get_metrics() -> Response:
+    """
+    Retrieve the metrics of every worker process in the Prometheus text format.
+
+    Latency and response size histograms are labelled by blueprint, route and
+    method, so percentiles can be computed per endpoint with
+    ``histogram_quantile(0.99, rate(chinook_http_request_duration_seconds_bucket[5m]))``.
+
+    ---
+    tags:
+      - Monitoring
+    produces:
+      - text/plain
+    responses:
+      200:
+        description: Metrics in the Prometheus text exposition format
+      404:
+        description: Metrics are disabled
+    """
+    if not metrics.enabled:
+        raise NotFound("Metrics are disabled.")
+    return Response(metrics.render(), mimetype=None, content_type=CONTENT_TYPE)
@@ -0,0 +1,202 @@
+# app/routes/playlists.py
+"""
+Playlists API routes for listing playlists and paging or streaming their tracks.
+"""
+
+from flask import Blueprint, current_app, jsonify, request
+
+from app.common.formats import render
+from app.common.http_cache import conditional
+from app.common.pagination import (
+    decode_cursor,
+    encode_cursor,
+    get_count_mode,
+    get_limit,
+    get_page_args,
+)
+from app.common.streaming import get_stream_format, stream_response
+from app.models.models import Playlist, PlaylistTrack, Track
+from app.schemas.playlist_schema import PlaylistSchema, PlaylistTrackSchema
+from app.schemas.serializers import compile_serializer
+from app.services.playlists import (
+    get_all_playlists,
+    get_playlist_tracks_after,
+    iter_playlist_tracks,
+)
+
+playlists_bp = Blueprint("playlists", __name__)
+dump_playlists = compile_serializer(PlaylistSchema(many=True))
+dump_playlist_tracks = compile_serializer(PlaylistTrackSchema(many=True))
+dump_playlist_track = compile_serializer(PlaylistTrackSchema())
+
+
+@playlists_bp.route("", methods=["GET"])
+@conditional(Playlist)
+def get_playlists() -> tuple:
+    """
+    Retrieve a paginated list of playlists.
+
+    ---
+    tags:
+      - Playlists
+    produces:
+      - application/json
+      - application/msgpack
+      - text/csv
+    parameters:
+      - name: page
+        in: query
+        type: integer
+        required: false
+        default: 1
+        description: Page number (1-indexed)
+      - name: per_page
+        in: query
+        type: integer
+        required: false
+        default: 20
+        description: Number of items per page
+      - name: count
+        in: query
+        type: string
+        required: false
+        default: exact
+        enum: [exact, estimate, none]
+        description: How to compute total (cached exact count, estimate, or skip)
+    responses:
+      200:
+        description: Paginated list of playlists
+        schema:
+          type: object
+          properties:
+            total:
+              type: integer
+            page:
+              type: integer
+            per_page:
+              type: integer
+            playlists:
+              type: array
+              items:
+                $ref: '#/definitions/Playlist'
+    definitions:
+      Playlist:
+        type: object
+        properties:
+          PlaylistId:
+            type: integer
+          Name:
+            type: string
+    """
+    page, per_page = get_page_args()
+
+    playlists, total = get_all_playlists(page, per_page, get_count_mode())
+
+    return (
+        render(
+            {
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "playlists": dump_playlists(playlists),
+            },
+            "playlists",
+        ),
+        200,
+    )
+
+
+@playlists_bp.route("/<int:playlist_id>/tracks", methods=["GET"])
+@conditional(Playlist, PlaylistTrack, Track)
+def get_playlist_tracks(playlist_id: int) -> tuple:
+    """
+    Retrieve the tracks of a playlist, one keyset page at a time.
+
+    Pages follow TrackId order and are addressed with the opaque ``next_cursor``
+    of the previous page, so deep pages of large playlists cost the same as the
+    first one. With ``?stream=1`` (chunked JSON array), ``?stream=ndjson`` or
+    ``Accept: application/x-ndjson`` the whole playlist is streamed instead, in
+    batches, without being held in memory.
+
+    ---
+    tags:
+      - Playlists
+    produces:
+      - application/json
+      - application/x-ndjson
+    parameters:
+      - name: playlist_id
+        in: path
+        type: integer
+        required: true
+        description: Playlist ID
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor returned as next_cursor by the previous page
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        default: 20
+        description: Number of tracks per page (max 100)
+      - name: stream
+        in: query
+        type: string
+        required: false
+        enum: ["1", ndjson]
+        description: Stream every track as a chunked JSON array or as NDJSON
+    responses:
+      200:
+        description: A page of the playlist's tracks, or the streamed playlist
+        schema:
+          type: object
+          properties:
+            playlist_id:
+              type: integer
+            limit:
+              type: integer
+            next_cursor:
+              type: string
+            tracks:
+              type: array
+              items:
+                $ref: '#/definitions/PlaylistTrack'
+      404:
+        description: Playlist not found
+    definitions:
+      PlaylistTrack:
+        type: object
+        properties:
+          TrackId:
+            type: integer
+          Name:
+            type: string
+          AlbumId:
+            type: integer
+          Milliseconds:
+            type: integer
+    """
+    stream_format = get_stream_format()
+    if stream_format:
+        tracks = iter_playlist_tracks(
+            playlist_id, current_app.config["STREAM_BATCH_SIZE"]
+        )
+        return stream_response(map(dump_playlist_track, tracks), stream_format), 200
+
+    limit = get_limit()
+    tracks, next_key = get_playlist_tracks_after(
+        playlist_id, decode_cursor(request.args.get("after")), limit
+    )
+    return (
+        jsonify(
+            {
+                "playlist_id": playlist_id,
+                "limit": limit,
+                "next_cursor": encode_cursor(next_key),
+                "tracks": dump_playlist_tracks(tracks),
+            }
+        ),
+        200,
+    )
@@ -0,0 +1,131 @@
+# app/routes/search.py
+"""
+Search API route for full-text lookups across artists, albums and tracks.
+"""
+
+from flask import Blueprint, jsonify, request
+from werkzeug.exceptions import BadRequest
+
+from app.common.http_cache import conditional
+from app.common.pagination import get_page_args
+from app.models import search as search_index
+from app.models.models import Artist, Album, Track
+from app.schemas.search_schema import SearchResultSchema
+from app.schemas.serializers import compile_serializer
+from app.services.search import search
+
+search_bp = Blueprint("search", __name__)
+dump_results = compile_serializer(SearchResultSchema(many=True))
+
+
+@search_bp.route("", methods=["GET"])
+@conditional(Artist, Album, Track, search_index.TABLE_NAME)
+def get_search() -> tuple:
+    """
+    Search artist names, album titles, track names and composers.
+
+    Every word of ``q`` is matched as a prefix (``zep`` finds "Zeppelin") and all
+    words must match. Results are ranked best first, with name and title matches
+    ahead of composer matches.
+
+    ---
+    tags:
+      - Search
+    parameters:
+      - name: q
+        in: query
+        type: string
+        required: true
+        description: Words to search for
+      - name: type
+        in: query
+        type: string
+        required: false
+        description: Comma-separated kinds to return (artist, album, track)
+      - name: page
+        in: query
+        type: integer
+        required: false
+        default: 1
+        description: Page number (1-indexed)
+      - name: per_page
+        in: query
+        type: integer
+        required: false
+        default: 20
+        description: Number of results per page (max 100)
+    responses:
+      200:
+        description: Ranked search results
+        schema:
+          type: object
+          properties:
+            q:
+              type: string
+            total:
+              type: integer
+            page:
+              type: integer
+            per_page:
+              type: integer
+            results:
+              type: array
+              items:
+                $ref: '#/definitions/SearchResult'
+      400:
+        description: Missing or empty query, or unknown type
+      503:
+        description: The search index has not been built
+    definitions:
+      SearchResult:
+        type: object
+        properties:
+          type:
+            type: string
+            enum: [artist, album, track]
+          id:
+            type: integer
+          name:
+            type: string
+          composer:
+            type: string
+    """
+    query = request.args.get("q", "").strip()
+    if not query:
+        raise BadRequest("q is required.")
+
+    kinds = _get_kinds()
+    page, per_page = get_page_args()
+
+    results, total = search(query, page, per_page, kinds)
+
+    return (
+        jsonify(
+            {
+                "q": query,
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "results": dump_results(results),
+            }
+        ),
+        200,
+    )
+
+
+def _get_kinds() -> tuple:
+    """
+    Read the comma-separated ``type`` query argument, in canonical order.
+
+    Raises:
+        BadRequest: If a kind is unknown.
+    """
+    raw = request.args.get("type", "")
+    requested = {kind.strip() for kind in raw.split(",") if kind.strip()}
+    unknown = requested.difference(search_index.KINDS)
+    if unknown:
+        raise BadRequest(
+            f"Unknown type value(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(search_index.KINDS)}."
+        )
+    return tuple(kind for kind in search_index.KINDS if kind in requested)
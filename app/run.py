@@ -3,27 +3,43 @@
 """
 Entry point for the Flask application.
 
-This module creates and runs the Flask app instance using the application factory.
+This module creates the Flask app instance using the application factory and runs
+it on the Werkzeug development server. Production traffic is served by gunicorn
+with the settings in :mod:`app.gunicorn_conf`.
 """
 
+import argparse
+from typing import List, Optional
+
 from app import create_app
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Main function to create and run the Flask application.
 
     The application is created using the factory function `create_app()`.
     The debug mode is dynamically set based on the application's configuration.
+    Host and port default to the ``SERVER_*`` settings and can be overridden on the
+    command line.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, defaults to sys.argv.
     """
     # Create the Flask application using the application factory.
     app = create_app()
+    config = app.config
+
+    parser = argparse.ArgumentParser(description="Run the Chinook API.")
+    parser.add_argument("--host", default=config["SERVER_HOST"])
+    parser.add_argument("--port", type=int, default=config["SERVER_PORT"])
+    args = parser.parse_args(argv)
 
     # Log that the application is starting.
     app.logger.info("Starting the Flask application...")
 
     # Run the app using the debug flag from the loaded config
-    app.run(debug=app.config.get("DEBUG", False))
+    app.run(host=args.host, port=args.port, debug=config.get("DEBUG", False))
 
 
 if __name__ == "__main__":
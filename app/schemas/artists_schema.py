@@ -5,6 +5,7 @@ Marshmallow schema for serializing and deserializing Artist model data.
 
 from app import ma
 from app.models.models import Artist
+from app.schemas.albums_schema import AlbumSchema
 
 
 class ArtistSchema(ma.SQLAlchemyAutoSchema):
@@ -20,3 +21,14 @@ class ArtistSchema(ma.SQLAlchemyAutoSchema):
         include_fk = True
         # Limits the serialized/deserialized fields
         fields = ("ArtistId", "Name")
+
+
+class ArtistWithAlbumsSchema(ArtistSchema):
+    """
+    Artist schema with the artist's albums (and optionally their tracks) nested.
+    """
+
+    albums = ma.Nested(AlbumSchema, many=True)
+
+    class Meta(ArtistSchema.Meta):
+        fields = ("ArtistId", "Name", "albums")
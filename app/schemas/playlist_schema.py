@@ -0,0 +1,28 @@
+# app/schemas/playlist_schema.py
+"""
+Marshmallow schemas for serializing playlists and their tracks.
+"""
+
+from app import ma
+from app.models.models import Playlist, Track
+
+
+class PlaylistSchema(ma.SQLAlchemyAutoSchema):
+    """
+    Schema for the Playlist model.
+    """
+
+    class Meta:
+        model = Playlist
+        fields = ("PlaylistId", "Name")
+
+
+class PlaylistTrackSchema(ma.SQLAlchemyAutoSchema):
+    """
+    Schema for the tracks of a playlist: the Track columns a player needs.
+    """
+
+    class Meta:
+        model = Track
+        include_fk = True
+        fields = ("TrackId", "Name", "AlbumId", "Milliseconds")
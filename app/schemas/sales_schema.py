@@ -0,0 +1,23 @@
+# app/schemas/sales_schema.py
+"""
+Marshmallow schema for serializing precomputed sales totals.
+"""
+
+from app import ma
+
+
+class SalesSchema(ma.Schema):
+    """
+    Schema for one row of a sales report.
+
+    Used to serialize rollup rows that include:
+    - The key: a genre, artist or track ID, a country, or a month (YYYY-MM)
+    - Its display name
+    - Total revenue
+    - Total units sold
+    """
+
+    Key = ma.Raw(required=True)
+    Name = ma.String(allow_none=True)
+    Revenue = ma.Float(required=True)
+    Quantity = ma.Integer(required=True)
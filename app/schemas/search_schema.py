@@ -0,0 +1,23 @@
+# app/schemas/search_schema.py
+"""
+Marshmallow schema for serializing full-text search results.
+"""
+
+from app import ma
+
+
+class SearchResultSchema(ma.Schema):
+    """
+    Schema for one search hit.
+
+    Used to serialize search results that include:
+    - Kind of the matched row (artist, album or track)
+    - Its identifier
+    - Its name or title
+    - The composer, for tracks
+    """
+
+    type = ma.String(required=True)
+    id = ma.Integer(required=True)
+    name = ma.String(required=True)
+    composer = ma.String(allow_none=True)
@@ -0,0 +1,142 @@
+# app/services/analytics.py
+"""
+Service layer for the sales reports served from the precomputed rollup table.
+"""
+
+from typing import List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import Integer, cast, inspect
+from werkzeug.exceptions import ServiceUnavailable
+
+from app import db
+from app.common.cache import query_cache
+from app.common.versioning import table_versions
+from app.models import analytics, versions
+from app.models.models import (
+    Album,
+    Artist,
+    Genre,
+    Invoice,
+    InvoiceItem,
+    SalesRollup,
+    Track,
+)
+from app.services.rows import SalesRow
+
+# Sort orders of the top tracks report
+TOP_TRACKS_ORDERS: Tuple[str, ...] = ("revenue", "quantity")
+
+# Models whose name column labels the keys of a dimension
+_NAME_SOURCES = {
+    "genre": (Genre, Genre.GenreId, Genre.Name),
+    "artist": (Artist, Artist.ArtistId, Artist.Name),
+    "track": (Track, Track.TrackId, Track.Name),
+}
+
+# (data version token, table exists) from the last availability check
+_availability: Optional[Tuple[Tuple[int, ...], bool]] = None
+
+
+def sales_rollups_available() -> bool:
+    """
+    Tell whether the sales rollup table exists in the database.
+
+    The answer is cached until the table is created or dropped in this process, or
+    another process writes to the database.
+    """
+    global _availability
+
+    token = table_versions.current(analytics.TABLE_NAME)
+    if _availability is not None and _availability[0] == token:
+        return _availability[1]
+
+    available = inspect(db.session.connection()).has_table(analytics.TABLE_NAME)
+    if not available:
+        current_app.logger.warning(
+            "Table %s is missing; run 'flask analytics rebuild' with "
+            "SQLITE_READ_ONLY=0 to create it.",
+            analytics.TABLE_NAME,
+        )
+
+    _availability = (token, available)
+    return available
+
+
+def rebuild_sales_rollups() -> int:
+    """
+    Create the rollup table and its triggers if needed and recompute every row.
+
+    Returns:
+        int: Number of rollup rows written.
+    """
+    current_app.logger.info("Rebuilding sales rollups.")
+
+    connection = db.session.connection()
+    SalesRollup.__table__.create(connection, checkfirst=True)
+    versions.install(connection, [analytics.TABLE_NAME])
+    analytics.install(connection, rebuild=True)
+    db.session.commit()
+
+    # Raw SQL is not seen by the version listeners, so publish the change here
+    table_versions.bump([analytics.TABLE_NAME])
+
+    return db.session.query(SalesRollup).count()
+
+
+@query_cache.memoize(SalesRollup, Invoice, InvoiceItem, Track, Album, Artist, Genre)
+def get_sales(
+    dimension: str, limit: Optional[int] = None, order: str = "revenue"
+) -> List[SalesRow]:
+    """
+    Retrieve the sales totals of one dimension.
+
+    Args:
+        dimension (str): One of ``analytics.DIMENSIONS``.
+        limit (Optional[int]): Maximum number of rows; all of them when None.
+        order (str): ``revenue`` or ``quantity`` for the best sellers first, or
+            ``key`` for key order (chronological for months).
+
+    Returns:
+        List[SalesRow]: Totals per key.
+
+    Raises:
+        ServiceUnavailable: If the rollup table has not been built.
+    """
+    if not sales_rollups_available():
+        raise ServiceUnavailable(
+            "Sales rollups have not been built; run 'flask analytics rebuild' "
+            "with SQLITE_READ_ONLY=0."
+        )
+
+    current_app.logger.info(
+        "Fetching %s sales (order=%s, limit=%s)", dimension, order, limit
+    )
+
+    name_source = _NAME_SOURCES.get(dimension)
+    name = name_source[2] if name_source else SalesRollup.Key
+    query = db.session.query(
+        SalesRollup.Key, name, SalesRollup.RevenueCents, SalesRollup.Quantity
+    ).filter(SalesRollup.Dimension == dimension, SalesRollup.Quantity != 0)
+    if name_source:
+        model, id_column, _ = name_source
+        query = query.outerjoin(model, id_column == cast(SalesRollup.Key, Integer))
+
+    if order == "key":
+        query = query.order_by(SalesRollup.Key)
+    elif order == "quantity":
+        query = query.order_by(SalesRollup.Quantity.desc(), SalesRollup.Key)
+    else:
+        query = query.order_by(SalesRollup.RevenueCents.desc(), SalesRollup.Key)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return [
+        SalesRow(
+            (int(key) if name_source else key) if key != "" else None,
+            label if key != "" else None,
+            cents / 100,
+            quantity,
+        )
+        for key, label, cents, quantity in query
+    ]
@@ -0,0 +1,288 @@
+# app/services/catalog.py
+"""
+In-process catalog index serving artist, album and track reads without SQL.
+
+The whole catalog is loaded into a :class:`CatalogSnapshot` made of sorted id arrays
+and parent-offset arrays: the albums of the artist at position ``i`` are the album
+positions ``artist_albums[artist_offsets[i]:artist_offsets[i + 1]]``, and tracks
+are grouped under albums the same way. Children keep primary key order, so every
+method returns exactly what the equivalent query in :mod:`app.services.services`
+returns.
+
+Snapshots are immutable. :class:`CatalogIndex` builds a new one when the data
+version of the catalog tables changes and swaps it in with a single assignment, so
+readers never see a half-built index. Only committed data is visible.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flask import Flask, current_app
+from sqlalchemy import inspect as sa_inspect
+
+from app import db
+from app.common.versioning import table_versions
+from app.models.models import Artist, Album, Track
+from app.services.rows import AlbumRow, ArtistRow, TrackRow
+
+# Tables the index is built from, in token order
+CATALOG_TABLES: Tuple[str, ...] = tuple(
+    sorted(model.__tablename__ for model in (Artist, Album, Track))
+)
+
+
+class CatalogSnapshot:
+    """
+    Immutable array-backed copy of the artists, albums and tracks tables.
+    """
+
+    def __init__(
+        self,
+        token: Tuple[int, ...],
+        artists: Sequence[Tuple[int, str]],
+        albums: Sequence[Tuple[int, str, Optional[int]]],
+        tracks: Sequence[Tuple[int, str, Optional[int]]],
+    ) -> None:
+        """
+        Build the index from rows sorted by primary key.
+
+        Args:
+            token (Tuple[int, ...]): Data version of :data:`CATALOG_TABLES` the rows
+                were read at.
+            artists: ``(ArtistId, Name)`` rows.
+            albums: ``(AlbumId, Title, ArtistId)`` rows.
+            tracks: ``(TrackId, Name, AlbumId)`` rows.
+        """
+        self.token = token
+
+        self.artist_ids = array("q", [row[0] for row in artists])
+        self.artist_names: List[str] = [row[1] for row in artists]
+
+        self.album_ids = array("q", [row[0] for row in albums])
+        self.album_titles: List[str] = [row[1] for row in albums]
+
+        self.track_ids = array("q", [row[0] for row in tracks])
+        self.track_names: List[str] = [row[1] for row in tracks]
+
+        self.artist_offsets, self.artist_albums = _group(
+            self.artist_ids, [row[2] for row in albums]
+        )
+        self.album_offsets, self.album_tracks = _group(
+            self.album_ids, [row[2] for row in tracks]
+        )
+
+    def artists(
+        self, start: int, stop: int, include: Tuple[str, ...] = ()
+    ) -> List[ArtistRow]:
+        """
+        Return the artists at positions ``start:stop``, with the requested nesting.
+        """
+        with_albums = "albums" in include or "albums.tracks" in include
+        with_tracks = "albums.tracks" in include
+        names = self.artist_names
+
+        rows = []
+        for position, artist_id in enumerate(self.artist_ids[start:stop], start):
+            albums = self._albums_of(position, with_tracks) if with_albums else ()
+            rows.append(ArtistRow(artist_id, names[position], albums))
+        return rows
+
+    def albums(
+        self, start: int, stop: int, include_tracks: bool = True
+    ) -> List[AlbumRow]:
+        """
+        Return the albums at positions ``start:stop``, with their tracks if requested.
+        """
+        return [
+            self._album(position, include_tracks)
+            for position in range(start, min(stop, len(self.album_ids)))
+        ]
+
+    def artist_position(self, after: Optional[int]) -> int:
+        """
+        Return the position of the first artist whose id is greater than ``after``.
+        """
+        return 0 if after is None else bisect_right(self.artist_ids, after)
+
+    def album_position(self, after: Optional[int]) -> int:
+        """
+        Return the position of the first album whose id is greater than ``after``.
+        """
+        return 0 if after is None else bisect_right(self.album_ids, after)
+
+    def albums_by_artist(
+        self, artist_id: int, include_tracks: bool = False
+    ) -> Optional[List[AlbumRow]]:
+        """
+        Return the albums of an artist, or None if the artist does not exist.
+        """
+        position = _find(self.artist_ids, artist_id)
+        if position is None:
+            return None
+        return self._albums_of(position, include_tracks)
+
+    def tracks_by_album(self, album_id: int) -> Optional[List[TrackRow]]:
+        """
+        Return the tracks of an album, or None if the album does not exist.
+        """
+        position = _find(self.album_ids, album_id)
+        if position is None:
+            return None
+        return self._tracks_of(position)
+
+    def _albums_of(self, artist_position: int, include_tracks: bool) -> List[AlbumRow]:
+        """
+        Build the album rows of the artist at a position.
+        """
+        start = self.artist_offsets[artist_position]
+        stop = self.artist_offsets[artist_position + 1]
+        return [
+            self._album(position, include_tracks)
+            for position in self.artist_albums[start:stop]
+        ]
+
+    def _album(self, position: int, include_tracks: bool) -> AlbumRow:
+        """
+        Build the album row at a position.
+        """
+        tracks = self._tracks_of(position) if include_tracks else []
+        return AlbumRow(self.album_ids[position], self.album_titles[position], tracks)
+
+    def _tracks_of(self, album_position: int) -> List[TrackRow]:
+        """
+        Build the track rows of the album at a position.
+        """
+        ids, names = self.track_ids, self.track_names
+        start = self.album_offsets[album_position]
+        stop = self.album_offsets[album_position + 1]
+        return [
+            TrackRow(ids[position], names[position])
+            for position in self.album_tracks[start:stop]
+        ]
+
+
+class CatalogIndex:
+    """
+    Holder of the current :class:`CatalogSnapshot`, rebuilt when the data changes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Load the index at startup when it is enabled and the tables exist.
+
+        Loading eagerly lets pre-fork servers share the arrays copy-on-write.
+
+        Args:
+            app (Flask): The Flask application instance.
+        """
+        if not app.config.get("CATALOG_INDEX_ENABLED"):
+            return
+
+        with app.app_context():
+            inspector = sa_inspect(db.engine)
+            if all(inspector.has_table(table) for table in CATALOG_TABLES):
+                self.get()
+
+    def get(self) -> Optional[CatalogSnapshot]:
+        """
+        Return an up-to-date snapshot, or None when the index is disabled.
+
+        Must be called inside an application context.
+        """
+        if not current_app.config.get("CATALOG_INDEX_ENABLED"):
+            return None
+
+        token = table_versions.current(*CATALOG_TABLES)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.token == token:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.token != token:
+                snapshot = self._load(token)
+                self._snapshot = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        """
+        Drop the current snapshot; the next :meth:`get` reloads it.
+        """
+        self._snapshot = None
+
+    @staticmethod
+    def _load(token: Tuple[int, ...]) -> CatalogSnapshot:
+        """
+        Read the catalog tables and build a snapshot stamped with ``token``.
+        """
+        session = db.session
+        artists = session.query(Artist.ArtistId, Artist.Name).order_by(Artist.ArtistId)
+        albums = session.query(Album.AlbumId, Album.Title, Album.ArtistId).order_by(
+            Album.AlbumId
+        )
+        tracks = session.query(Track.TrackId, Track.Name, Track.AlbumId).order_by(
+            Track.TrackId
+        )
+
+        snapshot = CatalogSnapshot(token, artists.all(), albums.all(), tracks.all())
+        current_app.logger.info(
+            "Loaded catalog index: %d artists, %d albums, %d tracks",
+            len(snapshot.artist_ids),
+            len(snapshot.album_ids),
+            len(snapshot.track_ids),
+        )
+        return snapshot
+
+
+def _find(ids: array, key: int) -> Optional[int]:
+    """
+    Return the position of ``key`` in a sorted id array, or None.
+    """
+    position = bisect_left(ids, key)
+    if position < len(ids) and ids[position] == key:
+        return position
+    return None
+
+
+def _group(
+    parent_ids: array, child_parents: List[Optional[int]]
+) -> Tuple[array, array]:
+    """
+    Group child positions under their parents as an offsets/positions array pair.
+
+    Children are visited in order, so each parent's children keep primary key
+    order. Children whose parent is NULL or unknown are left out.
+    """
+    positions: Dict[int, int] = {
+        parent_id: index for index, parent_id in enumerate(parent_ids)
+    }
+    counts = [0] * (len(parent_ids) + 1)
+    owners = []
+    for parent_id in child_parents:
+        owner = positions.get(parent_id) if parent_id is not None else None
+        owners.append(owner)
+        if owner is not None:
+            counts[owner + 1] += 1
+
+    for index in range(1, len(counts)):
+        counts[index] += counts[index - 1]
+    offsets = array("l", counts)
+
+    children = array("l", [0] * counts[-1])
+    cursor = list(counts[:-1])
+    for child, owner in enumerate(owners):
+        if owner is not None:
+            children[cursor[owner]] = child
+            cursor[owner] += 1
+
+    return offsets, children
+
+
+# Shared index used by the service layer
+catalog_index = CatalogIndex()
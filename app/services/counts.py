@@ -0,0 +1,79 @@
+# app/services/counts.py
+"""
+Row counts for paginated endpoints, cached per table and invalidated by data versions.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import func, text
+
+from app import db
+from app.common.versioning import table_versions
+
+# Table name -> (data version token, row count)
+_row_counts: Dict[str, Tuple[Tuple[int, ...], int]] = {}
+_lock = threading.Lock()
+
+
+def count_rows(model, mode: str = "exact") -> Optional[int]:
+    """
+    Return the number of rows of a model's table.
+
+    Args:
+        model: SQLAlchemy model whose table is counted.
+        mode (str): ``exact`` serves the cached COUNT(*) while the table is unchanged,
+            ``estimate`` avoids scanning the table (last known count, ANALYZE
+            statistics or the highest primary key) and ``none`` skips counting.
+
+    Returns:
+        Optional[int]: The row count, or None when ``mode`` is ``none``.
+    """
+    if mode == "none":
+        return None
+
+    table = model.__table__
+    cached = _row_counts.get(table.name)
+
+    if mode == "estimate":
+        if cached is not None:
+            return cached[1]
+        return _estimate_rows(model)
+
+    token = table_versions.current(table.name)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    current_app.logger.debug("Counting rows of %s", table.name)
+    total = db.session.query(func.count()).select_from(table).scalar()
+
+    with _lock:
+        _row_counts[table.name] = (token, total)
+
+    return total
+
+
+def _estimate_rows(model) -> int:
+    """
+    Estimate a table's row count without scanning it.
+
+    Uses ``sqlite_stat1`` when ANALYZE has been run and falls back to the highest
+    primary key, which is a single index seek.
+    """
+    table = model.__table__
+
+    if db.session.get_bind().dialect.name == "sqlite":
+        has_stats = db.session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        ).scalar()
+        if has_stats:
+            stat = db.session.execute(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :tbl LIMIT 1"),
+                {"tbl": table.name},
+            ).scalar()
+            if stat:
+                return int(stat.split()[0])
+
+    primary_key = table.primary_key.columns.values()[0]
+    return db.session.query(func.max(primary_key)).scalar() or 0
@@ -0,0 +1,110 @@
+# app/services/playlists.py
+"""
+Service layer for playlists and their track membership.
+
+A playlist's tracks are always read in TrackId order through the
+``playlist_track`` primary key (PlaylistId, TrackId), so a page is an index range
+scan plus one primary key lookup per track, whatever the playlist's size.
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy.orm import Query
+from werkzeug.exceptions import NotFound
+
+from app import db
+from app.common.cache import query_cache
+from app.common.pagination import keyset_page, page_bounds
+from app.models.models import Playlist, PlaylistTrack, Track
+from app.services.counts import count_rows
+from app.services.rows import PlaylistRow, PlaylistTrackRow
+
+
+@query_cache.memoize(Playlist)
+def get_all_playlists(
+    page: int, per_page: int, count: str = "exact"
+) -> Tuple[List[PlaylistRow], Optional[int]]:
+    """
+    Retrieve a paginated list of playlists and their total number.
+    """
+    current_app.logger.info("Fetching playlists (page=%d, per_page=%d)", page, per_page)
+
+    offset, limit = page_bounds(page, per_page)
+    rows = (
+        db.session.query(Playlist.PlaylistId, Playlist.Name)
+        .order_by(Playlist.PlaylistId)
+        .offset(offset)
+        .limit(limit)
+    )
+    return [PlaylistRow(*row) for row in rows], count_rows(Playlist, count)
+
+
+@query_cache.memoize(Playlist, PlaylistTrack, Track)
+def get_playlist_tracks_after(
+    playlist_id: int, after: Optional[int], limit: int
+) -> Tuple[List[PlaylistTrackRow], Optional[int]]:
+    """
+    Retrieve a page of a playlist's tracks using keyset pagination on TrackId.
+
+    Raises:
+        NotFound: If the playlist does not exist.
+    """
+    current_app.logger.info(
+        "Fetching tracks of playlist %d (after=%s, limit=%d)",
+        playlist_id,
+        after,
+        limit,
+    )
+
+    _check_playlist(playlist_id)
+    query = _tracks_query(playlist_id)
+    if after is not None:
+        query = query.filter(PlaylistTrack.TrackId > after)
+
+    rows = [PlaylistTrackRow(*row) for row in query.limit(limit + 1)]
+    return keyset_page(rows, limit, "TrackId")
+
+
+def iter_playlist_tracks(
+    playlist_id: int, batch_size: int
+) -> Iterator[PlaylistTrackRow]:
+    """
+    Stream every track of a playlist, fetching ``batch_size`` rows at a time.
+
+    The playlist is looked up eagerly so a missing one raises before streaming
+    starts.
+
+    Raises:
+        NotFound: If the playlist does not exist.
+    """
+    current_app.logger.info(
+        "Streaming tracks of playlist %d (batch_size=%d)", playlist_id, batch_size
+    )
+
+    _check_playlist(playlist_id)
+    rows = _tracks_query(playlist_id).yield_per(batch_size)
+    return (PlaylistTrackRow(*row) for row in rows)
+
+
+def _check_playlist(playlist_id: int) -> None:
+    """
+    Raise NotFound unless the playlist exists.
+    """
+    exists = db.session.query(Playlist.PlaylistId).filter_by(PlaylistId=playlist_id)
+    if exists.scalar() is None:
+        raise NotFound(f"Playlist with ID {playlist_id} not found.")
+
+
+def _tracks_query(playlist_id: int) -> Query:
+    """
+    Build the ordered, projected track query of one playlist.
+    """
+    return (
+        db.session.query(
+            PlaylistTrack.TrackId, Track.Name, Track.AlbumId, Track.Milliseconds
+        )
+        .join(Track, Track.TrackId == PlaylistTrack.TrackId)
+        .filter(PlaylistTrack.PlaylistId == playlist_id)
+        .order_by(PlaylistTrack.TrackId)
+    )
@@ -0,0 +1,81 @@
+# app/services/rows.py
+"""
+Lightweight row types returned by the service layer.
+
+Rows carry only the columns the routes serialize. They are plain named tuples built
+from column queries, so loading them bypasses the ORM identity map and unit-of-work
+bookkeeping, and they are safe to cache and share between requests.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+
+class TrackRow(NamedTuple):
+    """
+    Track identifier and name.
+    """
+
+    TrackId: int
+    Name: str
+
+
+class AlbumRow(NamedTuple):
+    """
+    Album identifier and title, with its tracks when they were requested.
+    """
+
+    AlbumId: int
+    Title: str
+    tracks: Sequence[TrackRow] = ()
+
+
+class ArtistRow(NamedTuple):
+    """
+    Artist identifier and name, with its albums when they were requested.
+    """
+
+    ArtistId: int
+    Name: str
+    albums: Sequence[AlbumRow] = ()
+
+
+class SearchRow(NamedTuple):
+    """
+    Full-text search hit: the kind and id of the matched row, with its indexed text.
+    """
+
+    type: str
+    id: int
+    name: str
+    composer: Optional[str] = None
+
+
+class SalesRow(NamedTuple):
+    """
+    Sales total of one rollup key: revenue and units sold.
+    """
+
+    Key: Union[int, str, None]
+    Name: Optional[str]
+    Revenue: float
+    Quantity: int
+
+
+class PlaylistRow(NamedTuple):
+    """
+    Playlist identifier and name.
+    """
+
+    PlaylistId: int
+    Name: Optional[str]
+
+
+class PlaylistTrackRow(NamedTuple):
+    """
+    Track of a playlist, projected to the columns a player needs.
+    """
+
+    TrackId: int
+    Name: str
+    AlbumId: int
+    Milliseconds: int
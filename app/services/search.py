@@ -0,0 +1,169 @@
+# app/services/search.py
+"""
+Service layer for full-text search over artists, albums and tracks.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import inspect, text
+from werkzeug.exceptions import BadRequest, ServiceUnavailable
+
+from app import db
+from app.common.cache import query_cache
+from app.common.pagination import page_bounds
+from app.common.versioning import table_versions
+from app.models import search as search_index
+from app.models.models import Artist, Album, Track
+from app.services.rows import SearchRow
+
+# Upper bound for the number of terms of one query
+MAX_QUERY_TERMS: int = 10
+
+# bm25 weights of the (name, composer) columns: title matches rank first
+_BM25_WEIGHTS = "10.0, 1.0"
+
+# Kind names by rowid remainder
+_KIND_NAMES = {kind: name for name, kind in search_index.KINDS.items()}
+
+# Tables whose DDL decides whether the index exists
+_INDEX_TABLES = (search_index.TABLE_NAME, "artists", "albums", "tracks")
+
+# (data version token, table exists) from the last availability check
+_availability: Optional[Tuple[Tuple[int, ...], bool]] = None
+
+
+def search_available() -> bool:
+    """
+    Tell whether the search index exists in the database.
+
+    The answer is cached until the index or the tables it mirrors are created or
+    dropped in this process, or another process writes to the database.
+    """
+    global _availability
+
+    token = table_versions.current(*_INDEX_TABLES)
+    if _availability is not None and _availability[0] == token:
+        return _availability[1]
+
+    available = inspect(db.session.connection()).has_table(search_index.TABLE_NAME)
+    if not available:
+        current_app.logger.warning(
+            "Table %s is missing; run 'flask search rebuild' with "
+            "SQLITE_READ_ONLY=0 to create it.",
+            search_index.TABLE_NAME,
+        )
+
+    _availability = (token, available)
+    return available
+
+
+def rebuild_search_index() -> int:
+    """
+    Create the search index and its triggers if needed and reindex every row.
+
+    Returns:
+        int: Number of indexed rows.
+    """
+    current_app.logger.info("Rebuilding the full-text search index.")
+
+    connection = db.session.connection()
+    search_index.install(connection, rebuild=True)
+    db.session.commit()
+
+    # Raw SQL is not seen by the version listeners, so publish the change here
+    table_versions.bump([search_index.TABLE_NAME])
+
+    return db.session.execute(
+        text(f"SELECT COUNT(*) FROM {search_index.TABLE_NAME}")
+    ).scalar()
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn user input into an FTS5 MATCH expression with prefix matching.
+
+    Every word becomes a quoted prefix term (``"zep"*``), so FTS5 operators and
+    punctuation in the input are treated as plain text, and all terms must match.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        str: The MATCH expression.
+
+    Raises:
+        BadRequest: If the text holds no searchable word or too many of them.
+    """
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        raise BadRequest("q must contain at least one letter or digit.")
+    if len(terms) > MAX_QUERY_TERMS:
+        raise BadRequest(f"q can contain at most {MAX_QUERY_TERMS} words.")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+@query_cache.memoize(Artist, Album, Track, search_index.TABLE_NAME)
+def search(
+    query: str, page: int, per_page: int, kinds: Tuple[str, ...] = ()
+) -> Tuple[List[SearchRow], int]:
+    """
+    Retrieve a page of search hits, best matches first, and the number of hits.
+
+    Hits are ranked with bm25, weighting matches in names and titles above matches
+    in composers; ties keep a stable order.
+
+    Args:
+        query (str): Raw search text.
+        page (int): Page number (1-indexed).
+        per_page (int): Number of hits per page.
+        kinds (Tuple[str, ...]): Kinds to return (artist, album, track); all of
+            them when empty.
+
+    Returns:
+        Tuple[List[SearchRow], int]: The hits and the total number of hits.
+
+    Raises:
+        BadRequest: If the query holds no searchable word.
+        ServiceUnavailable: If the search index has not been built.
+    """
+    match = build_match_query(query)
+    if not search_available():
+        raise ServiceUnavailable(
+            "The search index has not been built; run 'flask search rebuild' "
+            "with SQLITE_READ_ONLY=0."
+        )
+
+    current_app.logger.info("Searching %r (page=%s, kinds=%s)", query, page, kinds)
+
+    where = f"{search_index.TABLE_NAME} MATCH :match"
+    if kinds:
+        remainders = ", ".join(str(search_index.KINDS[kind]) for kind in kinds)
+        where += f" AND rowid % {search_index.ROWID_STRIDE} IN ({remainders})"
+
+    offset, limit = page_bounds(page, per_page)
+    rows = db.session.execute(
+        text(
+            f"SELECT rowid, name, composer FROM {search_index.TABLE_NAME} "
+            f"WHERE {where} "
+            f"ORDER BY bm25({search_index.TABLE_NAME}, {_BM25_WEIGHTS}), rowid "
+            "LIMIT :limit OFFSET :offset"
+        ),
+        {"match": match, "limit": limit, "offset": offset},
+    )
+    hits = [
+        SearchRow(
+            _KIND_NAMES[rowid % search_index.ROWID_STRIDE],
+            rowid // search_index.ROWID_STRIDE,
+            name,
+            composer,
+        )
+        for rowid, name, composer in rows
+    ]
+
+    total = db.session.execute(
+        text(f"SELECT COUNT(*) FROM {search_index.TABLE_NAME} WHERE {where}"),
+        {"match": match},
+    ).scalar()
+    return hits, total
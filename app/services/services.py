@@ -3,81 +3,555 @@
 Service layer for business logic and database access related to Artists and Albums.
 """
 
-from typing import List, Tuple
+from itertools import groupby
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from flask import current_app
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Row, func
+from sqlalchemy.orm import Query
 from werkzeug.exceptions import NotFound
 
 from app import db
-from app.models.models import Artist, Album, Track
+from app.common.cache import query_cache
+from app.common.pagination import keyset_page, page_bounds
+from app.models.models import Artist, Album, Track, AlbumSummary
+from app.services.catalog import catalog_index
+from app.services.counts import count_rows
+from app.services.rows import AlbumRow, ArtistRow, TrackRow
+from app.services.summaries import album_summaries_available
 
 
-def get_all_artists(page: int, per_page: int) -> Tuple[List[Artist], int]:
+# Columns that can be selected with sparse fieldsets, in serialization order
+ARTIST_FIELDS: Tuple[str, ...] = ("ArtistId", "Name")
+ALBUM_FIELDS: Tuple[str, ...] = ("AlbumId", "Title")
+
+# How nested tracks are loaded: a second IN query, or one outer join
+LOADING_STRATEGIES: Tuple[str, ...] = ("selectin", "joined")
+
+
+def artist_models(include: Tuple[str, ...]) -> tuple:
+    """
+    Return the models read by an artist page with the given inclusions.
+    """
+    if "albums.tracks" in include:
+        return (Artist, Album, Track)
+    if "albums" in include:
+        return (Artist, Album)
+    return (Artist,)
+
+
+def album_models(include_tracks: bool) -> tuple:
+    """
+    Return the models read by an album page, with or without its tracks.
+    """
+    return (Album, Track) if include_tracks else (Album,)
+
+
+def _memoize_per_models(func: Callable, variants: Iterable[tuple]) -> Dict:
+    """
+    Cache ``func`` once per set of models, so a result is only invalidated by
+    writes to the tables it was actually read from.
+    """
+    return {models: query_cache.memoize(*models)(func) for models in variants}
+
+
+def get_all_artists(
+    page: int,
+    per_page: int,
+    count: str = "exact",
+    fields: Tuple[str, ...] = ARTIST_FIELDS,
+    include: Tuple[str, ...] = (),
+) -> Tuple[List[ArtistRow], Optional[int]]:
     """
     Retrieve a paginated list of artists from the database.
+
+    Only the requested ``fields`` are selected. ``include`` may contain ``albums``
+    and ``albums.tracks`` to load nested resources. The total comes from the cached
+    row count selected by ``count`` (see :func:`app.services.counts.count_rows`).
+    Results depend on the tables of :func:`artist_models` only.
+    """
+    loader = _all_artists[artist_models(include)]
+    return loader(page, per_page, count, fields, include)
+
+
+def _get_all_artists(
+    page: int,
+    per_page: int,
+    count: str,
+    fields: Tuple[str, ...],
+    include: Tuple[str, ...],
+) -> Tuple[List[ArtistRow], Optional[int]]:
+    """
+    Load a page of artists; cached by :func:`get_all_artists`.
     """
-    current_app.logger.info(f"Fetching artists (page={page}, per_page={per_page})")
+    current_app.logger.info("Fetching artists (page=%d, per_page=%d)", page, per_page)
+
+    offset, limit = page_bounds(page, per_page)
+    catalog = catalog_index.get()
+    if catalog is not None:
+        artists = catalog.artists(offset, offset + limit, include)
+        return artists, _catalog_total(catalog.artist_ids, count)
 
     query = (
-        db.session.query(Artist)
+        _columns(Artist, "ArtistId", fields)
         .order_by(Artist.ArtistId)
-        .paginate(page=page, per_page=per_page, error_out=False)
+        .offset(offset)
+        .limit(limit)
     )
 
-    return query.items, query.total
+    return _load_artists(query, include), count_rows(Artist, count)
 
 
-def get_all_albums_with_tracks(page: int, per_page: int) -> Tuple[List[Album], int]:
+def get_all_albums_with_tracks(
+    page: int,
+    per_page: int,
+    count: str = "exact",
+    fields: Tuple[str, ...] = ALBUM_FIELDS,
+    include_tracks: bool = True,
+) -> Tuple[List[AlbumRow], Optional[int]]:
     """
-    Retrieve a paginated list of albums with their associated tracks.
+    Retrieve a paginated list of albums, with their tracks unless disabled.
+
+    Only the requested ``fields`` are selected, and the track query is skipped
+    entirely when ``include_tracks`` is false. The total comes from the cached row
+    count selected by ``count``. Results depend on the tables of
+    :func:`album_models` only.
+    """
+    loader = _all_albums[album_models(include_tracks)]
+    return loader(page, per_page, count, fields, include_tracks)
+
+
+def _get_all_albums_with_tracks(
+    page: int,
+    per_page: int,
+    count: str,
+    fields: Tuple[str, ...],
+    include_tracks: bool,
+) -> Tuple[List[AlbumRow], Optional[int]]:
+    """
+    Load a page of albums; cached by :func:`get_all_albums_with_tracks`.
     """
     current_app.logger.info(
-        f"Fetching albums with tracks (page={page}, per_page={per_page})"
+        "Fetching albums with tracks (page=%d, per_page=%d)", page, per_page
     )
 
+    offset, limit = page_bounds(page, per_page)
+    catalog = catalog_index.get()
+    if catalog is not None:
+        albums = catalog.albums(offset, offset + limit, include_tracks)
+        return albums, _catalog_total(catalog.album_ids, count)
+
     query = (
-        db.session.query(Album)
-        .options(joinedload(Album.tracks))
+        _columns(Album, "AlbumId", fields)
         .order_by(Album.AlbumId)
-        .paginate(page=page, per_page=per_page, error_out=False)
+        .offset(offset)
+        .limit(limit)
     )
 
-    return query.items, query.total
+    return _load_albums(query, include_tracks), count_rows(Album, count)
 
 
-def get_albums_by_artist(artist_id: int) -> List[Album]:
+def get_artists_after(
+    after: Optional[int],
+    limit: int,
+    fields: Tuple[str, ...] = ARTIST_FIELDS,
+    include: Tuple[str, ...] = (),
+) -> Tuple[List[ArtistRow], Optional[int]]:
     """
-    Retrieve all albums for a given artist.
+    Retrieve a page of artists using keyset pagination on ArtistId.
+
+    Seeks past ``after`` through the primary key index and skips the COUNT query,
+    so every page costs the same regardless of its depth. Results depend on the
+    tables of :func:`artist_models` only.
+    """
+    return _artists_after[artist_models(include)](after, limit, fields, include)
+
+
+def _get_artists_after(
+    after: Optional[int],
+    limit: int,
+    fields: Tuple[str, ...],
+    include: Tuple[str, ...],
+) -> Tuple[List[ArtistRow], Optional[int]]:
+    """
+    Load a keyset page of artists; cached by :func:`get_artists_after`.
     """
-    current_app.logger.info(f"Fetching albums for artist {artist_id}")
+    current_app.logger.info("Fetching artists (after=%s, limit=%d)", after, limit)
+
+    catalog = catalog_index.get()
+    if catalog is not None:
+        start = catalog.artist_position(after)
+        artists = catalog.artists(start, start + limit + 1, include)
+        return keyset_page(artists, limit, "ArtistId")
+
+    query = _columns(Artist, "ArtistId", fields).order_by(Artist.ArtistId)
+    if after is not None:
+        query = query.filter(Artist.ArtistId > after)
+
+    artists, next_key = keyset_page(query.limit(limit + 1).all(), limit, "ArtistId")
+    return _load_artists(artists, include), next_key
+
 
-    artist = db.session.get(Artist, artist_id)
-    if not artist:
+def get_albums_with_tracks_after(
+    after: Optional[int],
+    limit: int,
+    fields: Tuple[str, ...] = ALBUM_FIELDS,
+    include_tracks: bool = True,
+) -> Tuple[List[AlbumRow], Optional[int]]:
+    """
+    Retrieve a page of albums with their tracks using keyset pagination on AlbumId.
+
+    Results depend on the tables of :func:`album_models` only.
+    """
+    loader = _albums_after[album_models(include_tracks)]
+    return loader(after, limit, fields, include_tracks)
+
+
+def _get_albums_with_tracks_after(
+    after: Optional[int],
+    limit: int,
+    fields: Tuple[str, ...],
+    include_tracks: bool,
+) -> Tuple[List[AlbumRow], Optional[int]]:
+    """
+    Load a keyset page of albums; cached by :func:`get_albums_with_tracks_after`.
+    """
+    current_app.logger.info(
+        "Fetching albums with tracks (after=%s, limit=%d)", after, limit
+    )
+
+    catalog = catalog_index.get()
+    if catalog is not None:
+        start = catalog.album_position(after)
+        albums = catalog.albums(start, start + limit + 1, include_tracks)
+        return keyset_page(albums, limit, "AlbumId")
+
+    query = _columns(Album, "AlbumId", fields).order_by(Album.AlbumId)
+    if after is not None:
+        query = query.filter(Album.AlbumId > after)
+
+    return keyset_page(
+        _load_albums(query.limit(limit + 1), include_tracks), limit, "AlbumId"
+    )
+
+
+# Cached loaders of the list endpoints, per set of tables read
+_ARTIST_MODELS = [
+    artist_models(include) for include in ((), ("albums",), ("albums.tracks",))
+]
+_ALBUM_MODELS = [album_models(False), album_models(True)]
+_all_artists = _memoize_per_models(_get_all_artists, _ARTIST_MODELS)
+_artists_after = _memoize_per_models(_get_artists_after, _ARTIST_MODELS)
+_all_albums = _memoize_per_models(_get_all_albums_with_tracks, _ALBUM_MODELS)
+_albums_after = _memoize_per_models(_get_albums_with_tracks_after, _ALBUM_MODELS)
+
+
+@query_cache.memoize(Artist, Album, Track)
+def get_albums_by_artist(
+    artist_id: int,
+    fields: Tuple[str, ...] = ALBUM_FIELDS,
+    include_tracks: bool = False,
+) -> List[AlbumRow]:
+    """
+    Retrieve all albums for a given artist, optionally with their tracks.
+
+    A single outer join tells a missing artist (no rows) apart from an artist
+    without albums (one row with a NULL album).
+    """
+    current_app.logger.info("Fetching albums for artist %d", artist_id)
+
+    catalog = catalog_index.get()
+    if catalog is not None:
+        albums = catalog.albums_by_artist(artist_id, include_tracks)
+        if albums is None:
+            raise NotFound(f"Artist with ID {artist_id} not found.")
+        return albums
+
+    query = (
+        _columns(Album, "AlbumId", fields)
+        .select_from(Artist)
+        .outerjoin(Album, Album.ArtistId == Artist.ArtistId)
+        .filter(Artist.ArtistId == artist_id)
+        .order_by(Album.AlbumId)
+    )
+    albums = _load_albums(query, include_tracks)
+    if not albums:
         raise NotFound(f"Artist with ID {artist_id} not found.")
 
-    return artist.albums
+    return [album for album in albums if album.AlbumId is not None]
+
+
+@query_cache.memoize(Artist, Album, Track)
+def get_albums_by_artists(
+    artist_ids: Tuple[int, ...],
+    fields: Tuple[str, ...] = ALBUM_FIELDS,
+    include_tracks: bool = False,
+) -> Dict[int, List[AlbumRow]]:
+    """
+    Retrieve the albums of several artists with one query.
+
+    Returns a mapping from artist id to albums; artists that do not exist are
+    absent from it. Tracks, when requested, are loaded like in
+    :func:`get_albums_by_artist`.
+    """
+    current_app.logger.info("Fetching albums for %d artists", len(artist_ids))
+
+    catalog = catalog_index.get()
+    if catalog is not None:
+        found = {
+            artist_id: catalog.albums_by_artist(artist_id, include_tracks)
+            for artist_id in artist_ids
+        }
+        return {key: albums for key, albums in found.items() if albums is not None}
+
+    names = ("AlbumId",) + tuple(name for name in fields if name != "AlbumId")
+    query = (
+        db.session.query(Artist.ArtistId, *(getattr(Album, name) for name in names))
+        .outerjoin(Album, Album.ArtistId == Artist.ArtistId)
+        .filter(Artist.ArtistId.in_(artist_ids))
+        .order_by(Artist.ArtistId, Album.AlbumId)
+    )
+
+    albums: Dict[int, List[AlbumRow]] = {}
+    for album, tracks in _with_tracks(query, include_tracks):
+        owned = albums.setdefault(album["ArtistId"], [])
+        if album["AlbumId"] is not None:
+            owned.append(AlbumRow(album["AlbumId"], album.get("Title"), tracks))
+    return albums
 
 
-def get_tracks_by_album(album_id: int) -> List[Track]:
+def _columns(model, key: str, fields: Tuple[str, ...]) -> Query:
+    """
+    Start a query selecting the primary key plus the requested fields.
+    """
+    names = (key,) + tuple(name for name in fields if name != key)
+    return db.session.query(*(getattr(model, name) for name in names))
+
+
+def _catalog_total(ids: Sequence[int], count: str) -> Optional[int]:
+    """
+    Return the total for a catalog index listing; the index always knows it exactly.
+    """
+    return None if count == "none" else len(ids)
+
+
+def _loading_strategy() -> str:
+    """
+    Return the configured loader strategy for nested tracks.
+    """
+    return current_app.config.get("EAGER_LOADING_STRATEGY", "selectin")
+
+
+def _load_artists(artists: Iterable[Row], include: Tuple[str, ...]) -> List[ArtistRow]:
+    """
+    Build artist rows and load the nested albums (and tracks) that were requested.
+    """
+    rows = [
+        ArtistRow(artist.ArtistId, getattr(artist, "Name", None)) for artist in artists
+    ]
+    if not rows or not include:
+        return rows
+
+    albums: Dict[int, List[AlbumRow]] = {artist.ArtistId: [] for artist in rows}
+    query = (
+        db.session.query(Album.ArtistId, Album.AlbumId, Album.Title)
+        .filter(Album.ArtistId.in_(list(albums)))
+        .order_by(Album.ArtistId, Album.AlbumId)
+    )
+    for album, tracks in _with_tracks(query, "albums.tracks" in include):
+        albums[album["ArtistId"]].append(
+            AlbumRow(album["AlbumId"], album["Title"], tracks)
+        )
+
+    return [artist._replace(albums=albums[artist.ArtistId]) for artist in rows]
+
+
+def _load_albums(query: Query, include_tracks: bool) -> List[AlbumRow]:
+    """
+    Run an album query and build album rows, with tracks when requested.
+    """
+    return [
+        AlbumRow(album["AlbumId"], album.get("Title"), tracks)
+        for album, tracks in _with_tracks(query, include_tracks)
+    ]
+
+
+def _with_tracks(
+    albums: Query, include_tracks: bool
+) -> Iterator[Tuple[Mapping[str, Any], List[TrackRow]]]:
+    """
+    Run an album query and pair every album row with its tracks.
+
+    With the ``selectin`` strategy the tracks of all albums are fetched by a second
+    query on ``AlbumId IN (...)``. With ``joined`` the album query becomes a
+    subquery outer-joined to the tracks, and the rows are grouped in Python. Without
+    ``include_tracks`` no track query runs at all.
+    """
+    if not include_tracks:
+        for album in albums:
+            yield album._mapping, []
+        return
+
+    if _loading_strategy() == "joined":
+        subquery = albums.subquery()
+        names = list(subquery.c.keys())
+        query = (
+            db.session.query(subquery, Track.TrackId, Track.Name)
+            .outerjoin(Track, Track.AlbumId == subquery.c.AlbumId)
+            .order_by(*subquery.c, Track.TrackId)
+        )
+        for key, rows in groupby(query, key=lambda row: tuple(row[: len(names)])):
+            tracks = [TrackRow(row[-2], row[-1]) for row in rows if row[-2] is not None]
+            yield dict(zip(names, key)), tracks
+        return
+
+    rows = [album._mapping for album in albums]
+    tracks: Dict[int, List[TrackRow]] = {
+        album["AlbumId"]: [] for album in rows if album["AlbumId"] is not None
+    }
+    if tracks:
+        query = (
+            db.session.query(Track.AlbumId, Track.TrackId, Track.Name)
+            .filter(Track.AlbumId.in_(list(tracks)))
+            .order_by(Track.AlbumId, Track.TrackId)
+        )
+        for album_id, track_id, name in query:
+            tracks[album_id].append(TrackRow(track_id, name))
+
+    for album in rows:
+        yield album, tracks.get(album["AlbumId"], [])
+
+
+@query_cache.memoize(Album, Track)
+def get_tracks_by_album(album_id: int) -> List[TrackRow]:
     """
     Retrieve all tracks for a given album.
+
+    Uses the same single outer join approach as :func:`get_albums_by_artist`.
     """
-    current_app.logger.info(f"Fetching tracks for album {album_id}")
+    current_app.logger.info("Fetching tracks for album %d", album_id)
 
-    album = db.session.get(Album, album_id)
-    if not album:
+    catalog = catalog_index.get()
+    if catalog is not None:
+        tracks = catalog.tracks_by_album(album_id)
+        if tracks is None:
+            raise NotFound(f"Album with ID {album_id} not found.")
+        return tracks
+
+    rows = (
+        db.session.query(Track.TrackId, Track.Name)
+        .select_from(Album)
+        .outerjoin(Track, Track.AlbumId == Album.AlbumId)
+        .filter(Album.AlbumId == album_id)
+        .order_by(Track.TrackId)
+        .all()
+    )
+    if not rows:
         raise NotFound(f"Album with ID {album_id} not found.")
 
-    return album.tracks
+    return [TrackRow(track_id, name) for track_id, name in rows if track_id is not None]
+
+
+@query_cache.memoize(Album, Track)
+def get_tracks_by_albums(album_ids: Tuple[int, ...]) -> Dict[int, List[TrackRow]]:
+    """
+    Retrieve the tracks of several albums with one query.
+
+    Returns a mapping from album id to tracks; albums that do not exist are absent
+    from it.
+    """
+    current_app.logger.info("Fetching tracks for %d albums", len(album_ids))
+
+    catalog = catalog_index.get()
+    if catalog is not None:
+        found = {album_id: catalog.tracks_by_album(album_id) for album_id in album_ids}
+        return {key: tracks for key, tracks in found.items() if tracks is not None}
 
+    query = (
+        db.session.query(Album.AlbumId, Track.TrackId, Track.Name)
+        .outerjoin(Track, Track.AlbumId == Album.AlbumId)
+        .filter(Album.AlbumId.in_(album_ids))
+        .order_by(Album.AlbumId, Track.TrackId)
+    )
+
+    tracks: Dict[int, List[TrackRow]] = {}
+    for album_id, track_id, name in query:
+        owned = tracks.setdefault(album_id, [])
+        if track_id is not None:
+            owned.append(TrackRow(track_id, name))
+    return tracks
 
+
+@query_cache.memoize(Album, Artist, Track, AlbumSummary)
 def get_album_summaries() -> list:
     """
     Retrieve a list of albums with artist name and total number of tracks.
     """
     current_app.logger.info("Fetching album summaries with aggregated track count.")
 
+    return _album_summaries_query().all()
+
+
+def iter_album_summaries(batch_size: int) -> Iterator[Row]:
+    """
+    Stream album summaries, fetching ``batch_size`` rows at a time.
+    """
+    current_app.logger.info("Streaming album summaries (batch_size=%d)", batch_size)
+
+    return iter(_album_summaries_query().yield_per(batch_size))
+
+
+def iter_albums_with_tracks(batch_size: int) -> Iterator[AlbumRow]:
+    """
+    Stream every album with its tracks, fetching ``batch_size`` rows at a time.
+
+    Runs a single ordered album/track join and groups consecutive rows in Python,
+    so only one album is held in memory at a time.
+    """
+    current_app.logger.info("Streaming albums with tracks (batch_size=%d)", batch_size)
+
+    query = (
+        db.session.query(Album.AlbumId, Album.Title, Track.TrackId, Track.Name)
+        .outerjoin(Track, Track.AlbumId == Album.AlbumId)
+        .order_by(Album.AlbumId, Track.TrackId)
+        .yield_per(batch_size)
+    )
+
+    for (album_id, title), rows in groupby(query, key=itemgetter(0, 1)):
+        tracks = [TrackRow(row[2], row[3]) for row in rows if row[2] is not None]
+        yield AlbumRow(album_id, title, tracks)
+
+
+def _album_summaries_query():
+    """
+    Build the album summary query.
+
+    Reads the materialized ``album_summaries`` table when it exists and falls back to
+    aggregating the tracks table otherwise.
+    """
+    if album_summaries_available():
+        return (
+            db.session.query(
+                AlbumSummary.AlbumId,
+                AlbumSummary.AlbumTitle,
+                AlbumSummary.ArtistName,
+                AlbumSummary.TrackCount,
+            )
+            .filter(AlbumSummary.TrackCount > 0)
+            .order_by(AlbumSummary.AlbumId)
+        )
+
     return (
         db.session.query(
             Album.AlbumId,
@@ -89,5 +563,4 @@ def get_album_summaries() -> list:
         .join(Track, Track.AlbumId == Album.AlbumId)
         .group_by(Album.AlbumId, Album.Title, Artist.Name)
         .order_by(Album.AlbumId)
-        .all()
     )
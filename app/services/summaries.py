@@ -0,0 +1,63 @@
+# app/services/summaries.py
+"""
+Service layer for the materialized album summary table.
+"""
+
+from typing import Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import inspect
+
+from app import db
+from app.common.versioning import table_versions
+from app.models import summaries, versions
+from app.models.models import AlbumSummary
+
+# (data version token, table exists) from the last availability check
+_availability: Optional[Tuple[Tuple[int, ...], bool]] = None
+
+
+def album_summaries_available() -> bool:
+    """
+    Tell whether the materialized summary table exists in the database.
+
+    The answer is cached until the table is created or dropped in this process, or
+    another process writes to the database.
+    """
+    global _availability
+
+    token = table_versions.current(summaries.TABLE_NAME)
+    if _availability is not None and _availability[0] == token:
+        return _availability[1]
+
+    available = inspect(db.session.connection()).has_table(summaries.TABLE_NAME)
+    if not available:
+        current_app.logger.warning(
+            "Table %s is missing; run 'flask summaries rebuild' with "
+            "SQLITE_READ_ONLY=0 to create it.",
+            summaries.TABLE_NAME,
+        )
+
+    _availability = (token, available)
+    return available
+
+
+def rebuild_album_summaries() -> int:
+    """
+    Create the summary table and its triggers if needed and repopulate every row.
+
+    Returns:
+        int: Number of summary rows written.
+    """
+    current_app.logger.info("Rebuilding materialized album summaries.")
+
+    connection = db.session.connection()
+    AlbumSummary.__table__.create(connection, checkfirst=True)
+    versions.install(connection, [summaries.TABLE_NAME])
+    summaries.install(connection, rebuild=True)
+    db.session.commit()
+
+    # Raw SQL is not seen by the version listeners, so publish the change here
+    table_versions.bump([summaries.TABLE_NAME])
+
+    return db.session.query(AlbumSummary).count()
@@ -0,0 +1,34 @@
+# app/services/versions.py
+"""
+Service layer for the ``data_versions`` table behind the HTTP validators.
+"""
+
+from flask import current_app
+from sqlalchemy import inspect
+
+from app import db
+from app.common.versioning import table_versions
+from app.models import versions
+
+
+def install_data_versions() -> int:
+    """
+    Create the version table and its triggers for every model table in the database.
+
+    Returns:
+        int: Number of tracked tables.
+    """
+    current_app.logger.info("Installing data version triggers.")
+
+    connection = db.session.connection()
+    existing = set(inspect(connection).get_table_names())
+    tables = [
+        table.name for table in db.metadata.sorted_tables if table.name in existing
+    ]
+    versions.install(connection, tables)
+    db.session.commit()
+
+    # Raw SQL is not seen by the version listeners, so publish the change here
+    table_versions.bump([versions.TABLE_NAME])
+
+    return len(tables)
@@ -0,0 +1 @@
+# This file marks benchmarks/ as a package so scripts run with `python -m`.
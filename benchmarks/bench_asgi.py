@@ -0,0 +1,219 @@
+# benchmarks/bench_asgi.py
+"""
+Benchmark the ASGI variant against the WSGI app under many concurrent clients.
+
+Starts gunicorn serving the WSGI app (``app.gunicorn_conf``) and uvicorn serving
+``app.asgi:create_asgi_app`` with the same number of processes, then drives each
+with keep-alive HTTP clients on asyncio. ``--think`` adds a pause between requests
+so each client holds its connection open like a slow client would. The catalog
+index and query cache are disabled so every request reaches the database.
+
+Requires the optional dependencies in ``requirements-async.txt``.
+
+Usage:
+    python -m benchmarks.bench_asgi [--clients 50 500] [--duration 5] [--think 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Environment shared by both servers
+SERVER_ENV = {
+    "FLASK_CONFIG": "app.common.config.ProductionConfig",
+    "CATALOG_INDEX_ENABLED": "0",
+    "QUERY_CACHE_ENABLED": "0",
+}
+
+
+def start_servers(workers: int, threads: int) -> Dict[str, tuple]:
+    """
+    Launch both servers on free ports and return ``name -> (process, port)``.
+    """
+    env = dict(os.environ, **SERVER_ENV)
+    wsgi_port, asgi_port = _free_port(), _free_port()
+    commands = {
+        "wsgi": [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "--config=python:app.gunicorn_conf",
+            f"--bind=127.0.0.1:{wsgi_port}",
+            f"--workers={workers}",
+            f"--threads={threads}",
+        ],
+        "asgi": [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "app.asgi:create_asgi_app",
+            f"--port={asgi_port}",
+            f"--workers={workers}",
+            "--log-level=warning",
+            "--no-access-log",
+        ],
+    }
+    ports = {"wsgi": wsgi_port, "asgi": asgi_port}
+    servers = {
+        name: (
+            subprocess.Popen(
+                command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ),
+            ports[name],
+        )
+        for name, command in commands.items()
+    }
+    for process, port in servers.values():
+        _wait_for_port(process, port)
+    return servers
+
+
+async def client(
+    port: int, path: str, deadline: float, think: float, latencies: List[float]
+) -> int:
+    """
+    Send requests until ``deadline``, reusing the connection unless the server
+    closes it (the Werkzeug server closes every connection after one response).
+
+    Returns the number of failed requests.
+    """
+    errors = 0
+    request = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    writer = None
+
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            head = (await reader.readuntil(b"\r\n\r\n")).lower()
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            await reader.readexactly(length)
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            errors += 1
+            writer = _close(writer)
+            continue
+
+        if not head.startswith(b"http/1.1 200"):
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+        if b"connection: close" in head:
+            writer = _close(writer)
+        if think:
+            await asyncio.sleep(think)
+
+    _close(writer)
+    return errors
+
+
+def _close(writer) -> None:
+    """
+    Close a client connection, if one is open.
+    """
+    if writer is not None:
+        writer.close()
+
+
+async def load(port: int, path: str, clients: int, duration: float, think: float):
+    """
+    Run ``clients`` concurrent clients for ``duration`` seconds.
+    """
+    latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+    errors = await asyncio.gather(
+        *(client(port, path, deadline, think, latencies) for _ in range(clients))
+    )
+    return latencies, sum(errors)
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Benchmark every path at every concurrency level on both servers.
+    """
+    servers = start_servers(args.workers, args.threads)
+    try:
+        print(
+            f"{'server':<8}{'path':<24}{'clients':>8}{'req/s':>10}"
+            f"{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}"
+        )
+        for path in args.paths:
+            for clients in args.clients:
+                for name, (_, port) in servers.items():
+                    latencies, errors = asyncio.run(
+                        load(port, path, clients, args.duration, args.think)
+                    )
+                    latencies.sort()
+                    p50 = statistics.median(latencies) if latencies else 0.0
+                    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+                    print(
+                        f"{name:<8}{path:<24}{clients:>8}"
+                        f"{len(latencies) / args.duration:>10.0f}"
+                        f"{p50 * 1e3:>10.2f}{p99 * 1e3:>10.2f}{errors:>8}"
+                    )
+    finally:
+        for process, _ in servers.values():
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def _free_port() -> int:
+    """
+    Ask the OS for an unused TCP port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(process: subprocess.Popen, port: int, timeout: float = 30) -> None:
+    """
+    Block until a server accepts connections.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"Server on port {port} exited during startup")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit(f"Server on port {port} did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--paths",
+        nargs="+",
+        default=["/artists", "/albums?per_page=10"],
+        help="Paths to request",
+    )
+    parser.add_argument(
+        "--clients", type=int, nargs="+", default=[50, 500], help="Concurrency levels"
+    )
+    parser.add_argument("--duration", type=float, default=5, help="Seconds per run")
+    parser.add_argument(
+        "--think", type=float, default=0.05, help="Pause between requests (seconds)"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Processes per server")
+    parser.add_argument("--threads", type=int, default=8, help="WSGI worker threads")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+# benchmarks/bench_scale.py
+"""
+Benchmark endpoints and service functions on synthetic catalogs of growing size.
+
+For every scale factor a SQLite file holding ``scale`` times the Chinook catalog
+(275 artists, 347 albums, 3503 tracks) is generated once and reused by later runs.
+Each case is timed ``--repeat`` times after a warm-up call, then run once more under
+``tracemalloc`` for its peak memory. The query cache and the catalog index are
+disabled so every call reaches the database, and info logging is silenced.
+
+Results can be saved as JSON and compared with a previous run; the command exits
+with status 1 when a case got slower (median) or hungrier (peak memory) than the
+baseline by more than ``--threshold``.
+
+Usage:
+    python -m benchmarks.bench_scale [--scales 1 10 100] [--repeat 20]
+        [--save .benchmarks/HEAD.json] [--compare .benchmarks/main.json]
+        [--threshold 0.2]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+# The app reads BenchmarkConfig from this module, also when it runs as __main__
+os.environ["FLASK_CONFIG"] = "benchmarks.bench_scale.BenchmarkConfig"
+sys.modules.setdefault("benchmarks.bench_scale", sys.modules[__name__])
+
+from sqlalchemy import text  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.common.config import Config  # noqa: E402
+from app.models.models import Album, Artist, Track  # noqa: E402
+from app.services import services  # noqa: E402
+from app.services.summaries import rebuild_album_summaries  # noqa: E402
+
+# Rows of the original Chinook catalog, multiplied by the scale factor
+BASE_ARTISTS = 275
+BASE_ALBUMS = 347
+BASE_TRACKS = 3503
+
+# Bump when the generated data changes so stale files are not reused
+DATASET_VERSION = 1
+
+# Foreign key indexes of the shipped database, which the models do not declare
+CATALOG_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS IFK_AlbumArtistId ON albums (ArtistId)",
+    "CREATE INDEX IF NOT EXISTS IFK_TrackAlbumId ON tracks (AlbumId)",
+    "CREATE INDEX IF NOT EXISTS IFK_TrackGenreId ON tracks (GenreId)",
+    "CREATE INDEX IF NOT EXISTS IFK_TrackMediaTypeId ON tracks (MediaTypeId)",
+)
+
+# Rows inserted per statement batch while generating a dataset
+INSERT_BATCH = 10_000
+
+# Differences below this many milliseconds are never reported as regressions
+NOISE_FLOOR_MS = 0.05
+
+
+class BenchmarkConfig(Config):
+    """
+    Configuration of the benchmarked app; the database URI is set per scale.
+    """
+
+    QUERY_CACHE_ENABLED = False
+    CATALOG_INDEX_ENABLED = False
+    METRICS_DIR = ""
+
+
+def dataset_path(data_dir: str, scale: int) -> str:
+    """
+    Return the SQLite file of a scale factor, generating it when missing.
+    """
+    path = os.path.join(data_dir, f"chinook_x{scale}_v{DATASET_VERSION}.db")
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        started = time.perf_counter()
+        generate_dataset(path + ".tmp", scale)
+        os.replace(path + ".tmp", path)
+        print(f"generated {path} in {time.perf_counter() - started:.1f} s")
+    return path
+
+
+def generate_dataset(path: str, scale: int) -> None:
+    """
+    Write ``scale`` times the Chinook catalog to a new SQLite file.
+
+    The schema is the models' plus the foreign key indexes of the shipped
+    database. Albums are spread evenly over artists and tracks over albums, so the
+    rows per parent match the original catalog whatever the scale. Values are
+    random but seeded, so every run of a given version produces the same file.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+    app = _create_app(path)
+    rng = random.Random(scale)
+    artists, albums, tracks = (
+        BASE_ARTISTS * scale,
+        BASE_ALBUMS * scale,
+        BASE_TRACKS * scale,
+    )
+
+    with app.app_context():
+        db.create_all()
+        for statement in CATALOG_INDEXES:
+            db.session.execute(text(statement))
+        _insert(Artist, ({"Name": f"Artist {i}"} for i in range(1, artists + 1)))
+        _insert(
+            Album,
+            (
+                {"Title": f"Album {i}", "ArtistId": (i - 1) % artists + 1}
+                for i in range(1, albums + 1)
+            ),
+        )
+        _insert(
+            Track,
+            (
+                {
+                    "Name": f"Track {i}",
+                    "AlbumId": (i - 1) % albums + 1,
+                    "MediaTypeId": 1,
+                    "GenreId": rng.randint(1, 25),
+                    "Composer": f"Composer {rng.randint(1, artists)}",
+                    "Milliseconds": rng.randint(60_000, 600_000),
+                    "Bytes": rng.randint(1_000_000, 20_000_000),
+                    "UnitPrice": 0.99,
+                }
+                for i in range(1, tracks + 1)
+            ),
+        )
+        rebuild_album_summaries()
+        db.session.remove()
+        db.engine.dispose()
+
+    # Closing the last connection also checkpoints the WAL into the file
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+
+
+def build_cases(app, scale: int) -> List[Tuple[str, Callable[[], object]]]:
+    """
+    Return ``(name, callable)`` pairs for the endpoints and service functions.
+
+    Deep pages ask for the middle of the catalog, where OFFSET costs the most.
+    """
+    client = app.test_client()
+    albums = BASE_ALBUMS * scale
+    deep_page = albums // 50 // 2 + 1
+
+    def get(url: str) -> Callable[[], object]:
+        def call():
+            response = client.get(url)
+            if response.status_code != 200:
+                raise SystemExit(f"GET {url} answered {response.status_code}")
+            return response.get_data()
+
+        return call
+
+    return [
+        ("GET /artists", get("/artists?per_page=50")),
+        ("GET /albums", get("/albums?per_page=50")),
+        ("GET /albums (deep page)", get(f"/albums?per_page=50&page={deep_page}")),
+        ("GET /albums/1/tracks", get("/albums/1/tracks")),
+        ("GET /artists/1/albums", get("/artists/1/albums")),
+        ("GET /albums/summary", get("/albums/summary")),
+        (
+            "get_all_albums_with_tracks",
+            lambda: services.get_all_albums_with_tracks(1, 50),
+        ),
+        (
+            "get_all_albums_with_tracks (deep page)",
+            lambda: services.get_all_albums_with_tracks(deep_page, 50),
+        ),
+        ("get_album_summaries", services.get_album_summaries),
+    ]
+
+
+def measure(call: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Time a case and record its peak traced memory.
+
+    Returns:
+        Dict[str, float]: ``median_ms``, ``p95_ms``, ``min_ms`` and ``peak_kib``.
+    """
+    call()
+    timings = sorted(
+        seconds * 1e3 for seconds in timeit.repeat(call, number=1, repeat=repeat)
+    )
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = call()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 4),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 4),
+        "min_ms": round(timings[0], 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run(scales: List[int], repeat: int, data_dir: str) -> Dict[str, dict]:
+    """
+    Benchmark every case at every scale and print one line per result.
+
+    Returns:
+        Dict[str, dict]: Measurements keyed by ``"<scale>x <case>"``.
+    """
+    results: Dict[str, dict] = {}
+    print(f"{'case':<46}{'median':>11}{'p95':>11}{'peak':>12}")
+    for scale in scales:
+        app = _create_app(dataset_path(data_dir, scale))
+        with app.app_context():
+            for name, call in build_cases(app, scale):
+                key = f"{scale}x {name}"
+                result = results[key] = measure(call, repeat)
+                print(
+                    f"{key:<46}{result['median_ms']:>8.2f} ms"
+                    f"{result['p95_ms']:>8.2f} ms{result['peak_kib']:>8.0f} KiB"
+                )
+                db.session.remove()
+            db.engine.dispose()
+    return results
+
+
+def compare(baseline: Dict[str, dict], current: Dict[str, dict], threshold: float):
+    """
+    List the cases whose median time or peak memory grew beyond the threshold.
+
+    Cases missing from either run are ignored, as are time differences under
+    ``NOISE_FLOOR_MS``.
+
+    Returns:
+        List[str]: One description per regression.
+    """
+    regressions = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[key], current[key]
+        for metric, floor in (("median_ms", NOISE_FLOOR_MS), ("peak_kib", 1.0)):
+            if old[metric] <= 0 or new[metric] - old[metric] < floor:
+                continue
+            change = new[metric] / old[metric] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{key}: {metric} {old[metric]} -> {new[metric]} (+{change:.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1, 10, 100], help="Scale factors"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timing repetitions")
+    parser.add_argument(
+        "--data-dir", default=".benchmarks/data", help="Where datasets are cached"
+    )
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a baseline run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression (0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.scales, args.repeat, args.data_dir)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as handle:
+            json.dump({"meta": _metadata(), "results": results}, handle, indent=2)
+        print(f"saved {args.save}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        regressions = compare(baseline["results"], results, args.threshold)
+        commit = baseline["meta"].get("commit") or "baseline"
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {commit}:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+        print(f"no regression beyond {args.threshold:.0%} against {commit}")
+
+
+def _create_app(path: str):
+    """
+    Create the app on a dataset file, with info logging silenced.
+    """
+    BenchmarkConfig.SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.abspath(path)}"
+    app = create_app()
+    app.logger.setLevel(logging.WARNING)
+    return app
+
+
+def _insert(model, rows) -> None:
+    """
+    Insert generated rows in batches and commit.
+    """
+    table = model.__table__
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == INSERT_BATCH:
+            db.session.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def _metadata() -> Dict[str, str]:
+    """
+    Describe the environment the results were measured in.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "machine": platform.machine(),
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_serializers.py
+"""
+Benchmark compiled serializers against Marshmallow ``Schema.dump``.
+
+Builds synthetic albums with nested tracks, checks that both serializers produce
+byte-identical JSON and reports the time per page for each.
+
+Usage:
+    python -m benchmarks.bench_serializers [--albums 100] [--tracks 15] [--repeat 50]
+"""
+
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("FLASK_CONFIG", "app.common.config.TestingConfig")
+
+from app import create_app  # noqa: E402
+from app.models.models import Album, Artist, Track  # noqa: E402
+from app.schemas.albums_schema import AlbumSchema  # noqa: E402
+from app.schemas.artists_schema import ArtistSchema  # noqa: E402
+from app.schemas.serializers import compile_serializer  # noqa: E402
+from app.services.rows import AlbumRow, TrackRow  # noqa: E402
+
+
+def build_orm_albums(albums: int, tracks: int) -> list:
+    """
+    Create transient Album entities, each with ``tracks`` Track entities.
+    """
+    return [
+        Album(
+            AlbumId=a,
+            Title=f"Album {a}",
+            ArtistId=a,
+            tracks=[
+                Track(TrackId=a * tracks + t, Name=f"Track {a}-{t}", AlbumId=a)
+                for t in range(tracks)
+            ],
+        )
+        for a in range(albums)
+    ]
+
+
+def build_row_albums(albums: int, tracks: int) -> list:
+    """
+    Create the same albums as lightweight named tuples.
+    """
+    return [
+        AlbumRow(
+            a,
+            f"Album {a}",
+            [TrackRow(a * tracks + t, f"Track {a}-{t}") for t in range(tracks)],
+        )
+        for a in range(albums)
+    ]
+
+
+def run(albums: int, tracks: int, repeat: int) -> None:
+    """
+    Time both serializers on every dataset and print the results.
+    """
+    app = create_app()
+    dumps = app.json.dumps
+
+    album_schema = AlbumSchema(many=True)
+    artist_schema = ArtistSchema(many=True)
+    cases = [
+        ("albums+tracks (ORM)", album_schema, build_orm_albums(albums, tracks)),
+        ("albums+tracks (rows)", album_schema, build_row_albums(albums, tracks)),
+        (
+            "artists (ORM)",
+            artist_schema,
+            [Artist(ArtistId=i, Name=f"Artist {i}") for i in range(albums)],
+        ),
+    ]
+
+    print(f"{'case':<24}{'marshmallow':>14}{'compiled':>14}{'speedup':>10}")
+    for name, schema, data in cases:
+        compiled = compile_serializer(schema)
+        if dumps(compiled(data)) != dumps(schema.dump(data)):
+            raise SystemExit(f"{name}: compiled output differs from Schema.dump")
+
+        slow = min(timeit.repeat(lambda: schema.dump(data), number=1, repeat=repeat))
+        fast = min(timeit.repeat(lambda: compiled(data), number=1, repeat=repeat))
+        print(
+            f"{name:<24}{slow * 1e3:>11.3f} ms{fast * 1e3:>11.3f} ms"
+            f"{slow / fast:>9.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--albums", type=int, default=100, help="Albums per page")
+    parser.add_argument("--tracks", type=int, default=15, help="Tracks per album")
+    parser.add_argument("--repeat", type=int, default=50, help="Timing repetitions")
+    args = parser.parse_args()
+    run(args.albums, args.tracks, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
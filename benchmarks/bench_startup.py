@@ -0,0 +1,102 @@
+# benchmarks/bench_startup.py
+"""
+Benchmark the cold start of the application.
+
+Each run starts a fresh interpreter that imports ``app``, calls ``create_app()``
+and serves one request, and reports the median time of each step over all runs.
+``--imports`` also lists the modules with the largest cumulative import time, as
+measured by ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 10] [--path /artists] [--imports 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Code run by each child interpreter; prints its timings as JSON
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+flask_app = app.create_app()
+created = time.perf_counter()
+response = flask_app.test_client().get(sys.argv[1])
+served = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "create_app_ms": (created - imported) * 1e3,
+    "first_request_ms": (served - created) * 1e3,
+    "total_ms": (served - started) * 1e3,
+}))
+"""
+
+# Settings of the measured app: the production profile on the shipped database
+CHILD_ENV = {"FLASK_CONFIG": "app.common.config.ProductionConfig"}
+
+
+def run_child(path: str) -> Dict[str, float]:
+    """
+    Start the app in a new interpreter and return its timings.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, path],
+        env=dict(os.environ, **CHILD_ENV),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(count: int) -> List[str]:
+    """
+    Return the ``count`` modules with the largest cumulative import time.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app; app.create_app()"],
+        env=dict(os.environ, **CHILD_ENV),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.append((int(cumulative), name.strip()))
+    modules.sort(reverse=True)
+    return [f"{micros / 1e3:>9.1f} ms  {name}" for micros, name in modules[:count]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters")
+    parser.add_argument("--path", default="/artists", help="First request path")
+    parser.add_argument(
+        "--imports", type=int, default=0, help="List the N slowest imports"
+    )
+    args = parser.parse_args()
+
+    runs = [run_child(args.path) for _ in range(args.runs)]
+    print(f"{'step':<18}{'median':>12}{'min':>12}")
+    for step in runs[0]:
+        values = [run[step] for run in runs]
+        print(f"{step:<18}{statistics.median(values):>9.1f} ms{min(values):>9.1f} ms")
+
+    if args.imports:
+        print("\nslowest imports (cumulative):")
+        print("\n".join(slowest_imports(args.imports)))
+
+
+if __name__ == "__main__":
+    main()
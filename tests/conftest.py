@@ -1,6 +1,10 @@
 # tests/confest.py
+from contextlib import contextmanager
+
 import pytest
 from app import create_app, db
+from app.common.cache import query_cache
+from app.common.instrumentation import capture_queries
 from app.models.models import Artist, Album, Track
 
 
@@ -62,3 +66,43 @@ def sample_data(app):
             "album_id": album.AlbumId,
             "track_ids": [track.TrackId for track in tracks],
         }
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fails the test when a block runs more SQL statements than it is allowed.
+
+    The query cache is bypassed inside the block so cached results cannot hide
+    queries. Usage::
+
+        with query_budget(2):
+            client.get("/albums")
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        enabled, query_cache.enabled = query_cache.enabled, False
+        try:
+            with capture_queries() as stats:
+                yield stats
+        finally:
+            query_cache.enabled = enabled
+
+        # The throttled PRAGMA data_version probe and the reload of the shared
+        # data versions after a write are bookkeeping, not route SQL
+        counted = {
+            statement: count
+            for statement, count in stats.statements.items()
+            if not statement.startswith("PRAGMA") and "data_versions" not in statement
+        }
+        if sum(counted.values()) > max_queries:
+            statements = "\n".join(
+                f"{count} x {statement}" for statement, count in counted.items()
+            )
+            pytest.fail(
+                f"Ran {sum(counted.values())} queries, budget is {max_queries}:\n"
+                f"{statements}"
+            )
+
+    return budget
@@ -1,4 +1,9 @@
 # test/test_albums.py
+import json
+
+from app.common.pagination import encode_cursor
+
+
 def test_get_albums_with_tracks(client, sample_data):
     response = client.get("/albums?page=1&per_page=5")
     data = response.get_json()
@@ -31,3 +36,102 @@ def test_get_album_summary(client, sample_data):
     assert response.status_code == 200
     assert isinstance(data, list)
     assert any(summary["ArtistName"] == "Test Artist" for summary in data)
+
+
+def test_get_albums_keyset_pagination(client, sample_data):
+    response = client.get("/albums?limit=5")
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert data["next_cursor"] is None
+    assert len(data["albums"][0]["tracks"]) == 2
+
+    cursor = encode_cursor(sample_data["album_id"])
+    response = client.get(f"/albums?after={cursor}")
+    assert response.status_code == 200
+    assert response.get_json()["albums"] == []
+
+
+def test_get_album_summary_tracks_changes_incrementally(client, sample_data):
+    from app import db
+    from app.models.models import Track
+
+    summary = client.get("/albums/summary").get_json()
+    assert summary[0]["TrackCount"] == 2
+
+    db.session.delete(
+        db.session.query(Track).filter_by(AlbumId=sample_data["album_id"]).first()
+    )
+    db.session.commit()
+
+    summary = client.get("/albums/summary").get_json()
+    assert summary[0]["TrackCount"] == 1
+
+
+def test_get_album_summary_streams_ndjson(client, sample_data):
+    response = client.get("/albums/summary", headers={"Accept": "application/x-ndjson"})
+    lines = response.get_data(as_text=True).splitlines()
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert len(lines) == 1
+    assert json.loads(lines[0])["ArtistName"] == "Test Artist"
+
+    streamed = client.get("/albums/summary?stream=1").get_json()
+    assert streamed == client.get("/albums/summary").get_json()
+
+
+def test_export_albums_streams_albums_with_tracks(client, sample_data):
+    response = client.get("/albums/export")
+    albums = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert response.status_code == 200
+    assert albums[0]["AlbumId"] == sample_data["album_id"]
+    assert [t["Name"] for t in albums[0]["tracks"]] == ["Track 1", "Track 2"]
+    assert client.get("/albums/export?stream=1").get_json() == albums
+
+
+def test_get_albums_returns_projected_rows(client, sample_data):
+    from app.services.rows import AlbumRow
+    from app.services.services import get_all_albums_with_tracks
+
+    albums, total = get_all_albums_with_tracks(1, 5)
+
+    assert total == 1
+    assert isinstance(albums[0], AlbumRow)
+    assert [track.Name for track in albums[0].tracks] == ["Track 1", "Track 2"]
+
+
+def test_get_albums_sparse_fields_without_tracks(client, sample_data):
+    data = client.get("/albums?fields=Title&include=").get_json()
+    assert data["albums"] == [{"Title": "Test Album"}]
+
+    data = client.get("/albums?fields=AlbumId&include=tracks").get_json()
+    assert set(data["albums"][0]) == {"AlbumId", "tracks"}
+
+    assert client.get("/albums?fields=Bogus").status_code == 400
+
+
+def test_get_albums_joined_strategy_matches_selectin(app, client, sample_data):
+    expected = client.get("/albums?per_page=5").get_json()
+
+    app.config["EAGER_LOADING_STRATEGY"] = "joined"
+    try:
+        assert client.get("/albums?per_page=5&limit=5").get_json()["albums"] == (
+            expected["albums"]
+        )
+    finally:
+        app.config["EAGER_LOADING_STRATEGY"] = "selectin"
+
+
+def test_get_tracks_of_many_albums(client, sample_data):
+    album_id = sample_data["album_id"]
+
+    response = client.get(f"/albums/tracks?ids=999,{album_id},{album_id}")
+    results = response.get_json()["results"]
+
+    assert response.status_code == 200
+    assert [result["status"] for result in results] == [404, 200]
+    assert [track["Name"] for track in results[1]["tracks"]] == ["Track 1", "Track 2"]
+    assert client.get("/albums/tracks?ids=1,x").status_code == 400
+    assert client.get("/albums/tracks").status_code == 400
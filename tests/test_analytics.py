@@ -0,0 +1,80 @@
+# test/test_analytics.py
+from datetime import datetime
+
+import pytest
+
+from app import db
+from app.models.models import Genre, Invoice, InvoiceItem, Track
+
+
+@pytest.fixture
+def invoice(client, sample_data):
+    """
+    Sells both sample tracks, in a new genre, on one invoice.
+    """
+    db.session.add(Genre(GenreId=1, Name="Rock"))
+    db.session.query(Track).update({Track.GenreId: 1})
+    invoice = Invoice(
+        CustomerId=1,
+        InvoiceDate=datetime(2024, 3, 1),
+        BillingCountry="Spain",
+        Total=3.97,
+    )
+    db.session.add(invoice)
+    db.session.flush()
+    track_1, track_2 = db.session.scalars(db.select(Track.TrackId).order_by("TrackId"))
+    db.session.add_all(
+        [
+            InvoiceItem(
+                InvoiceId=invoice.InvoiceId, TrackId=track_1, UnitPrice=0.99, Quantity=2
+            ),
+            InvoiceItem(
+                InvoiceId=invoice.InvoiceId, TrackId=track_2, UnitPrice=1.99, Quantity=1
+            ),
+        ]
+    )
+    db.session.commit()
+    return invoice.InvoiceId
+
+
+def test_revenue_reports_follow_new_invoices(client, invoice):
+    expected = {"Revenue": 3.97, "Quantity": 3}
+
+    assert client.get("/analytics/revenue/genres").get_json() == [
+        {"Key": 1, "Name": "Rock", **expected}
+    ]
+    assert client.get("/analytics/revenue/artists").get_json() == [
+        {"Key": 1, "Name": "Test Artist", **expected}
+    ]
+    assert client.get("/analytics/revenue/countries").get_json() == [
+        {"Key": "Spain", "Name": "Spain", **expected}
+    ]
+    assert client.get("/analytics/revenue/months").get_json() == [
+        {"Key": "2024-03", "Name": "2024-03", **expected}
+    ]
+
+
+def test_revenue_reports_follow_changes(client, invoice):
+    db.session.get(Invoice, invoice).BillingCountry = "Portugal"
+    db.session.execute(db.delete(InvoiceItem).where(InvoiceItem.Quantity == 1))
+    db.session.commit()
+
+    assert client.get("/analytics/revenue/countries").get_json() == [
+        {"Key": "Portugal", "Name": "Portugal", "Revenue": 1.98, "Quantity": 2}
+    ]
+
+
+def test_top_tracks(client, invoice):
+    by_revenue = client.get("/analytics/tracks/top?limit=1").get_json()
+    by_quantity = client.get("/analytics/tracks/top?limit=1&by=quantity").get_json()
+
+    assert by_revenue == [{"Key": 2, "Name": "Track 2", "Revenue": 1.99, "Quantity": 1}]
+    assert by_quantity == [
+        {"Key": 1, "Name": "Track 1", "Revenue": 1.98, "Quantity": 2}
+    ]
+
+
+def test_analytics_rejects_bad_arguments(client, invoice):
+    assert client.get("/analytics/revenue/planets").status_code == 404
+    assert client.get("/analytics/revenue/genres?limit=0").status_code == 400
+    assert client.get("/analytics/tracks/top?by=name").status_code == 400
@@ -0,0 +1,39 @@
+# test/test_apidocs.py
+import json
+import subprocess
+import sys
+
+
+def test_create_app_does_not_import_flasgger():
+    code = "import sys, app; app.create_app(); print('flasgger' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_apidocs_and_spec_are_served(client):
+    spec = client.get("/apispec_1.json").get_json()
+
+    assert "/albums/{album_id}/tracks" in spec["paths"]
+    assert "Album" in spec["definitions"]
+    assert client.get("/apidocs/").status_code == 200
+    assert client.get("/flasgger_static/swagger-ui.css").status_code == 200
+
+
+def test_generated_spec_file_is_served(app, client, tmp_path, monkeypatch):
+    path = tmp_path / "apispec.json"
+
+    result = app.test_cli_runner().invoke(
+        args=["apidocs", "generate", "--output", str(path)]
+    )
+    assert result.exit_code == 0
+    spec = json.loads(path.read_text())
+    assert spec == client.get("/apispec_1.json").get_json()
+
+    spec["info"]["title"] = "From file"
+    path.write_text(json.dumps(spec))
+    monkeypatch.setitem(app.config, "SWAGGER_SPEC_FILE", str(path))
+
+    assert client.get("/apispec_1.json").get_json()["info"]["title"] == "From file"
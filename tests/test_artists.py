@@ -21,3 +21,103 @@ def test_get_artist_albums_not_found(client):
     response = client.get("/artists/99999/albums")
     assert response.status_code == 404
     assert "error" in response.get_json()
+
+
+def test_get_artists_keyset_pagination(client, sample_data):
+    response = client.get("/artists?limit=1")
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert "total" not in data
+    assert data["limit"] == 1
+    assert data["artists"][0]["ArtistId"] == sample_data["artist_id"]
+    assert data["next_cursor"] is None
+
+
+def test_get_artists_invalid_cursor(client):
+    response = client.get("/artists?after=not-a-cursor")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_get_artists_count_modes(client, sample_data):
+    assert client.get("/artists?count=none").get_json()["total"] is None
+    assert client.get("/artists?count=estimate").get_json()["total"] >= 1
+    assert client.get("/artists?count=bogus").status_code == 400
+
+
+def test_get_artists_cached_total_is_invalidated_on_commit(client, sample_data):
+    from app import db
+    from app.models.models import Artist
+
+    assert client.get("/artists").get_json()["total"] == 1
+
+    db.session.add(Artist(Name="Another Artist"))
+    db.session.commit()
+
+    assert client.get("/artists").get_json()["total"] == 2
+
+
+def test_get_artist_albums_for_artist_without_albums(client, sample_data):
+    from app import db
+    from app.models.models import Artist
+
+    artist = Artist(Name="Solo Artist")
+    db.session.add(artist)
+    db.session.commit()
+
+    response = client.get(f"/artists/{artist.ArtistId}/albums")
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+def test_get_artists_include_albums_and_tracks(client, sample_data):
+    data = client.get("/artists?fields=Name&include=albums.tracks").get_json()
+
+    assert data["artists"] == [
+        {
+            "Name": "Test Artist",
+            "albums": [
+                {
+                    "AlbumId": sample_data["album_id"],
+                    "Title": "Test Album",
+                    "tracks": [
+                        {"TrackId": 1, "Name": "Track 1"},
+                        {"TrackId": 2, "Name": "Track 2"},
+                    ],
+                }
+            ],
+        }
+    ]
+
+    artist_id = sample_data["artist_id"]
+    albums = client.get(f"/artists/{artist_id}/albums?include=tracks").get_json()
+    assert len(albums[0]["tracks"]) == 2
+
+
+def test_get_albums_of_many_artists(client, sample_data):
+    artist_id = sample_data["artist_id"]
+
+    response = client.get(f"/artists/albums?ids={artist_id},999&include=tracks")
+    results = response.get_json()["results"]
+
+    assert response.status_code == 200
+    assert results[0]["albums"][0]["Title"] == "Test Album"
+    assert len(results[0]["albums"][0]["tracks"]) == 2
+    assert results[1] == {
+        "artist_id": 999,
+        "status": 404,
+        "error": "Not Found",
+        "message": "Artist with ID 999 not found.",
+    }
+    ids = ",".join(str(i) for i in range(101))
+    assert client.get(f"/artists/albums?ids={ids}").status_code == 400
+
+
+def test_get_artists_reports_effective_page_args(client, sample_data):
+    data = client.get("/artists?per_page=150").get_json()
+    assert data["per_page"] == 100
+    assert len(data["artists"]) <= 100
+
+    data = client.get("/artists?page=0&per_page=-3").get_json()
+    assert (data["page"], data["per_page"]) == (1, 20)
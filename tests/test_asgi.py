@@ -0,0 +1,72 @@
+# test/test_asgi.py
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, insert
+
+from app import db
+from app.models.models import Album, Artist, Track
+
+pytest.importorskip("aiosqlite")
+
+from app.asgi import create_asgi_app  # noqa: E402
+
+
+@pytest.fixture
+def asgi_app(app, client, sample_data, tmp_path, monkeypatch):
+    """
+    Builds the ASGI app on a file database holding the same rows as the WSGI one.
+    """
+    path = tmp_path / "chinook.db"
+    engine = create_engine(f"sqlite:///{path}")
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for model in (Artist, Album, Track):
+            rows = [
+                {c.key: getattr(row, c.key) for c in model.__table__.columns}
+                for row in db.session.query(model)
+            ]
+            connection.execute(insert(model), rows)
+    engine.dispose()
+
+    monkeypatch.setitem(
+        app.config, "ASYNC_SQLALCHEMY_DATABASE_URI", f"sqlite+aiosqlite:///{path}"
+    )
+    asgi = create_asgi_app(app)
+    yield asgi
+    asyncio.run(asgi.engine.dispose())
+
+
+def call(asgi, path, query=b""):
+    """
+    Send one GET request through the ASGI interface and return (status, body).
+    """
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": query}
+    asyncio.run(asgi(scope, receive, send))
+    return messages[0]["status"], messages[1]["body"]
+
+
+@pytest.mark.parametrize(
+    "path, query",
+    [
+        ("/artists", b""),
+        ("/artists", b"limit=1"),
+        ("/albums", b"per_page=5"),
+        ("/artists/1/albums", b""),
+        ("/artists/999/albums", b""),
+        ("/albums/1/tracks", b""),
+        ("/albums/summary", b""),
+    ],
+)
+def test_asgi_responses_match_wsgi(asgi_app, client, path, query):
+    response = client.get(f"{path}?{query.decode()}")
+
+    assert call(asgi_app, path, query) == (response.status_code, response.data)
@@ -0,0 +1,75 @@
+# test/test_cache.py
+import os
+
+from app import db
+from app.common.cache import QueryCache, query_cache
+from app.models.models import Artist
+
+
+def test_repeated_reads_are_served_from_cache(client, sample_data):
+    album_id = sample_data["album_id"]
+    client.get(f"/albums/{album_id}/tracks")
+    before = query_cache.stats()
+
+    response = client.get(f"/albums/{album_id}/tracks")
+
+    assert response.status_code == 200
+    assert query_cache.stats()["hits"] == before["hits"] + 1
+    assert query_cache.stats()["misses"] == before["misses"]
+
+
+def test_commit_invalidates_only_dependent_entries(client, sample_data):
+    album_id = sample_data["album_id"]
+    client.get("/artists")
+    client.get(f"/albums/{album_id}/tracks")
+
+    db.session.add(Artist(Name="Another Artist"))
+    db.session.commit()
+    before = query_cache.stats()
+
+    assert len(client.get("/artists").get_json()["artists"]) == 2
+    client.get(f"/albums/{album_id}/tracks")
+
+    after = query_cache.stats()
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    cache = QueryCache(maxsize=2, ttl=60)
+    calls = []
+
+    @cache.memoize(Artist)
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    monkeypatch.setattr("app.common.cache.table_versions.current", lambda *tables: (0,))
+    monkeypatch.setattr("app.common.cache.table_versions.token", lambda *tables: (0,))
+
+    for value in (1, 2, 1, 3, 1, 2):
+        double(value)
+
+    assert calls == [1, 2, 3, 2]
+    assert cache.stats()["evictions"] == 2
+
+    cache.ttl = 0
+    cache.clear()
+    double(1)
+    double(1)
+    assert cache.stats()["expirations"] == 1
+
+
+def test_forked_worker_starts_with_an_empty_cache():
+    cache = QueryCache()
+    cache._set("key", "value", frozenset({"artists"}))
+    cache._get("key")
+
+    pid = os.fork()
+    if pid == 0:
+        stats = cache.stats()
+        os._exit(0 if stats["size"] == 0 and stats["hits"] == 0 else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,64 @@
+# test/test_catalog.py
+import pytest
+
+from app import db
+from app.common.cache import query_cache
+from app.models.models import Album, Track
+from app.services.catalog import catalog_index
+
+
+@pytest.fixture
+def catalog(app, monkeypatch):
+    """
+    Serves reads from the in-memory catalog index for the duration of a test.
+    """
+    monkeypatch.setitem(app.config, "CATALOG_INDEX_ENABLED", True)
+    query_cache.clear()
+    yield catalog_index
+    catalog_index.clear()
+    query_cache.clear()
+
+
+def test_catalog_matches_database_reads(app, client, sample_data, monkeypatch):
+    urls = [
+        "/artists?include=albums.tracks",
+        "/albums",
+        "/albums?limit=1",
+        f"/artists/{sample_data['artist_id']}/albums?include=tracks",
+        f"/albums/{sample_data['album_id']}/tracks",
+        "/albums/999/tracks",
+    ]
+    expected = [(client.get(url).status_code, client.get(url).data) for url in urls]
+
+    monkeypatch.setitem(app.config, "CATALOG_INDEX_ENABLED", True)
+    query_cache.clear()
+    try:
+        actual = [(client.get(url).status_code, client.get(url).data) for url in urls]
+    finally:
+        catalog_index.clear()
+        query_cache.clear()
+
+    assert actual == expected
+
+
+def test_catalog_reloads_after_commit(client, sample_data, catalog):
+    album_id = sample_data["album_id"]
+    before = catalog.get()
+    assert len(client.get(f"/albums/{album_id}/tracks").get_json()["tracks"]) == 2
+
+    db.session.add(
+        Track(
+            Name="Track 3",
+            AlbumId=album_id,
+            MediaTypeId=1,
+            Milliseconds=1000,
+            UnitPrice=0.99,
+        )
+    )
+    db.session.add(Album(Title="Second Album", ArtistId=sample_data["artist_id"]))
+    db.session.commit()
+
+    tracks = client.get(f"/albums/{album_id}/tracks").get_json()["tracks"]
+    assert catalog.get() is not before
+    assert [track["Name"] for track in tracks] == ["Track 1", "Track 2", "Track 3"]
+    assert client.get("/albums").get_json()["total"] == 2
@@ -0,0 +1,55 @@
+# test/test_commands.py
+def test_rebuild_summaries_command(app, client, sample_data):
+    from app import db
+
+    db.session.execute(db.text("DELETE FROM album_summaries"))
+    db.session.commit()
+    assert client.get("/albums/summary").get_json() == []
+
+    result = app.test_cli_runner().invoke(args=["summaries", "rebuild"])
+
+    assert result.exit_code == 0
+    assert "Rebuilt 1 album summaries." in result.output
+    assert client.get("/albums/summary").get_json()[0]["TrackCount"] == 2
+
+
+def test_rebuild_search_command(app, client, sample_data):
+    from app import db
+
+    db.session.execute(db.text("DROP TABLE search_index"))
+    db.session.commit()
+    assert client.get("/search?q=test").status_code == 503
+
+    result = app.test_cli_runner().invoke(args=["search", "rebuild"])
+
+    assert result.exit_code == 0
+    assert "Indexed 4 rows." in result.output
+    assert client.get("/search?q=test").get_json()["total"] == 2
+
+
+def test_rebuild_analytics_command(app, client, sample_data):
+    from app import db
+
+    db.session.execute(db.text("DROP TABLE sales_rollups"))
+    db.session.commit()
+    assert client.get("/analytics/revenue/genres").status_code == 503
+
+    result = app.test_cli_runner().invoke(args=["analytics", "rebuild"])
+
+    assert result.exit_code == 0
+    assert "Rebuilt 0 sales rollups." in result.output
+    assert client.get("/analytics/revenue/genres").get_json() == []
+
+
+def test_install_versions_command(app, client, sample_data):
+    from app import db
+
+    db.session.execute(db.text("DROP TABLE data_versions"))
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["versions", "install"])
+
+    assert result.exit_code == 0
+    assert "Tracking versions of" in result.output
+    rows = db.session.execute(db.text("SELECT Name FROM data_versions")).scalars()
+    assert "artists" in set(rows)
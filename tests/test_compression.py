@@ -0,0 +1,77 @@
+# test/test_compression.py
+import gzip
+import os
+
+import pytest
+
+from app.common.compression import compression
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+@pytest.fixture
+def compressor(monkeypatch):
+    """
+    Compress every body, with an empty cache of compressed responses.
+    """
+    monkeypatch.setattr(compression, "min_size", 1)
+    compression.clear()
+    yield compression
+    compression.clear()
+
+
+def test_large_bodies_are_compressed(client, sample_data, compressor):
+    plain = client.get("/albums")
+    response = client.get("/albums", headers=GZIP)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.headers["ETag"] != plain.headers["ETag"]
+    assert gzip.decompress(response.get_data()) == plain.get_data()
+
+
+def test_small_bodies_and_identity_are_not_compressed(
+    client, sample_data, compressor, monkeypatch
+):
+    assert "Content-Encoding" not in client.get("/albums").headers
+
+    monkeypatch.setattr(compressor, "min_size", 1 << 20)
+    assert "Content-Encoding" not in client.get("/albums", headers=GZIP).headers
+
+
+def test_repeated_requests_are_served_from_the_cache(
+    client, sample_data, compressor, monkeypatch
+):
+    first = client.get("/albums", headers=GZIP)
+
+    def boom(*args, **kwargs):
+        raise Exception("Boom!")
+
+    monkeypatch.setattr("app.routes.albums.get_all_albums_with_tracks", boom)
+    second = client.get("/albums", headers=GZIP)
+
+    assert second.status_code == 200
+    assert second.get_data() == first.get_data()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Content-Type"] == first.headers["Content-Type"]
+    assert compressor.stats()["hits"] == 1
+
+
+def test_cache_is_bounded_in_bytes(client, sample_data, compressor, monkeypatch):
+    monkeypatch.setattr(compressor, "max_bytes", 1)
+    client.get("/albums", headers=GZIP)
+
+    assert compressor.stats()["entries"] == 0
+
+
+def test_forked_worker_starts_with_an_empty_compressed_cache(client, compressor):
+    client.get("/artists", headers=GZIP)
+    assert compressor.stats()["entries"] == 1
+
+    pid = os.fork()
+    if pid == 0:
+        stats = compressor.stats()
+        os._exit(0 if stats["entries"] == 0 and stats["bytes"] == 0 else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0
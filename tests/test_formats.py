@@ -0,0 +1,63 @@
+# test/test_formats.py
+import csv
+import io
+import json
+from collections import namedtuple
+from decimal import Decimal
+
+import pytest
+
+from app.common import formats
+
+
+def test_json_provider_writes_decimals_as_numbers(app):
+    Row = namedtuple("Row", "TrackId UnitPrice")
+    encoded = app.json.dumps({"price": Decimal("0.99"), "row": Row(1, Decimal("1.5"))})
+
+    assert json.loads(encoded) == {"price": 0.99, "row": [1, 1.5]}
+
+
+def test_json_provider_falls_back_to_stdlib(app, client, sample_data, monkeypatch):
+    fast = client.get("/albums").get_json()
+    monkeypatch.setattr(formats, "orjson", None)
+
+    assert client.get("/albums").get_json() == fast
+    assert json.loads(app.json.dumps(Decimal("0.99"))) == 0.99
+
+
+def test_csv_response_writes_rows_and_metadata_headers(client, sample_data):
+    response = client.get("/albums?per_page=100", headers={"Accept": "text/csv"})
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert int(response.headers["X-Total"]) >= 1
+    assert response.headers["X-Per-Page"] == "100"
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    album = next(row for row in rows if row["Title"] == "Test Album")
+    assert [track["TrackId"] for track in json.loads(album["tracks"])] == [1, 2]
+
+
+def test_csv_and_json_have_different_etags(client, sample_data):
+    as_json = client.get("/artists")
+    as_csv = client.get("/artists", headers={"Accept": "text/csv"})
+
+    assert as_csv.headers["ETag"] != as_json.headers["ETag"]
+    assert "Accept" in as_csv.headers["Vary"]
+
+
+def test_unavailable_format_falls_back_to_json(client, sample_data, monkeypatch):
+    monkeypatch.setattr(formats, "msgpack", None)
+    response = client.get("/playlists", headers={"Accept": "application/msgpack"})
+
+    assert response.mimetype == "application/json"
+    assert "playlists" in response.get_json()
+
+
+def test_msgpack_response(client, sample_data):
+    msgpack = pytest.importorskip("msgpack")
+    response = client.get("/artists", headers={"Accept": "application/msgpack"})
+
+    assert response.mimetype == "application/msgpack"
+    assert "Accept" in response.headers["Vary"]
+    assert msgpack.unpackb(response.get_data())["total"] >= 1
@@ -0,0 +1,80 @@
+# test/test_http_cache.py
+from app import db
+from app.common.versioning import table_versions
+from app.models.models import Artist, Track
+
+
+def test_read_routes_emit_validators(client, sample_data):
+    response = client.get("/artists")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+    assert response.headers["Cache-Control"] == "no-cache"
+
+
+def test_if_none_match_returns_304_without_running_the_view(
+    client, sample_data, monkeypatch
+):
+    etag = client.get("/artists").headers["ETag"]
+
+    def boom(*args, **kwargs):
+        raise Exception("Boom!")
+
+    monkeypatch.setattr("app.routes.artists.get_all_artists", boom)
+    response = client.get("/artists", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.get_data() == b""
+
+
+def test_etag_changes_after_commit(client, sample_data):
+    etag = client.get("/artists").headers["ETag"]
+
+    db.session.add(Artist(Name="Another Artist"))
+    db.session.commit()
+
+    response = client.get("/artists", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_etag_depends_only_on_included_tables(client, sample_data):
+    plain = client.get("/artists").headers["ETag"]
+    nested = client.get("/artists?include=albums.tracks").headers["ETag"]
+
+    track = Track.query.filter_by(AlbumId=sample_data["album_id"]).first()
+    track.Name = "Renamed Track"
+    db.session.commit()
+
+    assert client.get("/artists").headers["ETag"] == plain
+    assert client.get("/artists?include=albums.tracks").headers["ETag"] != nested
+
+
+def test_etag_is_the_same_in_every_process(client, sample_data, monkeypatch):
+    etag = client.get("/artists").headers["ETag"]
+
+    # Another worker has its own counters but reads the same data_versions rows
+    monkeypatch.setattr(table_versions, "_counters", {"artists": 42})
+    monkeypatch.setattr(table_versions, "_generation", 7)
+    monkeypatch.setattr(table_versions, "_shared", None)
+
+    assert client.get("/artists").headers["ETag"] == etag
+
+
+def test_etag_changes_after_a_write_from_another_process(client, sample_data):
+    etag = client.get("/artists").headers["ETag"]
+
+    # Raw SQL stands in for another process: only the triggers see the write
+    db.session.execute(db.text("UPDATE artists SET Name = 'Renamed'"))
+    db.session.commit()
+    table_versions.bump((), external=True)
+
+    assert client.get("/artists").headers["ETag"] != etag
+
+
+def test_not_found_responses_have_no_etag(client):
+    response = client.get("/artists/99999/albums")
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
@@ -0,0 +1,55 @@
+# test/test_instrumentation.py
+import logging
+import re
+
+import pytest
+
+from app import db
+from app.models.models import Track
+
+
+def test_server_timing_header(client, sample_data):
+    response = client.get("/albums/1/tracks")
+
+    timing = response.headers["Server-Timing"]
+    assert "db;dur=" in timing
+    assert re.search(r'desc="queries=\d+"', timing)
+    assert "serialize;dur=" in timing
+    assert "app;dur=" in timing
+
+
+@pytest.mark.parametrize(
+    "url, budget",
+    [
+        ("/artists/1/albums?include=tracks", 2),
+        ("/artists?include=albums.tracks", 4),
+        ("/albums", 3),
+        ("/albums/1/tracks", 1),
+        ("/albums/tracks?ids=1,2", 1),
+    ],
+)
+def test_routes_stay_within_query_budget(
+    client, sample_data, query_budget, url, budget
+):
+    with query_budget(budget):
+        assert client.get(url).status_code == 200
+
+
+def test_query_budget_fails_when_exceeded(client, sample_data, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="budget is 0"):
+        with query_budget(0):
+            client.get("/albums/1/tracks")
+
+
+def test_repeated_statements_are_logged(app, client, sample_data, caplog):
+    threshold = app.config["SQL_REPEAT_WARNING_THRESHOLD"]
+
+    with caplog.at_level(logging.WARNING, logger=app.logger.name):
+        with app.test_request_context("/n-plus-one"):
+            app.preprocess_request()
+            for _ in range(threshold):
+                db.session.get(Track, 1)
+                db.session.expunge_all()
+            app.do_teardown_request()
+
+    assert "Possible N+1 query on /n-plus-one" in caplog.text
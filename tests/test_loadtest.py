@@ -0,0 +1,48 @@
+# test/test_loadtest.py
+import asyncio
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+from app.loadtest import parse_mix, percentile, run_load
+
+
+@pytest.fixture
+def server(app, client, sample_data):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+@pytest.mark.parametrize("load", [{"clients": 2}, {"rps": 50}])
+def test_run_load_reports_routes(server, load):
+    mix = parse_mix(["artists=3", "albums"])
+
+    report = asyncio.run(
+        run_load("127.0.0.1", server.port, mix, duration=0.5, warmup=0.1, **load)
+    )
+
+    assert report["overall"]["requests"] > 0
+    assert report["overall"]["errors"] == 0
+    assert set(report["routes"]) <= {"artists", "albums"}
+    for summary in report["routes"].values():
+        assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
+        assert summary["p99_ms"] <= summary["max_ms"]
+
+
+def test_parse_mix_rejects_unknown_routes():
+    assert parse_mix(["summary=2", "tracks"]) == (["summary", "tracks"], [2.0, 1.0])
+    with pytest.raises(ValueError, match="Unknown route 'genres'"):
+        parse_mix(["genres=1"])
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) == 0.0
@@ -0,0 +1,79 @@
+# test/test_logging.py
+import io
+import json
+import logging
+import threading
+
+from flask import Flask
+
+from app.common.logging_config import (
+    JSONFormatter,
+    QueueLogging,
+    RequestContextFilter,
+    configure_logging,
+)
+
+
+def _record(level=logging.INFO, msg="Fetching %d rows", args=(3,)):
+    return logging.LogRecord("app", level, __file__, 1, msg, args, None)
+
+
+def test_request_id_is_echoed_or_generated(client, sample_data):
+    response = client.get("/artists", headers={"X-Request-ID": "req-42"})
+    assert response.headers["X-Request-ID"] == "req-42"
+
+    response = client.get("/artists", headers={"X-Request-ID": "bad id!"})
+    generated = response.headers["X-Request-ID"]
+    assert len(generated) == 32 and generated != "bad id!"
+
+
+def test_json_records_carry_request_context(app):
+    log_filter, formatter = RequestContextFilter(), JSONFormatter()
+
+    with app.test_request_context("/artists", headers={"X-Request-ID": "req-7"}):
+        app.preprocess_request()
+        record = _record()
+        assert log_filter.filter(record)
+
+    entry = json.loads(formatter.format(record))
+    assert entry["message"] == "Fetching 3 rows"
+    assert entry["request_id"] == "req-7"
+    assert entry["route"] == "/artists"
+    assert entry["level"] == "INFO"
+
+
+def test_unsampled_requests_keep_only_warnings(app, monkeypatch):
+    monkeypatch.setitem(app.config, "LOG_SAMPLE_RATES", {"/artists": 0.0})
+    log_filter = RequestContextFilter()
+
+    with app.test_request_context("/artists"):
+        app.preprocess_request()
+        assert not log_filter.filter(_record(logging.INFO))
+        assert log_filter.filter(_record(logging.WARNING))
+
+    with app.test_request_context("/albums"):
+        app.preprocess_request()
+        assert log_filter.filter(_record(logging.INFO))
+
+
+def test_queue_logging_writes_in_background():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    queued = QueueLogging()
+    queued.set_handler(target)
+
+    queued.queue_handler.handle(_record())
+    queued.stop()
+
+    assert stream.getvalue() == "INFO Fetching 3 rows\n"
+
+
+def test_reconfiguring_reuses_the_listener_thread():
+    configure_logging(Flask(__name__))
+    threads = threading.active_count()
+
+    for _ in range(5):
+        configure_logging(Flask(__name__))
+
+    assert threading.active_count() == threads
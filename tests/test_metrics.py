@@ -0,0 +1,129 @@
+# test/test_metrics.py
+import os
+import re
+
+import pytest
+
+from app.common.metrics import Metrics, MmapValues, _observe, read_file
+
+
+def _sample(text, name, **labels):
+    """
+    Return the value of the first sample of ``name`` carrying ``labels``.
+    """
+    for line in text.splitlines():
+        series, _, value = line.rpartition(" ")
+        if not series.startswith(name + "{") and series != name:
+            continue
+        if all(f'{key}="{val}"' in series for key, val in labels.items()):
+            return float(value)
+    return None
+
+
+def test_metrics_endpoint_reports_requests(client, sample_data):
+    before = _sample(
+        client.get("/metrics").get_data(as_text=True),
+        "chinook_http_requests_total",
+        route="/albums/<int:album_id>/tracks",
+        status="200",
+    )
+    client.get("/albums/1/tracks")
+    client.get("/albums/1/tracks")
+
+    response = client.get("/metrics")
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE chinook_http_request_duration_seconds histogram" in text
+    labels = {"blueprint": "albums", "route": "/albums/<int:album_id>/tracks"}
+    total = _sample(text, "chinook_http_requests_total", status="200", **labels)
+    assert total == (before or 0) + 2
+    count = _sample(text, "chinook_http_request_duration_seconds_count", **labels)
+    assert (
+        _sample(
+            text, "chinook_http_request_duration_seconds_bucket", le="+Inf", **labels
+        )
+        == count
+    )
+    assert _sample(text, "chinook_http_response_size_bytes_sum", **labels) > 0
+    assert _sample(text, "chinook_db_queries_total", **labels) >= 2
+    # Only the /metrics request itself is in flight
+    assert _sample(text, "chinook_http_requests_in_flight") == 1
+    assert re.search(r'chinook_query_cache_requests_total\{result="hits"\}', text)
+    assert 'chinook_query_cache_requests_total{result="evictions"}' not in text
+    assert re.search(r"^chinook_query_cache_evictions_total \d", text, re.M)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """
+    A metrics recorder writing to its own directory.
+    """
+    recorder = Metrics()
+    recorder.enabled = True
+    recorder.directory = str(tmp_path)
+    return recorder
+
+
+def test_histogram_buckets_are_cumulative(recorder):
+    for seconds in (0.0005, 0.07, 0.1, 30):
+        recorder._write(
+            lambda values: _observe(
+                values, "http_request_duration_seconds", 'route="/x"', seconds
+            )
+        )
+
+    text = recorder.render()
+    name = "chinook_http_request_duration_seconds"
+    assert _sample(text, name + "_bucket", le="0.001") == 1
+    assert _sample(text, name + "_bucket", le="0.05") == 1
+    assert _sample(text, name + "_bucket", le="0.1") == 3
+    assert _sample(text, name + "_bucket", le="5") == 3
+    assert _sample(text, name + "_bucket", le="+Inf") == 4
+    assert _sample(text, name + "_count") == 4
+    assert _sample(text, name + "_sum") == pytest.approx(30.1705)
+
+
+def test_files_of_all_processes_are_aggregated(recorder, tmp_path):
+    # A worker that has exited: its counters still count, its gauges do not
+    dead = MmapValues(str(tmp_path / "metrics_999999999.db"))
+    dead.add('counter:db_queries_total{route="/x"}', 5)
+    dead.add("gauge:http_requests_in_flight", 3)
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            recorder._write(
+                lambda values: values.add('counter:db_queries_total{route="/x"}', 7)
+            )
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    recorder._write(
+        lambda values: values.add('counter:db_queries_total{route="/x"}', 1)
+    )
+    recorder._write(lambda values: values.add("gauge:http_requests_in_flight", 1))
+
+    text = recorder.render()
+    assert _sample(text, "chinook_db_queries_total", route="/x") == 13
+    assert _sample(text, "chinook_http_requests_in_flight") == 1
+    assert (tmp_path / f"metrics_{pid}.db").exists()
+
+
+def test_mmap_values_grow_and_reopen(tmp_path):
+    path = str(tmp_path / "metrics_1.db")
+    values = MmapValues(path)
+    for index in range(5000):
+        values.add(f"counter:series_{index}", index)
+    values.set("counter:series_0", 42.5)
+
+    reopened = MmapValues(path)
+    reopened.add("counter:series_1", 1)
+
+    entries = dict(read_file(path))
+    assert len(entries) == 5000
+    assert entries["counter:series_0"] == 42.5
+    assert entries["counter:series_1"] == 2
+    assert entries["counter:series_4999"] == 4999
@@ -0,0 +1,58 @@
+# test/test_playlists.py
+import json
+
+import pytest
+
+from app import db
+from app.models.models import Playlist, PlaylistTrack, Track
+
+
+@pytest.fixture
+def playlist(client, sample_data):
+    """
+    Creates a playlist holding both sample tracks.
+    """
+    playlist = Playlist(Name="Test Playlist")
+    db.session.add(playlist)
+    db.session.flush()
+    db.session.add_all(
+        PlaylistTrack(PlaylistId=playlist.PlaylistId, TrackId=track_id)
+        for track_id in db.session.scalars(db.select(Track.TrackId))
+    )
+    db.session.commit()
+    return playlist.PlaylistId
+
+
+def test_get_playlists(client, playlist):
+    data = client.get("/playlists").get_json()
+
+    assert data["total"] == 1
+    assert data["playlists"] == [{"PlaylistId": playlist, "Name": "Test Playlist"}]
+
+
+def test_playlist_tracks_keyset_pages(client, playlist):
+    first = client.get(f"/playlists/{playlist}/tracks?limit=1").get_json()
+    second = client.get(
+        f"/playlists/{playlist}/tracks?limit=1&after={first['next_cursor']}"
+    ).get_json()
+
+    assert first["tracks"] == [
+        {"TrackId": 1, "Name": "Track 1", "AlbumId": 1, "Milliseconds": 1000}
+    ]
+    assert second["tracks"][0]["TrackId"] == 2
+    assert second["next_cursor"] is None
+
+
+def test_playlist_tracks_stream(client, playlist):
+    ndjson = client.get(f"/playlists/{playlist}/tracks?stream=ndjson")
+    lines = ndjson.get_data(as_text=True).splitlines()
+    array = client.get(f"/playlists/{playlist}/tracks?stream=1")
+
+    assert ndjson.mimetype == "application/x-ndjson"
+    assert [json.loads(line)["TrackId"] for line in lines] == [1, 2]
+    assert [track["TrackId"] for track in array.get_json()] == [1, 2]
+
+
+def test_playlist_tracks_not_found(client, sample_data):
+    assert client.get("/playlists/999/tracks").status_code == 404
+    assert client.get("/playlists/999/tracks?stream=ndjson").status_code == 404
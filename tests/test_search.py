@@ -0,0 +1,74 @@
+# test/test_search.py
+from app import db
+from app.models.models import Album, Artist, Track
+
+
+def test_search_prefix_matches_every_kind(client, sample_data):
+    response = client.get("/search?q=tes")
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert data["total"] == 2
+    assert data["results"] == [
+        {"type": "artist", "id": 1, "name": "Test Artist", "composer": None},
+        {"type": "album", "id": 1, "name": "Test Album", "composer": None},
+    ]
+
+
+def test_search_ranks_names_above_composers(client, sample_data):
+    db.session.add_all(
+        [
+            Track(
+                Name="Elegy",
+                Composer="Jimmy Page",
+                AlbumId=sample_data["album_id"],
+                MediaTypeId=1,
+                Milliseconds=1000,
+                UnitPrice=0.99,
+            ),
+            Track(
+                Name="Page Turner",
+                AlbumId=sample_data["album_id"],
+                MediaTypeId=1,
+                Milliseconds=1000,
+                UnitPrice=0.99,
+            ),
+        ]
+    )
+    db.session.commit()
+
+    data = client.get("/search?q=page&type=track").get_json()
+
+    assert [hit["name"] for hit in data["results"]] == ["Page Turner", "Elegy"]
+
+
+def test_search_index_follows_writes(client, sample_data):
+    artist = db.session.get(Artist, sample_data["artist_id"])
+    artist.Name = "Renamed"
+    db.session.add(Album(Title="Fresh Album", ArtistId=artist.ArtistId))
+    db.session.commit()
+
+    assert client.get("/search?q=test artist").get_json()["total"] == 0
+    assert client.get("/search?q=renamed").get_json()["results"][0]["id"] == 1
+    assert client.get("/search?q=fresh").get_json()["total"] == 1
+
+    db.session.execute(db.delete(Track))
+    db.session.execute(db.delete(Album).where(Album.Title == "Test Album"))
+    db.session.commit()
+
+    assert client.get("/search?q=test").get_json()["total"] == 0
+
+
+def test_search_paginates(client, sample_data):
+    data = client.get("/search?q=track&per_page=1&page=2").get_json()
+
+    assert data["total"] == 2
+    assert data["results"] == [
+        {"type": "track", "id": 2, "name": "Track 2", "composer": None}
+    ]
+
+
+def test_search_rejects_bad_queries(client, sample_data):
+    assert client.get("/search").status_code == 400
+    assert client.get("/search?q=%22*").status_code == 400
+    assert client.get("/search?q=test&type=genre").status_code == 400
@@ -0,0 +1,40 @@
+# test/test_serializers.py
+from app import db
+from app.models.models import Album
+from app.schemas.albums_schema import AlbumSchema
+from app.schemas.albums_summary_schema import AlbumSummarySchema
+from app.schemas.serializers import compile_serializer
+from app.services.rows import AlbumRow, TrackRow
+
+
+def test_compiled_serializer_matches_schema_for_orm_objects(client, sample_data):
+    schema = AlbumSchema(many=True)
+    albums = db.session.query(Album).all()
+
+    assert compile_serializer(schema)(albums) == schema.dump(albums)
+
+
+def test_compiled_serializer_matches_schema_for_rows(client, sample_data):
+    schema = AlbumSummarySchema()
+    row = db.session.query(
+        Album.AlbumId,
+        Album.Title.label("AlbumTitle"),
+        db.literal("Name").label("ArtistName"),
+        db.literal("3").label("TrackCount"),
+    ).first()
+
+    assert compile_serializer(schema)(row) == schema.dump(row)
+    assert compile_serializer(schema)(row)["TrackCount"] == 3
+
+
+def test_compiled_serializer_honours_only_and_nested_rows():
+    schema = AlbumSchema(many=True, only=("AlbumId", "tracks"))
+    albums = [AlbumRow(1, "Title", [TrackRow(1, "A"), TrackRow(2, None)])]
+
+    assert compile_serializer(schema)(albums) == [
+        {
+            "AlbumId": 1,
+            "tracks": [{"TrackId": 1, "Name": "A"}, {"TrackId": 2, "Name": None}],
+        }
+    ]
+    assert compile_serializer(schema)(albums) == schema.dump(albums)
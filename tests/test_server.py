@@ -0,0 +1,22 @@
+# test/test_server.py
+from types import SimpleNamespace
+
+from app import db
+from app import gunicorn_conf
+
+
+def test_gunicorn_preloads_the_app_on_threaded_workers():
+    assert gunicorn_conf.preload_app is True
+    assert gunicorn_conf.wsgi_app == "app:create_app()"
+    assert gunicorn_conf.worker_class == "gthread"
+
+
+def test_post_fork_replaces_the_inherited_connection_pool(app):
+    with app.app_context():
+        inherited = db.engine.pool
+
+    worker = SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app))
+    gunicorn_conf.post_fork(None, worker)
+
+    with app.app_context():
+        assert db.engine.pool is not inherited
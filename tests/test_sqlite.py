@@ -0,0 +1,39 @@
+# test/test_sqlite.py
+import sqlite3
+
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from app.common.sqlite import configure_sqlite, install_pragmas
+
+
+def test_pragmas_are_applied_on_connect(client):
+    from app import db
+
+    assert db.session.execute(text("PRAGMA cache_size")).scalar() == -65536
+    assert db.session.execute(text("PRAGMA temp_store")).scalar() == 2
+    assert db.session.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_read_only_mode_opens_file_immutable(tmp_path):
+    path = tmp_path / "catalog.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE artists (ArtistId INTEGER PRIMARY KEY)")
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}", SQLITE_READ_ONLY=True
+    )
+
+    configure_sqlite(app)
+    engine = create_engine(
+        app.config["SQLALCHEMY_DATABASE_URI"], **app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    )
+    install_pragmas(engine, {"journal_mode": "WAL", "cache_size": -1024}, True)
+
+    assert "mode=ro" in app.config["SQLALCHEMY_DATABASE_URI"]
+    assert "immutable=1" in app.config["SQLALCHEMY_DATABASE_URI"]
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == -1024
+        assert connection.execute(text("SELECT COUNT(*) FROM artists")).scalar() == 0
+    engine.dispose()